@@ -0,0 +1,70 @@
+"""
+CLI startup cost, and a budget for it
+
+Imports the CLI module in fresh interpreters and reports the best wall time of the
+import, and fails (exit code 1) if it exceeds the budget or if any module that should
+only load inside a command (settings, models, langchain, langgraph) was imported.
+
+    python benchmarks/bench_cli_startup.py [--runs 5] [--budget-ms 100]
+"""
+
+import argparse
+import subprocess
+import sys
+
+#imported by commands on demand, never just to build the CLI
+_DEFERRED = (
+    "agenticresume.settings",
+    "agenticresume.domain.models",
+    "agenticresume.graph.screen",
+    "langchain_core",
+    "langgraph",
+    "pydantic_settings",
+)
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import agenticresume.cli
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(" ".join(m for m in {deferred!r} if m in sys.modules))
+"""
+
+
+def _probe() -> tuple[float, list[str]]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(deferred=_DEFERRED)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.splitlines()
+    return float(out[0]), out[1].split() if len(out) > 1 else []
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    probes = [_probe() for _ in range(args.runs)]
+    best = min(t for t, _ in probes) * 1e3
+    leaked = sorted({m for _, mods in probes for m in mods})
+
+    print(
+        f"import agenticresume.cli: best {best:.1f} ms of {args.runs}"
+        f" (budget {args.budget_ms:.0f} ms)"
+    )
+    failed = False
+    if leaked:
+        print(f"FAIL: imported at startup: {', '.join(leaked)}")
+        failed = True
+    if best > args.budget_ms:
+        print("FAIL: over budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Per-call client overhead, fresh build vs the shared registry
+
+Builds the structured-output runnable for every screening schema the way each call
+used to (new client, new pool, schema conversion) and compares it with the registry
+lookup. Offline: clients are constructed with a dummy key and never sent a request.
+
+    python benchmarks/bench_client_registry.py [--provider openai] [--calls 200]
+"""
+
+import argparse
+import time
+
+from pydantic import SecretStr
+
+from agenticresume.graph.screen import SCREENING_SCHEMAS
+from agenticresume.infra.llm import build_chat_model, build_extractor, clear_clients, warm_clients
+from agenticresume.settings import Settings
+
+_MODELS = {
+    "google": "gemini-2.5-flash",
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-latest",
+    "groq": "llama-3.1-8b-instant",
+}
+
+
+def _settings(provider: str) -> Settings:
+    dummy = SecretStr("bench-not-a-real-key")
+    return Settings(  # pyright: ignore[reportCallIssue]
+        llm_provider=provider,
+        llm_model=_MODELS[provider],
+        google_api_key=dummy,
+        openai_api_key=dummy,
+        anthropic_api_key=dummy,
+        groq_api_key=dummy,
+        neo4j_password=dummy,
+    )
+
+
+def _per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(SCREENING_SCHEMAS[i % len(SCREENING_SCHEMAS)])
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--provider", default="openai", choices=sorted(_MODELS))
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    settings = _settings(args.provider)
+
+    fresh = _per_call_us(
+        lambda s: build_chat_model(settings).with_structured_output(s, include_raw=True), args.calls
+    )
+
+    clear_clients()
+    start = time.perf_counter()
+    warm_clients(settings, SCREENING_SCHEMAS)
+    warm_ms = (time.perf_counter() - start) * 1e3
+    shared = _per_call_us(lambda s: build_extractor(settings, s), args.calls)
+
+    print(f"provider={args.provider} model={settings.llm_model} calls={args.calls}")
+    print(f"  fresh build per call : {fresh:10.1f} us")
+    print(f"  registry lookup      : {shared:10.1f} us")
+    print(f"  one-off warm-up      : {warm_ms:10.1f} ms for {len(SCREENING_SCHEMAS)} schemas")
+    print(f"  per screening saved  : {(fresh - shared) * 7 / 1e3:10.2f} ms (7 calls)")
+
+
+if __name__ == "__main__":
+    main()
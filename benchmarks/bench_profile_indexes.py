@@ -0,0 +1,105 @@
+"""
+CareerProfile indexes, recomputed on every access vs cached per instance
+
+Builds large synthetic profiles and times the properties a screening reads
+repeatedly (active facts, the skill set, fingerprints) and the auditor's
+context rendering, against the previous recompute-every-time implementations.
+
+    python benchmarks/bench_profile_indexes.py [--facts 100,1000,5000] [--skills 200] [--reads 20]
+"""
+
+import argparse
+import hashlib
+import random
+import re
+import time
+from collections.abc import Callable
+from functools import partial
+
+from agenticresume.agents.auditor import _render_context
+from agenticresume.domain.models import CareerProfile, Fact, Role, Skill
+
+
+def _profile(n_facts: int, n_skills: int, rng: random.Random) -> CareerProfile:
+    pool = [Skill.of(f"Skill {i}") for i in range(n_skills)]
+    roles = [Role(title="Engineer", company=f"Company {i}") for i in range(max(1, n_facts // 10))]
+    facts = tuple(
+        Fact(
+            text=f"Shipped feature {i} end to end",
+            context_kind="role",
+            context_id=roles[i % len(roles)].id,
+            skills=tuple(rng.sample(pool, 5)),
+            status="active",
+        )
+        for i in range(n_facts)
+    )
+    return CareerProfile(full_name="Bench Candidate", roles=tuple(roles), facts=facts)
+
+
+#the implementations before the indexes, kept here as the baseline
+def _legacy_active(p: CareerProfile) -> tuple[Fact, ...]:
+    return tuple(f for f in p.facts if f.status == "active")
+
+
+def _legacy_skills(p: CareerProfile) -> tuple[Skill, ...]:
+    seen: list[Skill] = []
+    for fact in _legacy_active(p):
+        for skill in fact.skills:
+            if skill not in seen:
+                seen.append(skill)
+    return tuple(seen)
+
+
+def _legacy_fingerprints(p: CareerProfile) -> list[str]:
+    out = []
+    for f in p.facts:
+        normalized = re.sub(r"\s+", " ", f.text.strip().lower())
+        out.append(hashlib.sha256(f"{f.context_id}:{normalized}".encode()).hexdigest())
+    return out
+
+
+def _ms(fn: Callable[[], object], reads: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reads):
+        fn()
+    return (time.perf_counter() - start) / reads * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--facts", type=lambda v: [int(x) for x in v.split(",")], default=[100, 1000, 5000]
+    )
+    parser.add_argument("--skills", type=int, default=200, help="distinct skills in the pool")
+    parser.add_argument("--reads", type=int, default=20, help="accesses per measurement")
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'facts':>6} {'index':<14} {'recompute':>12} {'cached':>12} {'speedup':>9}")
+    for n in args.facts:
+        profile = _profile(n, args.skills, rng)
+        cases = {
+            "active_facts": (partial(_legacy_active, profile), lambda p=profile: p.active_facts),
+            "skills": (partial(_legacy_skills, profile), lambda p=profile: p.skills),
+            "fingerprints": (
+                partial(_legacy_fingerprints, profile),
+                lambda p=profile: p.fingerprints,
+            ),
+        }
+        for name, (legacy, cached) in cases.items():
+            before = _ms(legacy, args.reads)
+            cached()  # first access builds the index
+            after = _ms(cached, args.reads)
+            speedup = before / max(after, 1e-9)
+            print(f"{n:>6} {name:<14} {before:>10.3f}ms {after:>10.4f}ms {speedup:>8.0f}x")
+
+        #auditor context: a fresh instance pays for the indexes once, repeat renders reuse them
+        fresh = profile.model_copy(update={"full_name": "Fresh Candidate"})
+        cold = _ms(lambda p=fresh: _render_context(p, p.active_facts, ()), 1)
+        warm = _ms(lambda p=profile: _render_context(p, p.active_facts, ()), args.reads)
+        print(f"{n:>6} {'render (cold)':<14} {cold:>10.3f}ms")
+        print(f"{n:>6} {'render (warm)':<14} {warm:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
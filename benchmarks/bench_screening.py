@@ -0,0 +1,156 @@
+"""
+Screening throughput and per-node latency, offline against a fake LLM
+
+Runs the real screening graph (nodes, scheduler, retries) with FakeChatModel as the
+provider, for every combination of concurrency and profile size. Each combination
+runs in a fresh process so its peak RSS is its own. Reports screenings per second,
+failed screenings, peak RSS and p50/p95/p99 wall time per node.
+
+    python benchmarks/bench_screening.py [--concurrency 1,8,32] [--facts 10,100]
+        [--screenings 64] [--latency 0.2] [--jitter 0.3] [--failure-rate 0.0] [--json out.json]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+from fakellm import FakeChatModel
+from pydantic import SecretStr
+
+from agenticresume.graph.screen import build_screening_graph, initial_state
+from agenticresume.infra.llm import register_chat_model
+from agenticresume.settings import Settings
+
+
+def _settings(args: argparse.Namespace) -> Settings:
+    dummy = SecretStr("bench-not-a-real-key")
+    #every cache and store off, each screening has to go through the model
+    disabled = {name: False for name in Settings.model_fields if name.endswith("_enabled")}
+    return Settings(  # pyright: ignore[reportCallIssue]
+        **disabled,
+        llm_provider="openai",
+        llm_model="fake",
+        openai_api_key=dummy,
+        neo4j_password=dummy,
+        judge_mode=args.judge_mode,
+        llm_max_concurrency=args.llm_concurrency,
+    )
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+async def _run(args: argparse.Namespace, concurrency: int, facts: int) -> dict:
+    settings = _settings(args)
+    register_chat_model(
+        settings,
+        FakeChatModel(
+            latency=args.latency,
+            jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            facts=facts,
+            requirements=args.requirements,
+            seed=args.seed,
+        ),
+    )
+    graph = build_screening_graph(settings)
+    gate = asyncio.Semaphore(concurrency)
+    timings: dict[str, list[float]] = {}
+    failed = 0
+
+    async def one(i: int) -> None:
+        nonlocal failed
+        async with gate:
+            try:
+                state = initial_state(resume_text=f"resume {i}", jd_text="job post")
+                final = await graph.ainvoke(state)
+            except Exception:
+                failed += 1
+                return
+        for node, seconds in final.get("timings", {}).items():
+            timings.setdefault(node, []).append(seconds)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.screenings)))
+    wall = time.perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "facts": facts,
+        "screenings": args.screenings,
+        "failed": failed,
+        "wall_seconds": wall,
+        "screenings_per_second": (args.screenings - failed) / wall,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,  # KiB on linux
+        "nodes": {
+            node: {q: _percentile(samples, float(q[1:])) * 1e3 for q in ("p50", "p95", "p99")}
+            for node, samples in timings.items()
+        },
+    }
+
+
+def _child(args: argparse.Namespace, concurrency: int, facts: int) -> dict:
+    return asyncio.run(_run(args, concurrency, facts))
+
+
+def _ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--concurrency", type=_ints, default=[1, 8, 32], help="screenings in flight, comma list"
+    )
+    parser.add_argument(
+        "--facts", type=_ints, default=[10, 100], help="profile sizes in facts, comma separated"
+    )
+    parser.add_argument("--screenings", type=int, default=64, help="screenings per combination")
+    parser.add_argument("--requirements", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.2, help="median seconds of a judge call")
+    parser.add_argument("--jitter", type=float, default=0.3, help="lognormal sigma of the latency")
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="share of calls failing with a 503"
+    )
+    parser.add_argument("--judge-mode", choices=["separate", "panel"], default="separate")
+    parser.add_argument(
+        "--llm-concurrency", type=int, default=64, help="scheduler concurrency ceiling"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args()
+
+    #spawn, so a child's RSS high-water mark is not inherited from the parent or a sibling
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for facts in args.facts:
+        for concurrency in args.concurrency:
+            with ctx.Pool(1) as pool:
+                r = pool.apply(_child, (args, concurrency, facts))
+            results.append(r)
+
+            print(
+                f"facts={facts:<5} concurrency={concurrency:<4} "
+                f"{r['screenings_per_second']:8.2f} screenings/s  failed={r['failed']:<3} "
+                f"peak_rss={r['peak_rss_mb']:7.1f} MB"
+            )
+            for node, q in r["nodes"].items():
+                print(
+                    f"    {node:<12} p50={q['p50']:8.1f}ms  p95={q['p95']:8.1f}ms  "
+                    f"p99={q['p99']:8.1f}ms"
+                )
+            sys.stdout.flush()
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Fake chat model for offline benchmarks
+
+Answers every screening schema with a schema-valid payload after a lognormal
+delay, and fails a configurable share of calls with a retryable 503, so the
+real nodes, scheduler and retries run exactly as they would against a provider.
+Install it with `register_chat_model(settings, FakeChatModel(...))`.
+"""
+
+import asyncio
+import math
+import random
+import re
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel, Field, PrivateAttr
+
+from agenticresume.agents import schemas as S
+
+SKILLS = (
+    "Python", "Go", "Rust", "TypeScript", "React", "PostgreSQL", "Redis", "Kafka",
+    "Kubernetes", "Docker", "Terraform", "AWS", "GCP", "Spark", "Airflow", "GraphQL",
+)
+
+#relative latency per schema, extraction and auditing read much more than a judge writes
+_WEIGHT = {
+    S.ExtractionOutput: 3.0,
+    S.JobPostOutput: 1.5,
+    S.AuditorOutput: 2.0,
+    S.AssessmentOutput: 1.0,
+    S.PanelOutput: 1.8,
+    S.RecruiterOutput: 0.8,
+}
+
+
+class FakeProviderError(Exception):
+    """A provider-side failure the scheduler treats as transient."""
+
+    status_code = 503
+
+
+class FakeChatModel(BaseChatModel):
+    """Structured-output-only chat model with synthetic latency and failures."""
+
+    latency: float = Field(default=0.2, ge=0.0)  # median seconds for a judge-sized call
+    jitter: float = Field(default=0.3, ge=0.0)  # lognormal sigma, 0 is a fixed latency
+    failure_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    facts: int = Field(default=20, ge=1)  # bullets in each extracted profile
+    requirements: int = Field(default=8, ge=1)  # requirements in each job post
+    seed: int | None = None
+
+    _rng: random.Random = PrivateAttr()
+
+    def model_post_init(self, context: Any) -> None:
+        self._rng = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        #plain calls (warmups, health checks) get an empty reply, the benchmarks only time
+        #structured output
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=""))])
+
+    def with_structured_output(
+        self, schema: Any, *, include_raw: bool = False, **kwargs: Any
+    ) -> Runnable:
+        async def answer(messages: list[BaseMessage]) -> Any:
+            delay = self.latency * _WEIGHT.get(schema, 1.0)
+            if self.jitter:
+                delay *= math.exp(self._rng.gauss(0.0, self.jitter))
+            await asyncio.sleep(delay)
+            if self._rng.random() < self.failure_rate:
+                raise FakeProviderError("fake provider unavailable")
+
+            parsed = self.payload(schema, str(messages[-1].content))
+            if not include_raw:
+                return parsed
+            prompt = sum(len(str(m.content)) for m in messages) // 4
+            output = len(parsed.model_dump_json()) // 4
+            raw = AIMessage(
+                content="",
+                usage_metadata={
+                    "input_tokens": prompt,
+                    "output_tokens": output,
+                    "total_tokens": prompt + output,
+                },
+            )
+            return {"raw": raw, "parsed": parsed, "parsing_error": None}
+
+        return RunnableLambda(answer)
+
+    def payload(self, schema: type[BaseModel], user_content: str) -> BaseModel:
+        """A valid `schema` instance, shaped by the prompt where the schema refers back to it."""
+
+        rng = self._rng
+        if schema is S.ExtractionOutput:
+            roles, left = [], self.facts
+            while left > 0:
+                bullets = min(left, 5)
+                skills = rng.sample(SKILLS, 3)
+                roles.append(
+                    S.ExtractedRole(
+                        role="Software Engineer",
+                        company=f"Company {len(roles) + 1}",
+                        started=f"{2024 - len(roles) * 2}-01",
+                        ended="",
+                        bullets=[
+                            f"Built and ran {rng.choice(skills)} service number {i}"
+                            for i in range(bullets)
+                        ],
+                        skills=skills,
+                    )
+                )
+                left -= bullets
+            return S.ExtractionOutput(full_name="Bench Candidate", roles=roles)
+
+        if schema is S.JobPostOutput:
+            requirements = []
+            for i in range(self.requirements):
+                necessity = "must_have" if i % 2 == 0 else "nice_to_have"
+                if i % 4 == 3:
+                    requirements.append(
+                        S.ExtractedRequirement(
+                            text="Clear written communication", kind="soft", necessity=necessity
+                        )
+                    )
+                else:
+                    skill = SKILLS[(i * 5) % len(SKILLS)]
+                    requirements.append(
+                        S.ExtractedRequirement(
+                            text=f"Experience with {skill}",
+                            kind="skill",
+                            necessity=necessity,
+                            skill=skill,
+                        )
+                    )
+            return S.JobPostOutput(
+                company="Bench Co", title="Backend Engineer", requirements=requirements
+            )
+
+        if schema is S.AuditorOutput:
+            shown = [int(i) for i in re.findall(r"^\[F(\d+)\]", user_content, re.M)] or [1]
+            return S.AuditorOutput(
+                coverage=[
+                    S.CoverageItem(
+                        requirement_index=int(r),
+                        status=rng.choice(("covered", "partial", "none")),
+                        evidence_indices=rng.sample(shown, min(2, len(shown))),
+                        reasoning="synthetic",
+                    )
+                    for r in re.findall(r"^\[R(\d+)\]", user_content, re.M)
+                ]
+            )
+
+        if schema is S.AssessmentOutput:
+            return S.AssessmentOutput(
+                summary="Synthetic assessment.", points=["point one", "point two"]
+            )
+
+        if schema is S.PanelOutput:
+            read = S.AssessmentOutput(summary="Synthetic assessment.", points=["point one"])
+            return S.PanelOutput(skeptic=read, enthusiast=read, pragmatist=read)
+
+        if schema is S.RecruiterOutput:
+            return S.RecruiterOutput(
+                decision=rng.choice(("invite", "reject", "hold")), rationale="Synthetic decision."
+            )
+
+        raise ValueError(f"no fake payload for {schema.__name__}")
@@ -1,2 +1,4 @@
 def main() -> None:
-    print("Hello from agenticresume!")
+    from agenticresume.cli import app
+
+    app()
@@ -2,13 +2,15 @@
 requirements and produces one coverage item per requirement. Facts and requirements 
 are ID'd"""
 
+import asyncio
 import logging
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from agenticresume.agents.mapping import coverages_from_audit
 from agenticresume.agents.schemas import AuditorOutput
+from agenticresume.domain.matching import prematch
 from agenticresume.domain.models import CareerProfile, Coverage, Fact, JobPost, Requirement
-from agenticresume.infra.llm import build_extractor
+from agenticresume.domain.retrieval import FactIndex
+from agenticresume.infra.llm import invoke_structured
 from agenticresume.settings import Settings
 
 
@@ -29,8 +31,14 @@ supports it, cite nothing and use "none".
 """
 
 
-def _render_context(profile: CareerProfile, facts: tuple[Fact, ...], requirements: tuple[Requirement, ...])->str:
-    """builds a context string for the auditor prompt"""
+def _render_context(
+    profile: CareerProfile,
+    facts: tuple[Fact, ...],
+    requirements: tuple[Requirement, ...],
+    *,
+    offset: int = 0,
+) -> str:
+    """builds a context string for the auditor prompt, requirements numbered from [R{offset + 1}]"""
 
     where = {r.id: f"{r.title} @ {r.company}" for r in profile.roles}
     where |= {p.id: f"Project: {p.name}" for p in profile.projects}
@@ -41,7 +49,7 @@ def _render_context(profile: CareerProfile, facts: tuple[Fact, ...], requirement
         lines.append(f"[F{i}] ({where.get(f.context_id, '?')}) {f.text}")
 
     lines += ["", "REQUIREMENTS:"]
-    for i, req in enumerate(requirements, 1):
+    for i, req in enumerate(requirements, offset + 1):
         yrs = f", {req.year_required}+ yrs" if req.year_required else ""
         lines.append(f"[R{i}] ({req.kind}, {req.necessity}{yrs}) {req.text}")
 
@@ -51,24 +59,49 @@ async def audit(settings: Settings, profile: CareerProfile, job_post: JobPost) -
     """Audits one Coverage per requirement"""
 
     facts = profile.active_facts
-    requirements = job_post.requirements
 
-    context = _render_context(profile, facts, requirements)
-    model = build_extractor(settings, AuditorOutput)
-
-    result = await model.ainvoke(
-        [
-            SystemMessage(content = SYSTEM_PROMPT),
-            HumanMessage(content = context)
-        ]
+    #exact skill hits are settled here, only the rest goes to the LLM
+    resolved, requirements = (
+        prematch(facts, job_post.requirements)
+        if settings.audit_prematch
+        else ([], job_post.requirements)
+    )
+    if not requirements:
+        logger.info("audited %d requirements, all matched deterministically", len(resolved))
+        return resolved
+
+    #one call per batch, all in flight at once; numbering stays global so each
+    #batch's [R#] is mapped back through its offset
+    size = settings.audit_batch_size or len(requirements)
+    offsets = range(0, len(requirements), size)
+
+    #with a top-k set, each batch only shows the facts most relevant to its requirements
+    k = settings.audit_facts_per_requirement
+    index = FactIndex(facts) if k is not None else None
+
+    async def audit_batch(offset: int) -> list[Coverage]:
+        batch = requirements[offset : offset + size]
+        shown = index.select(batch, k) if index is not None and k is not None else facts
+        context = _render_context(profile, shown, batch, offset=offset)
+        result = await invoke_structured(settings, AuditorOutput, SYSTEM_PROMPT, context)
+        #pass to the mapper, after extraction of result (AuditorOutput); the first batch
+        #carries the deterministic matches so the merged list keeps them in front.
+        #[F#] indices refer to the facts shown, so the mapper gets that same tuple
+        return coverages_from_audit(
+            result,
+            shown,
+            batch,
+            resolved=resolved if offset == 0 else (),
+            requirement_offset=offset,
+            trusted=True,  # statuses come from the validated wire schema, the mapper fixes the rest
+        )
+
+    batches = await asyncio.gather(*(audit_batch(o) for o in offsets))
+    coverages = [c for batch in batches for c in batch]
+
+
+    logger.info(
+        "audited %d requirements in %d call(s) (%d matched deterministically)",
+        len(coverages), len(offsets), len(resolved),
     )
-
-    if not isinstance(result, AuditorOutput):
-        raise TypeError(f"auditor returned {type(result).__name__}, expected AuditorOutput")
-
-    #pass to the mapper, after extraction of result (AuditorOutput)
-    coverages = coverages_from_audit(result, facts, requirements)
-
-
-    logger.info("audited %d requirements", len(coverages))
     return coverages
\ No newline at end of file
@@ -4,11 +4,12 @@ Extractor Agent
 Turns Raw Resume into an Extraction Output Schema, does nothing else.
 """
 
+import hashlib
+import json
 import logging
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from agenticresume.agents.schemas import ExtractionOutput
-from agenticresume.infra.llm import build_extractor
+from agenticresume.infra.llm import invoke_structured
 from agenticresume.settings import Settings
 
 
@@ -31,20 +32,16 @@ string for the end date of a current role.
 """
 
 
-async def extract_profile(settings: Settings, resume_text:str) -> ExtractionOutput:
-    """Extracts structured profile data from resume"""
+#changes whenever the prompt or the wire schema does, stored extractions are keyed on it
+EXTRACTOR_VERSION = hashlib.sha256(
+    (SYSTEM_PROMPT + json.dumps(ExtractionOutput.model_json_schema(), sort_keys=True)).encode()
+).hexdigest()[:16]
 
-    model = build_extractor(settings, ExtractionOutput)
 
-    result = await model.ainvoke(
-        [
-            SystemMessage(content=SYSTEM_PROMPT),
-            HumanMessage(content=resume_text),
-        ]
-    )
+async def extract_profile(settings: Settings, resume_text:str) -> ExtractionOutput:
+    """Extracts structured profile data from resume"""
 
-    if not isinstance(result, ExtractionOutput):
-        raise TypeError(f"extractor returned {type(result).__name__}, expected ExtractionOutput")
+    result = await invoke_structured(settings, ExtractionOutput, SYSTEM_PROMPT, resume_text)
 
     logger.info(
         "extracted %d roles, %d projects for %r",
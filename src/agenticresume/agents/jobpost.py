@@ -3,9 +3,8 @@ Turns raw job-description text into a JobPostOutput schema
 """
 
 import logging
-from langchain_core.messages import HumanMessage, SystemMessage
 from agenticresume.agents.schemas import JobPostOutput
-from agenticresume.infra.llm import build_extractor
+from agenticresume.infra.llm import invoke_structured
 from agenticresume.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -35,17 +34,7 @@ async def parse_job_post(settings: Settings, jd_text: str) -> JobPostOutput:
 
     """Parses the job description into a structured requirement"""
 
-    model = build_extractor(settings, JobPostOutput)
-
-    result = await model.ainvoke(
-        [
-            SystemMessage(content = SYSTEM_PROMPT),
-            HumanMessage(content=jd_text)
-        ]
-    )
-
-    if not isinstance(result, JobPostOutput):
-        raise TypeError(f"parser returned {type(result).__name__}, expected JobPostOutput")
+    result = await invoke_structured(settings, JobPostOutput, SYSTEM_PROMPT, jd_text)
 
     logger.info(
         "parsed %d requirements for %r", len(result.requirements), result.title or "unknown"
@@ -1,13 +1,38 @@
+from functools import cache
 from typing import Counter
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from agenticresume.agents.mapping import to_assessment
-from agenticresume.agents.schemas import AssessmentOutput
+from agenticresume.agents.schemas import AssessmentOutput, PanelOutput
 from agenticresume.domain.models import Coverage, JobPost, Assessment, JudgePersona
-from agenticresume.infra.llm import build_extractor, invoke_structured
+from agenticresume.infra.llm import invoke_structured
 from agenticresume.settings import Settings
 
 
+_PANEL_PREAMBLE = """\
+You are a three-person hiring panel. Each member gives an independent read of \
+the same per-requirement assessment below, following only their own brief. \
+Keep the three reads independent; do not have members reference each other.
+"""
+
+
+@cache
+def panel_system_prompt() -> str:
+    """The panel's prompt, built from the persona prompts so both modes read the same briefs"""
+
+    #deferred, the persona modules import run_judge from here
+    from agenticresume.agents import enthusiast, pragmatist, skeptic
+
+    briefs = (
+        f"--- {name} ---\n{module.SYSTEM_PROMPT}"
+        for name, module in (
+            ("skeptic", skeptic),
+            ("enthusiast", enthusiast),
+            ("pragmatist", pragmatist),
+        )
+    )
+    return "\n".join((_PANEL_PREAMBLE, *briefs))
+
 
 def _render_coverages(job_post: JobPost, coverages: list[Coverage]) -> str:
     """Renders the list of coverages with job post into a neat string for LLM"""
@@ -38,4 +63,18 @@ async def run_judge(settings: Settings, job_post: JobPost, coverages: list[Cover
     context = _render_coverages(job_post, coverages)
     output = await invoke_structured(settings, AssessmentOutput, system_prompt, context)
 
-    return to_assessment(output, persona=persona)
\ No newline at end of file
+    return to_assessment(output, persona=persona)
+
+
+async def run_panel(
+    settings: Settings, job_post: JobPost, coverages: list[Coverage]
+) -> list[Assessment]:
+    """Runs all three personas in one LLM call over one shared context"""
+    context = _render_coverages(job_post, coverages)
+    output = await invoke_structured(settings, PanelOutput, panel_system_prompt(), context)
+
+    return [
+        to_assessment(output.skeptic, persona="skeptic"),
+        to_assessment(output.enthusiast, persona="enthusiast"),
+        to_assessment(output.pragmatist, persona="pragmatist"),
+    ]
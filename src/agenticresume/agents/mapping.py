@@ -1,13 +1,16 @@
 """ Transforms the Wire Schema of LLMs into an actual output"""
 
 
+from collections.abc import Sequence
 from datetime import date, datetime
+from typing import Any
 from uuid import UUID
 
 from agenticresume.agents.schemas import AssessmentOutput, ExtractionOutput, JobPostOutput, AuditorOutput, RecruiterOutput
 from agenticresume.domain.models import (
     AnalysisResult,
     Assessment,
+    Base,
     CareerProfile, 
     Fact,
     JudgePersona, 
@@ -16,9 +19,17 @@ from agenticresume.domain.models import (
     Skill,
     JobPost,
     Requirement,
-    Coverage
+    Coverage,
+    canonicalize,
     )
 
+
+def _new[B: Base](cls: type[B], trusted: bool, **fields: Any) -> B:
+    """Validated construction, or Base.trusted when the caller vouches for the data.
+
+    Trusted instances skip per-field validation; the aggregate's check_invariants runs instead."""
+    return cls.trusted(**fields) if trusted else cls(**fields)
+
 def _parse_month(value: str) -> date | None:
     """Tolerant date parse. 'YYYY-MM' or 'YYYY' -> date; anything else -> None."""
     value = value.strip()
@@ -40,18 +51,26 @@ def _clean_bullets(bullets: list[str]) -> list[str]:
             out.append(b)
     return out
 
-def _dedup_skills(raw: list[str]) -> tuple[Skill, ...]:
+def _skill(raw: str, trusted: bool) -> Skill:
+    if trusted:
+        return Skill.trusted(display_name=raw.strip(), canonical_name=canonicalize(raw))
+    return Skill.of(raw)
+
+def _dedup_skills(raw: list[str], *, trusted: bool = False) -> tuple[Skill, ...]:
     """Build Skills, deduped by canonical name, order preserved."""
-    out: list[Skill] = []
+    out: dict[str, Skill] = {}
     for s in raw:
         if s.strip():
-            skill = Skill.of(s)
-            if skill not in out:  #skill.__eq__ compares canonical names
-                out.append(skill)
-    return tuple(out)
+            skill = _skill(s, trusted)
+            out.setdefault(skill.canonical_name, skill)  #same identity as skill.__eq__
+    return tuple(out.values())
 
-def to_career_profile(extraction: ExtractionOutput, *, source_document: str = "") -> CareerProfile:
-    """Translates extracted wire data into a domain profile"""
+def to_career_profile(
+    extraction: ExtractionOutput, *, source_document: str = "", trusted: bool = False
+) -> CareerProfile:
+    """Translates extracted wire data into a domain profile.
+
+    `trusted` skips per-object validation and checks the profile's invariants once at the end."""
 
     roles: list[Role] = []
     projects: list[Project] = []
@@ -59,7 +78,9 @@ def to_career_profile(extraction: ExtractionOutput, *, source_document: str = ""
 
 
     for r in extraction.roles:
-        role = Role(
+        role = _new(
+            Role,
+            trusted,
             title=r.role or "Unknown role",
             company=r.company or "Unknown company",
             started=_parse_month(r.started),
@@ -68,11 +89,13 @@ def to_career_profile(extraction: ExtractionOutput, *, source_document: str = ""
 
         roles.append(role)
 
-        skills = _dedup_skills(r.skills)
+        skills = _dedup_skills(r.skills, trusted=trusted)
 
         for text in _clean_bullets(r.bullets):
             facts.append(
-                Fact(
+                _new(
+                    Fact,
+                    trusted,
                     text=text,
                     context_kind="role",
                     context_id=role.id, #attach context of where skill was  used
@@ -82,12 +105,14 @@ def to_career_profile(extraction: ExtractionOutput, *, source_document: str = ""
             )
 
     for p in extraction.projects:
-        project = Project(name=p.name or "Unknown project", summary=p.summary)
+        project = _new(Project, trusted, name=p.name or "Unknown project", summary=p.summary)
         projects.append(project)
-        skills = _dedup_skills(p.skills)
+        skills = _dedup_skills(p.skills, trusted=trusted)
         for text in _clean_bullets(p.bullets):
             facts.append(
-                Fact(
+                _new(
+                    Fact,
+                    trusted,
                     text=text,
                     context_kind="project",
                     context_id=project.id,
@@ -97,17 +122,22 @@ def to_career_profile(extraction: ExtractionOutput, *, source_document: str = ""
             )
 
 
-    return CareerProfile(
+    profile = _new(
+        CareerProfile,
+        trusted,
         full_name = extraction.full_name or "Unknown Candidate",
         roles = tuple(roles),
         projects = tuple(projects),
         facts = tuple(facts)
     )
+    return profile.check_invariants() if trusted else profile
 
 
         
-def to_job_post(extraction: JobPostOutput, *, raw_text: str = "") -> JobPost:
-    """Transofrms wire schema of jobPostOutput into domain JobPost"""
+def to_job_post(extraction: JobPostOutput, *, raw_text: str = "", trusted: bool = False) -> JobPost:
+    """Transofrms wire schema of jobPostOutput into domain JobPost
+
+    `trusted` as in to_career_profile"""
 
     requirements: list[Requirement] = []
 
@@ -124,14 +154,16 @@ def to_job_post(extraction: JobPostOutput, *, raw_text: str = "") -> JobPost:
         if kind == "skill":
             name = r.skill.strip()
             if name:
-                skill = Skill.of(name)
+                skill = _skill(name, trusted)
             else:
                 #model tagged it as skill but named none, reclassify it as a domain skill
                 kind = "domain"
 
 
         requirements.append(
-            Requirement(
+            _new(
+                Requirement,
+                trusted,
                 text=text,
                 kind=kind,
                 necessity=r.necessity,
@@ -140,27 +172,37 @@ def to_job_post(extraction: JobPostOutput, *, raw_text: str = "") -> JobPost:
             )
         )
 
-    return JobPost(
+    job_post = _new(
+        JobPost,
+        trusted,
         company = extraction.company.strip() or "Unknown Company",
         title = extraction.title.strip() or "Unknown Title",
         raw_text = raw_text.strip(),
         requirements = tuple(requirements)
     )
+    return job_post.check_invariants() if trusted else job_post
 
 def coverages_from_audit(
     output: AuditorOutput,
     facts: tuple[Fact, ...],
     requirements: tuple[Requirement, ...],        
+    *,
+    resolved: Sequence[Coverage] = (),
+    requirement_offset: int = 0,
+    trusted: bool = False,
 ) -> list[Coverage]:
 
 
-    """Translates index-based audit into real IDs"""
+    """Translates index-based audit into real IDs, merged after the `resolved` coverages
+    already settled without the auditor. `requirements` were rendered from
+    [R{requirement_offset + 1}] onwards. The status/evidence invariant is enforced
+    here, so `trusted` construction can skip validating each Coverage."""
 
-    coverages: list[Coverage] = []
-    seen: set[UUID] = set()
+    coverages: list[Coverage] = list(resolved)
+    seen: set[UUID] = {c.requirement_id for c in resolved}
 
     for item in output.coverage:
-        ri = item.requirement_index - 1
+        ri = item.requirement_index - 1 - requirement_offset
         if not 0 <= ri < len(requirements):
             continue #hallucincated index, drop it
 
@@ -183,7 +225,9 @@ def coverages_from_audit(
             status = "partial" 
 
         coverages.append(
-            Coverage(
+            _new(
+                Coverage,
+                trusted,
                 requirement_id=req.id,
                 status=status,
                 evidence=evidence,
@@ -196,7 +240,13 @@ def coverages_from_audit(
     for req in requirements:
         if req.id not in seen:
             coverages.append(
-                Coverage(requirement_id=req.id, status="none", reasoning="not assessed")
+                _new(
+                    Coverage,
+                    trusted,
+                    requirement_id=req.id,
+                    status="none",
+                    reasoning="not assessed",
+                )
             )
 
     return coverages
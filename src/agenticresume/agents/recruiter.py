@@ -62,6 +62,8 @@ def _render_context(
     for a in assessments:
         pts = "; ".join(a.points)
         lines.append(f"  {a.persona.upper()}: {a.summary} ({pts})")
+    if not assessments:
+        lines.append("  (panel skipped, decide from the coverage alone)")
 
     return "\n".join(lines)
 
@@ -91,4 +93,24 @@ async def recommend(
         coverages=coverages,
         assessments=assessments,
         score=score,
-    )
\ No newline at end of file
+    )
+
+
+def fast_reject(
+    profile: CareerProfile,
+    job_post: JobPost,
+    coverages: list[Coverage],
+    reason: str,
+) -> AnalysisResult:
+    """Deterministic rejection, for screenings the routing policy already settled."""
+    score = weighted_coverage(tuple(coverages), job_post.requirements)
+
+    logger.info("verdict: reject (score %.0f%%, fast path)", score * 100)
+    return AnalysisResult(
+        profile_id=profile.id,
+        job_post_id=job_post.id,
+        coverages=tuple(coverages),
+        decision="reject",
+        score=score,
+        rationale=f"Fast path: rejected without panel or recruiter review ({reason}).",
+    )
@@ -87,6 +87,13 @@ class AssessmentOutput(Wire):
     summary: str = Field(description = "One or two sentences capturing the overall read")
     points: list[str] = Field(default_factory = list, description="Specific supporting points, one per item")
 
+class PanelOutput(Wire):
+    """Output of the whole panel in one call, one assessment per persona"""
+
+    skeptic: AssessmentOutput = Field(description="The skeptic's read: risks and gaps")
+    enthusiast: AssessmentOutput = Field(description="The enthusiast's read: strengths and upside")
+    pragmatist: AssessmentOutput = Field(description="The pragmatist's read: fit for this role")
+
 class RecruiterOutput(Wire):
     """Output of the recruiter agent, final decision rationale"""
 
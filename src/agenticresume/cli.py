@@ -0,0 +1,393 @@
+"""
+Command line entry point, `agenticresume --help`
+
+Only typer and the standard library are imported at startup. Settings, the stores
+and the screening graph (langgraph, langchain, every agent) are imported inside
+the commands that use them, so help, config checks and cache inspection stay fast.
+Commands that only inspect a store read StoreSettings, so they work without API
+keys or a Neo4j password.
+Keep it that way: benchmarks/bench_cli_startup.py fails past its import budget.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+if TYPE_CHECKING:
+    from agenticresume.infra.jobstore import JobPostStore
+
+app = typer.Typer(help="Agentic resume screening.", no_args_is_help=True)
+jobs = typer.Typer(help="Inspect the parsed job post store.", no_args_is_help=True)
+cache = typer.Typer(help="Inspect the LLM response cache.", no_args_is_help=True)
+queue = typer.Typer(
+    help="Queue screenings for workers and read their results.", no_args_is_help=True
+)
+checkpoints = typer.Typer(
+    help="Inspect checkpoints of unfinished screenings.", no_args_is_help=True
+)
+skills = typer.Typer(help="Maintain the skill index the shortlist ranks on.", no_args_is_help=True)
+app.add_typer(jobs, name="jobs")
+app.add_typer(cache, name="cache")
+app.add_typer(queue, name="queue")
+app.add_typer(checkpoints, name="checkpoints")
+app.add_typer(skills, name="skills")
+
+
+@app.command()
+def config() -> None:
+    """Validate the configuration and print it, secrets masked."""
+
+    from pydantic import ValidationError
+
+    from agenticresume.settings import Settings
+
+    try:
+        settings = Settings()  # pyright: ignore[reportCallIssue]  # fields come from env, not args
+    except ValidationError as exc:
+        #errors without their input, which would echo the environment's api keys
+        for error in exc.errors(include_input=False):
+            where = ".".join(str(p) for p in error["loc"]) or "settings"
+            typer.echo(f"{where}: {error['msg']}", err=True)
+        raise typer.Exit(code=1) from exc
+    for name, value in settings:
+        typer.echo(f"{name} = {value}")  # SecretStr prints as '**********'
+
+
+@app.command()
+def screen(
+    resume: Annotated[
+        Path, typer.Argument(help="Resume as .pdf or plain text", exists=True, dir_okay=False)
+    ],
+    jd: Annotated[
+        Path, typer.Argument(help="Job description as plain text", exists=True, dir_okay=False)
+    ],
+    screening_id: Annotated[
+        str | None, typer.Option(help="Id of a failed screening to resume")
+    ] = None,
+) -> None:
+    """Screen one resume against one job description, print the result as JSON."""
+
+    import asyncio
+    import uuid
+
+    from agenticresume.graph.screen import screen as run_screening
+    from agenticresume.settings import get_settings
+
+    source = resume.read_bytes()
+    if resume.suffix.lower() == ".pdf":
+        from agenticresume.infra.pdf import extract_pdf_text
+
+        resume_text = extract_pdf_text(source)
+    else:
+        resume_text = source.decode()
+
+    screening_id = screening_id or uuid.uuid4().hex
+    try:
+        result = asyncio.run(
+            run_screening(
+                get_settings(),
+                resume_text=resume_text,
+                resume_source=source,
+                jd_text=jd.read_text(),
+                screening_id=screening_id,
+            )
+        )
+    except Exception:
+        typer.echo(
+            f"screening {screening_id} failed, rerun with --screening-id {screening_id} to resume",
+            err=True,
+        )
+        raise
+    typer.echo(result.model_dump_json(indent=2))
+
+
+def _jobpost_store() -> "JobPostStore":
+    from agenticresume.infra.jobstore import JobPostStore
+    from agenticresume.settings import get_store_settings
+
+    settings = get_store_settings()
+    return JobPostStore(
+        settings.jobpost_store_path, threshold=settings.jobpost_similarity_threshold
+    )
+
+
+@jobs.command("list")
+def jobs_list() -> None:
+    """List stored job posts, newest first."""
+
+    entries = _jobpost_store().entries()
+    if not entries:
+        typer.echo("no stored job posts")
+        return
+    for e in entries:
+        typer.echo(
+            f"{e.key[:12]}  {e.created_at:%Y-%m-%d %H:%M}  {e.hits:>5} hits  "
+            f"{e.requirements:>3} reqs  {e.title} @ {e.company}"
+        )
+
+
+@jobs.command("evict")
+def jobs_evict(
+    key: Annotated[str, typer.Argument(help="Key or key prefix, as shown by `jobs list`")],
+) -> None:
+    """Remove stored job posts so their next posting is parsed again."""
+
+    removed = _jobpost_store().evict(key)
+    if not removed:
+        typer.echo(f"no stored job post matches {key!r}", err=True)
+        raise typer.Exit(code=1)
+    for k in removed:
+        typer.echo(f"evicted {k[:12]}")
+
+
+@cache.command("stats")
+def cache_stats() -> None:
+    """Entries, size and hit rate of the response cache."""
+
+    from agenticresume.infra.cache import get_llm_cache
+    from agenticresume.settings import get_store_settings
+
+    llm_cache = get_llm_cache(get_store_settings())
+    if llm_cache is None:
+        typer.echo("response cache is disabled")
+        return
+    s = llm_cache.stats()
+    typer.echo(f"{s.entries} entries, {s.size_bytes / 1024 / 1024:.1f} MB")
+    typer.echo(f"{s.hits} hits, {s.misses} misses ({s.hit_rate:.0%} hit rate)")
+
+
+@cache.command("clear")
+def cache_clear() -> None:
+    """Drop every cached response."""
+
+    from agenticresume.infra.cache import get_llm_cache
+    from agenticresume.settings import get_store_settings
+
+    llm_cache = get_llm_cache(get_store_settings())
+    if llm_cache is None:
+        typer.echo("response cache is disabled")
+        return
+    llm_cache.clear()
+    typer.echo("response cache cleared")
+
+
+@checkpoints.command("list")
+def checkpoints_list() -> None:
+    """List screenings with checkpoints, oldest first."""
+
+    from agenticresume.infra.checkpoint import get_checkpointer
+    from agenticresume.settings import get_store_settings
+
+    checkpointer = get_checkpointer(get_store_settings())
+    if checkpointer is None:
+        typer.echo("checkpoints are disabled")
+        return
+    threads = checkpointer.threads()
+    if not threads:
+        typer.echo("no checkpointed screenings")
+        return
+    for t in threads:
+        typer.echo(
+            f"{t.thread_id}  started {t.created_at:%Y-%m-%d %H:%M}  "
+            f"last {t.updated_at:%Y-%m-%d %H:%M}  {t.checkpoints} checkpoints"
+        )
+
+
+@checkpoints.command("purge")
+def checkpoints_purge(
+    days: Annotated[
+        float, typer.Option(help="Drop screenings with no checkpoint for this long")
+    ] = 7.0,
+) -> None:
+    """Drop checkpoints of screenings abandoned for longer than --days."""
+
+    from agenticresume.infra.checkpoint import get_checkpointer
+    from agenticresume.settings import get_store_settings
+
+    checkpointer = get_checkpointer(get_store_settings())
+    if checkpointer is None:
+        typer.echo("checkpoints are disabled")
+        return
+    removed = checkpointer.purge(older_than=days * 86400)
+    typer.echo(f"purged {len(removed)} screenings")
+
+
+@queue.command("add")
+def queue_add(
+    resumes: Annotated[
+        list[Path], typer.Argument(help="Resumes, .pdf or plain text", exists=True, dir_okay=False)
+    ],
+    jd: Annotated[
+        Path,
+        typer.Option("--jd", help="Job description as plain text", exists=True, dir_okay=False),
+    ],
+) -> None:
+    """Queue one screening per resume against the job description."""
+
+    from agenticresume.infra.queue import get_job_queue
+    from agenticresume.settings import get_store_settings
+
+    #workers may run elsewhere on the box, hand them absolute paths
+    pairs = ((str(r.resolve()), str(jd.resolve())) for r in resumes)
+    ids = get_job_queue(get_store_settings()).enqueue(pairs)
+    typer.echo(f"queued {len(ids)} jobs ({ids[0]}..{ids[-1]})" if ids else "nothing queued")
+
+
+@queue.command("stats")
+def queue_stats() -> None:
+    """Jobs per status."""
+
+    from agenticresume.infra.queue import get_job_queue
+    from agenticresume.settings import get_store_settings
+
+    for status, count in get_job_queue(get_store_settings()).counts().items():
+        typer.echo(f"{status:<8} {count}")
+
+
+@queue.command("show")
+def queue_show(
+    job_id: Annotated[int, typer.Argument(help="Job id, as printed by `queue add`")],
+) -> None:
+    """A job's status, and its result as JSON once done."""
+
+    from agenticresume.infra.queue import get_job_queue
+    from agenticresume.settings import get_store_settings
+
+    job = get_job_queue(get_store_settings()).get(job_id)
+    if job is None:
+        typer.echo(f"no job {job_id}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"job {job.id}: {job.status}, {job.attempts} attempts, {job.resume_ref}")
+    if job.error:
+        typer.echo(f"last error: {job.error}")
+    if job.result:
+        typer.echo(job.result)
+
+
+@queue.command("failed")
+def queue_failed() -> None:
+    """List jobs that used every attempt, with their last error."""
+
+    from agenticresume.infra.queue import get_job_queue
+    from agenticresume.settings import get_store_settings
+
+    failed = get_job_queue(get_store_settings()).jobs("failed")
+    if not failed:
+        typer.echo("no failed jobs")
+        return
+    for job in failed:
+        typer.echo(f"{job.id:>6}  {job.attempts} attempts  {job.resume_ref}  {job.error}")
+
+
+@queue.command("retry")
+def queue_retry(
+    job_id: Annotated[
+        int | None, typer.Argument(help="Failed job id, as shown by `queue failed`")
+    ] = None,
+    all_failed: Annotated[
+        bool, typer.Option("--all", help="Requeue every failed job")
+    ] = False,
+) -> None:
+    """Queue failed jobs again with a fresh set of attempts."""
+
+    from agenticresume.infra.queue import get_job_queue
+    from agenticresume.settings import get_store_settings
+
+    if (job_id is None) == (not all_failed):
+        typer.echo("give a job id or --all", err=True)
+        raise typer.Exit(code=2)
+    ids = get_job_queue(get_store_settings()).requeue(job_id)
+    if job_id is not None and not ids:
+        typer.echo(f"job {job_id} is not failed", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"requeued {len(ids)} jobs")
+
+
+@queue.command("purge")
+def queue_purge(
+    days: Annotated[float, typer.Option(help="Age of finished jobs to delete")] = 7.0,
+    failed: Annotated[bool, typer.Option("--failed", help="Delete failed jobs too")] = False,
+) -> None:
+    """Delete done jobs older than --days; failed ones are kept unless --failed."""
+
+    from agenticresume.infra.queue import get_job_queue
+    from agenticresume.settings import get_store_settings
+
+    removed = get_job_queue(get_store_settings()).purge(older_than=days * 86400, failed=failed)
+    typer.echo(f"purged {removed} jobs")
+
+
+@app.command("recanonicalize-skills")
+def recanonicalize_skills() -> None:
+    """Merge Neo4j skills stored under outdated canonical names, after an alias table change."""
+
+    import asyncio
+
+    from agenticresume.infra.repository import neo4j_repository
+    from agenticresume.settings import get_settings
+
+    async def main() -> int:
+        repo = neo4j_repository(get_settings())
+        try:
+            return await repo.recanonicalize_skills()
+        finally:
+            await repo.close()
+
+    typer.echo(f"merged {asyncio.run(main())} skills")
+
+
+@skills.command("index")
+def skills_index() -> None:
+    """Index every profile stored in Neo4j, dropping profiles no longer stored."""
+
+    import asyncio
+
+    from agenticresume.infra.repository import neo4j_repository
+    from agenticresume.infra.skillindex import get_skill_index
+    from agenticresume.settings import get_settings
+
+    settings = get_settings()
+
+    async def main() -> int:
+        repo = neo4j_repository(settings)
+        try:
+            return await get_skill_index(settings).build(repo.iter_profiles(), prune=True)
+        finally:
+            await repo.close()
+
+    typer.echo(f"indexed {asyncio.run(main())} profiles")
+
+
+@app.command()
+def worker(
+    concurrency: Annotated[
+        int | None,
+        typer.Option(min=1, help="Screenings in flight, default screening_concurrency"),
+    ] = None,
+    drain: Annotated[
+        bool, typer.Option(help="Exit once the queue is empty instead of waiting for more")
+    ] = False,
+) -> None:
+    """Run a screening worker on the job queue until SIGINT/SIGTERM."""
+
+    import asyncio
+    import logging
+    import signal
+
+    from agenticresume.graph.worker import run_worker
+    from agenticresume.settings import get_settings
+
+    settings = get_settings()
+    logging.basicConfig(
+        level=settings.log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
+    async def main() -> int:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)  # finish what is in flight, then exit
+        return await run_worker(settings, concurrency=concurrency, stop=stop, drain=drain)
+
+    typer.echo(f"worker done, {asyncio.run(main())} jobs completed")
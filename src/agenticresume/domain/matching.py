@@ -0,0 +1,48 @@
+"""Deterministic skill matching, resolves the obvious requirements without an LLM
+
+A skill requirement whose canonical skill appears on an active fact is covered by
+that fact, nothing to judge. Everything else (no exact hit, a years threshold,
+or a non-skill kind) is left for the auditor.
+"""
+
+from uuid import UUID
+
+from agenticresume.domain.models import Coverage, Fact, Requirement
+
+
+def skill_index(facts: tuple[Fact, ...]) -> dict[str, tuple[UUID, ...]]:
+    """Inverted index, canonical skill name -> ids of the facts that show it."""
+
+    index: dict[str, list[UUID]] = {}
+    for fact in facts:
+        for skill in fact.skills:
+            index.setdefault(skill.canonical_name, []).append(fact.id)
+    return {name: tuple(ids) for name, ids in index.items()}
+
+
+def prematch(
+    facts: tuple[Fact, ...], requirements: tuple[Requirement, ...]
+) -> tuple[list[Coverage], tuple[Requirement, ...]]:
+    """Split requirements into exact skill hits (as Coverages) and the ones left to audit."""
+
+    index = skill_index(facts)
+    resolved: list[Coverage] = []
+    forwarded: list[Requirement] = []
+
+    for req in requirements:
+        #years can't be read off a skill tag, so a years threshold stays with the auditor
+        skill = req.skill if req.kind == "skill" and req.year_required is None else None
+        evidence = index.get(skill.canonical_name, ()) if skill is not None else ()
+        if skill is not None and evidence:
+            resolved.append(
+                Coverage(
+                    requirement_id=req.id,
+                    status="covered",
+                    evidence=evidence,
+                    reasoning=f"Exact skill match: {skill.display_name}",
+                )
+            )
+        else:
+            forwarded.append(req)
+
+    return resolved, tuple(forwarded)
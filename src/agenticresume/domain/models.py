@@ -7,12 +7,17 @@ Pure data and rules, each is a class
 from __future__ import annotations
 
 import hashlib
+import json
 import re
+from collections.abc import Callable, Mapping
 from datetime import UTC, date, datetime
-from typing import Annotated, Literal, Self
+from functools import cache, cached_property, lru_cache
+from pathlib import Path
+from typing import Annotated, Any, Literal, Self
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic_core import PydanticUndefined
 
 #"cookie cutter" vars
 
@@ -36,11 +41,110 @@ class Base(BaseModel):
 
     model_config =  ConfigDict(frozen = True, extra = "forbid")
 
+    @classmethod
+    def trusted(cls, **values: Any) -> Self:
+        """Build without validation from values already known to be well typed and valid.
+
+        A leaner model_construct: defaults come from a per-class template instead of a walk
+        over every field. Rules are the caller's job, see the aggregates' check_invariants."""
+
+        defaults, factories = _template(cls)
+        data = defaults.copy()
+        data.update(values)
+        for name, factory in factories:
+            if name not in values:
+                data[name] = factory()
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "__dict__", data)
+        object.__setattr__(obj, "__pydantic_fields_set__", set(values))
+        object.__setattr__(obj, "__pydantic_extra__", None)
+        object.__setattr__(obj, "__pydantic_private__", None)
+        return obj
+
+    #cached_property indexes live in the instance __dict__ next to the fields; equality, hashing and
+    #dumps only look at fields, but a copy with updates must not inherit indexes of the original
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _cached_names(type(self)):
+                copied.__dict__.pop(name, None)
+        return copied
+
+
+def _non_empty(model: BaseModel, *names: str) -> None:
+    #NonEmptyStr, for instances built with Base.trusted
+    for name in names:
+        if not getattr(model, name):
+            raise ValueError(f"{type(model).__name__}.{name} must not be empty")
+
+
+@cache
+def _template(
+    cls: type[BaseModel],
+) -> tuple[dict[str, Any], tuple[tuple[str, Callable[[], Any]], ...]]:
+    #field order is kept so dumps and reprs match validated instances
+    defaults: dict[str, Any] = {}
+    factories: list[tuple[str, Callable[[], Any]]] = []
+    for name, field in cls.model_fields.items():
+        defaults[name] = None if field.default is PydanticUndefined else field.default
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))  # type: ignore[arg-type]  # never takes data
+    return defaults, tuple(factories)
+
+
+@cache
+def _cached_names(cls: type) -> tuple[str, ...]:
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
+_SKILL_ALIASES = Path(__file__).with_name("skill_aliases.json")
+_NOT_SKILL_CHARS = re.compile(r"[^a-z0-9+#\s]")
+_SPACES = re.compile(r"\s+")
+
+
+def _fold(name: str) -> str:
+    return _SPACES.sub(" ", _NOT_SKILL_CHARS.sub("", name.strip().lower()))
+
+
+@cache
+def _alias_table() -> tuple[int, dict[str, str]]:
+    """(version, folded alias -> folded canonical name), read once from skill_aliases.json."""
+
+    data = json.loads(_SKILL_ALIASES.read_text())
+    table: dict[str, str] = {}
+    for canonical, aliases in data["skills"].items():
+        target = _fold(canonical)
+        for alias in (canonical, *aliases):
+            key = _fold(alias)
+            if table.setdefault(key, target) != target:
+                raise ValueError(
+                    f"skill alias {alias!r} maps to both {table[key]!r} and {target!r}"
+                )
+    #a canonical name that is also another skill's alias would make canonicalize order dependent
+    for key, target in table.items():
+        if table.get(target, target) != target:
+            raise ValueError(
+                f"{key!r} maps to {target!r}, which is itself an alias of {table[target]!r}"
+            )
+    return data["version"], table
+
+
+def skill_aliases_version() -> int:
+    """Version of the alias table, bump it in skill_aliases.json whenever it changes."""
+    return _alias_table()[0]
 
+
+@lru_cache(maxsize=65536)
 def canonicalize(name: str) -> str:
-    """Fold a skill name to its identity form. 'React.js ' -> 'reactjs'."""
-    cleaned = re.sub(r"[^a-z0-9+#\s]", "", name.strip().lower())
-    return re.sub(r"\s+", " ", cleaned)
+    """Fold a skill name to its identity form, known aliases to their skill's.
+    'React.js ' -> 'react', 'k8s' -> 'kubernetes'."""
+    folded = _fold(name)
+    return _alias_table()[1].get(folded, folded)
 
 
 # ------------ Entities -----------------------
@@ -117,7 +221,7 @@ class Fact(Base):
     status: FactStatus = "active"
     superseded_by: UUID | None = None
 
-    @property
+    @cached_property
     def fingerprint(self) -> str:
         """Dedup key: normalized text scoped to its context."""
         normalized = re.sub(r"\s+", " ", self.text.strip().lower())
@@ -139,20 +243,66 @@ class CareerProfile(Base):
     projects: tuple[Project, ...] = ()
     facts: tuple[Fact, ...] = ()
 
-    @property
+    #indexes below are computed on first access and kept for the life of the (frozen) instance
+
+    @cached_property
     def active_facts(self) -> tuple[Fact, ...]:
         #only return truths that are currently true for the you
         return tuple(f for f in self.facts if f.status == "active")
 
-    @property
+    @cached_property
     def skills(self) -> tuple[Skill,...]:
         """Person's real skills"""
-        seen: list[Skill] = []
+        seen: dict[str, Skill] = {}
         for fact in self.active_facts:
             for skill in fact.skills:
-                if skill not in seen:  # Skill.__eq__ dedups by canonical name
-                    seen.append(skill)
-        return tuple(seen)
+                #first spelling wins, same as Skill.__eq__
+                seen.setdefault(skill.canonical_name, skill)
+        return tuple(seen.values())
+
+    @cached_property
+    def skill_names(self) -> frozenset[str]:
+        """Canonical names of `skills`, for membership tests"""
+        return frozenset(s.canonical_name for s in self.skills)
+
+    @cached_property
+    def facts_by_context(self) -> Mapping[UUID, tuple[Fact, ...]]:
+        """Every fact grouped by the role or project it belongs to, in order"""
+        grouped: dict[UUID, list[Fact]] = {}
+        for fact in self.facts:
+            grouped.setdefault(fact.context_id, []).append(fact)
+        return {k: tuple(v) for k, v in grouped.items()}
+
+    @cached_property
+    def fact_by_id(self) -> Mapping[UUID, Fact]:
+        return {f.id: f for f in self.facts}
+
+    @cached_property
+    def fingerprints(self) -> frozenset[str]:
+        """Dedup keys of every fact"""
+        return frozenset(f.fingerprint for f in self.facts)
+
+    def check_invariants(self) -> Self:
+        """Every rule validation would enforce, checked once over the whole aggregate.
+
+        For profiles assembled with Base.trusted from data already known to be well
+        typed (the mapper's own output, rows read back from the store)."""
+
+        _non_empty(self, "full_name")
+        for role in self.roles:
+            _non_empty(role, "title", "company")
+            role._dates_are_ordered()
+        for project in self.projects:
+            _non_empty(project, "name")
+        checked: set[int] = set()  # roles share one skills tuple across their facts
+        for fact in self.facts:
+            _non_empty(fact, "text")
+            fact._supersession_is_consistent()
+            if id(fact.skills) not in checked:
+                checked.add(id(fact.skills))
+                for skill in fact.skills:
+                    _non_empty(skill, "display_name", "canonical_name")
+        return self._facts_reference_known_contexts()
 
     @model_validator(mode = "after")
     def _facts_reference_known_contexts(self) -> Self:
@@ -200,6 +350,19 @@ class JobPost(Base):
     raw_text: str = ""
     requirements: tuple[Requirement, ...] = ()
 
+    def check_invariants(self) -> Self:
+        """Every rule validation would enforce, checked once over the post and its requirements."""
+
+        _non_empty(self, "company", "title")
+        for req in self.requirements:
+            _non_empty(req, "text")
+            req._skill_requirements_name_a_skill()
+            if req.skill is not None:
+                _non_empty(req.skill, "display_name", "canonical_name")
+            if req.year_required is not None and req.year_required < 0:
+                raise ValueError("year_required must not be negative")
+        return self
+
 
 # --- Value Objects (no real identity, never presists, used solely as ephemeral data storage)
 
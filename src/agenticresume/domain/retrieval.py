@@ -0,0 +1,70 @@
+"""Lexical fact retrieval, picks the facts worth showing the auditor
+
+Okapi BM25 over each fact's text plus its skill names. Built once per profile,
+then queried once per requirement; the auditor only sees the union of each
+requirement's top hits, so its prompt stops growing with resume length.
+"""
+
+import math
+import re
+from collections import Counter
+
+from agenticresume.domain.models import Fact, Requirement
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+class FactIndex:
+    """BM25 index over a fixed tuple of facts."""
+
+    def __init__(self, facts: tuple[Fact, ...], *, k1: float = 1.5, b: float = 0.75) -> None:
+        self.facts = facts
+
+        docs = [
+            tokenize(f.text) + [t for s in f.skills for t in tokenize(s.canonical_name)]
+            for f in facts
+        ]
+        avg_len = sum(map(len, docs)) / len(docs) if docs else 0.0
+
+        #postings hold the per-document term weight, so a query is just lookups and sums
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for i, doc in enumerate(docs):
+            norm = k1 * (1 - b + b * len(doc) / avg_len) if avg_len else k1
+            for term, tf in Counter(doc).items():
+                self._postings.setdefault(term, []).append((i, tf * (k1 + 1) / (tf + norm)))
+
+        n = len(docs)
+        self._idf = {
+            term: math.log((n - len(posting) + 0.5) / (len(posting) + 0.5) + 1)
+            for term, posting in self._postings.items()
+        }
+
+    def scores(self, query: str) -> dict[int, float]:
+        """BM25 score per matching fact position; facts sharing no term are absent."""
+
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for i, weight in self._postings[term]:
+                scores[i] = scores.get(i, 0.0) + idf * weight
+        return scores
+
+    def top_k(self, query: str, k: int) -> list[int]:
+        """Positions of the best `k` facts for `query`, best first."""
+        scores = self.scores(query)
+        return sorted(scores, key=lambda i: (-scores[i], i))[:k]
+
+    def select(self, requirements: tuple[Requirement, ...], k: int) -> tuple[Fact, ...]:
+        """Union of each requirement's top `k` facts, in the profile's original order."""
+
+        keep: set[int] = set()
+        for req in requirements:
+            query = f"{req.text} {req.skill.canonical_name}" if req.skill else req.text
+            keep.update(self.top_k(query, k))
+        return tuple(self.facts[i] for i in sorted(keep))
@@ -0,0 +1,52 @@
+"""Routing rules after the audit
+
+Coverage alone often settles a screening, five unmet must-haves at a 10% score
+will not be rescued by any panel. The policy reads the deterministic signals
+from scoring and picks the cheapest path that can still produce the verdict.
+"""
+
+from typing import Literal
+
+from pydantic import Field
+
+from agenticresume.domain.models import Base, Coverage, Requirement
+from agenticresume.domain.scoring import unmet_must_haves, weighted_coverage
+
+#panel = full screening, recruiter = decide without the panel, reject = decided here
+Route = Literal["panel", "recruiter", "reject"]
+
+
+class Triage(Base):
+    """Which path a screening takes, and why when it is a fast one."""
+
+    route: Route
+    reason: str = ""
+
+
+class RoutingPolicy(Base):
+    """Thresholds on the audit signals, a None threshold never fires.
+
+    Reject rules are checked before skip-panel rules."""
+
+    reject_unmet_must_haves: int | None = Field(default=None, ge=1)
+    reject_below_score: float | None = Field(default=None, ge=0.0, le=1.0)
+    skip_panel_unmet_must_haves: int | None = Field(default=None, ge=1)
+    skip_panel_below_score: float | None = Field(default=None, ge=0.0, le=1.0)
+
+    def triage(
+        self, coverages: tuple[Coverage, ...], requirements: tuple[Requirement, ...]
+    ) -> Triage:
+        score = weighted_coverage(coverages, requirements)
+        unmet = len(unmet_must_haves(coverages, requirements))
+        signals = f"{unmet} unmet must-have(s), coverage score {score:.0%}"
+
+        def fires(max_unmet: int | None, min_score: float | None) -> bool:
+            return (max_unmet is not None and unmet >= max_unmet) or (
+                min_score is not None and score < min_score
+            )
+
+        if fires(self.reject_unmet_must_haves, self.reject_below_score):
+            return Triage(route="reject", reason=signals)
+        if fires(self.skip_panel_unmet_must_haves, self.skip_panel_below_score):
+            return Triage(route="recruiter", reason=signals)
+        return Triage(route="panel")
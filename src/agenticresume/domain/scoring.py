@@ -2,6 +2,8 @@
 Simple Weighted Sum, acts as one half of the hiring decision
 """
 
+from collections.abc import Collection
+
 from agenticresume.domain.models import Coverage, Requirement
 
 _STATUS_WEIGHT = {"covered": 1.0, "partial": 0.5, "none": 0.0}
@@ -31,4 +33,20 @@ def unmet_must_haves(coverages: tuple[Coverage, ...], requirements: tuple[Requir
         by_id[c.requirement_id]
         for c in coverages
         if c.status == "none" and by_id[c.requirement_id].necessity == "must_have"
-    ]
\ No newline at end of file
+    ]
+
+def skill_coverage(requirements: tuple[Requirement, ...], held: Collection[str]) -> float:
+    """weighted_coverage over the skill requirements alone, for candidates known only by
+    their canonical skill names: a named skill is 'covered' if held, 'none' otherwise."""
+
+    total = 0.0
+    earned = 0.0
+
+    for r in requirements:
+        if r.skill is None:
+            continue
+        weight = _NECESSITY_WEIGHT[r.necessity]
+        total += weight
+        earned += _STATUS_WEIGHT["covered" if r.skill.canonical_name in held else "none"] * weight
+
+    return earned / total if total > 0 else 0.0
@@ -0,0 +1,207 @@
+"""
+Batch screening, one job post against many resumes
+
+The JD is parsed once and the shared JobPost is handed prefilled to every screening,
+so only the per-candidate nodes run per resume. Resumes may be plain text,
+ingested documents or already stored profiles, from a list or from an async source
+such as PDF ingestion. Screenings run under a bounded number of workers and outcomes
+are yielded in completion order, each tagged with its resume's position in the input.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass
+
+from agenticresume.domain.models import AnalysisResult, CareerProfile, JobPost
+from agenticresume.graph.node import load_job_post
+from agenticresume.graph.screen import build_screening_graph, screen, warm_up
+from agenticresume.infra.pdf import ResumeDocument
+from agenticresume.infra.repository import Repository
+from agenticresume.infra.skillindex import get_skill_index
+from agenticresume.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()  # end-of-stream sentinel on the internal queues
+
+Resume = str | ResumeDocument | CareerProfile
+Resumes = Iterable[Resume] | AsyncIterable[Resume]
+
+
+@dataclass(frozen=True)
+class Screened:
+    """What became of one resume of a batch."""
+
+    index: int  # position of the resume in the input
+    screening_id: str  # a failed screening resumes under this id when checkpoints are on
+    outcome: AnalysisResult | Exception
+
+    @property
+    def ok(self) -> bool:
+        return isinstance(self.outcome, AnalysisResult)
+
+
+async def _aiter(resumes: Resumes) -> AsyncIterator[Resume]:
+    if isinstance(resumes, AsyncIterable):
+        async for resume in resumes:
+            yield resume
+    else:
+        for resume in resumes:
+            yield resume
+
+
+async def screen_batch(
+    settings: Settings,
+    jd_text: str,
+    resumes: Resumes,
+    *,
+    concurrency: int | None = None,
+) -> AsyncIterator[Screened]:
+    """Screen every resume against one JD, yielding each outcome as it finishes.
+
+    A screening that raises is yielded with its exception as the outcome, one bad resume
+    does not sink the batch.
+    """
+
+    limit = settings.screening_concurrency if concurrency is None else concurrency
+    if limit < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    job_post = await load_job_post(settings, jd_text)
+
+    async for screened in screen_many(settings, job_post, resumes, concurrency=limit):
+        yield screened
+
+
+async def screen_shortlist(
+    settings: Settings,
+    repository: Repository,
+    jd_text: str,
+    *,
+    limit: int | None = None,
+    concurrency: int | None = None,
+) -> AsyncIterator[Screened]:
+    """Rank the stored pool on the skill index, then run the full graph on the best `limit`.
+
+    Shortlisted profiles come from `repository` prefilled, so no extraction is repeated.
+    Indexes are positions in the shortlist, best first, skipping profiles no longer stored.
+    """
+
+    workers = settings.screening_concurrency if concurrency is None else concurrency
+    if workers < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    job_post = await load_job_post(settings, jd_text)
+    candidates = await asyncio.to_thread(
+        get_skill_index(settings).shortlist, job_post, limit=limit or settings.shortlist_size
+    )
+    logger.info("shortlisted %d candidates for %r", len(candidates), job_post.title)
+
+    async def profiles() -> AsyncIterator[CareerProfile]:
+        for candidate in candidates:
+            profile = await repository.get_profile(candidate.profile_id)
+            if profile is None:
+                logger.warning("indexed profile %s is not in the repository", candidate.profile_id)
+                continue
+            yield profile
+
+    async for screened in screen_many(settings, job_post, profiles(), concurrency=workers):
+        yield screened
+
+
+async def screen_many(
+    settings: Settings,
+    job_post: JobPost,
+    resumes: Resumes,
+    *,
+    concurrency: int,
+) -> AsyncIterator[Screened]:
+    """Fan an already parsed job post out to `resumes` with at most `concurrency` in flight."""
+
+    warm_up(settings)
+    graph = build_screening_graph(settings)  # compiled once, shared by every worker
+
+    #both queues bounded, a slow source or a slow consumer applies backpressure instead
+    #of buffering thousands of resumes or results
+    pending: asyncio.Queue[object] = asyncio.Queue(maxsize=concurrency)
+    results: asyncio.Queue[object] = asyncio.Queue(maxsize=concurrency)
+
+    async def feed() -> None:
+        #one reader, an async source cannot be iterated by several workers at once
+        index = 0
+        async for resume in _aiter(resumes):
+            await pending.put((index, resume))
+            index += 1
+        for _ in range(concurrency):
+            await pending.put(_DONE)
+
+    async def run(resume: Resume, screening_id: str) -> AnalysisResult:
+        match resume:
+            case CareerProfile():
+                return await screen(
+                    settings,
+                    profile=resume,
+                    job_post=job_post,
+                    graph=graph,
+                    screening_id=screening_id,
+                )
+            case ResumeDocument():
+                return await screen(
+                    settings,
+                    resume_text=resume.text,
+                    resume_source=resume.source,
+                    job_post=job_post,
+                    graph=graph,
+                    screening_id=screening_id,
+                )
+            case _:
+                return await screen(
+                    settings,
+                    resume_text=str(resume),
+                    job_post=job_post,
+                    graph=graph,
+                    screening_id=screening_id,
+                )
+
+    async def worker() -> None:
+        while (item := await pending.get()) is not _DONE:
+            index, resume = item  # type: ignore[misc]  # (index, resume) until the sentinel
+            screening_id = uuid.uuid4().hex
+            outcome: AnalysisResult | Exception
+            try:
+                outcome = await run(resume, screening_id)
+            except Exception as exc:
+                logger.exception("screening %d (%s) failed", index, getattr(resume, "path", "text"))
+                outcome = exc
+            await results.put(Screened(index, screening_id, outcome))
+
+    async def close_when_drained() -> None:
+        try:
+            await asyncio.gather(feeder, *workers)
+        finally:
+            await results.put(_DONE)  # also when the source raised, so the consumer wakes up
+
+    feeder = asyncio.create_task(feed())
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    closer = asyncio.create_task(close_when_drained())
+    screened = failed = 0
+    try:
+        while (item := await results.get()) is not _DONE:
+            assert isinstance(item, Screened)
+            screened += 1
+            failed += not item.ok
+            yield item
+        if error := feeder.exception():
+            raise error
+    finally:
+        #consumer stopped early or was cancelled, do not leave screenings running behind it
+        tasks = (feeder, *workers, closer)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    logger.info(
+        "batch screened %d candidates against %r, %d failed", screened, job_post.title, failed
+    )
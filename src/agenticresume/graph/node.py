@@ -4,31 +4,69 @@ Graph nodes, acts as adapters for calling the existing agents
 a node is a defined action, reading what it needs from the state, and writing what it produces back to the state.
 """
 
+import asyncio
 import logging
 
 from agenticresume.agents.auditor import audit
 from agenticresume.agents.enthusiast import run_enthusiast
-from agenticresume.agents.extractor import extract_profile
+from agenticresume.agents.extractor import EXTRACTOR_VERSION, extract_profile
 from agenticresume.agents.jobpost import parse_job_post
+from agenticresume.agents.judge import run_panel
 from agenticresume.agents.mapping import to_career_profile, to_job_post
 from agenticresume.agents.pragmatist import run_pragmatist
-from agenticresume.agents.recruiter import recommend
+from agenticresume.agents.recruiter import fast_reject, recommend
+from agenticresume.agents.schemas import ExtractionOutput
 from agenticresume.agents.skeptic import run_skeptic
+from agenticresume.domain.models import JobPost
+from agenticresume.domain.routing import RoutingPolicy, Triage
 from agenticresume.graph.state import ScreeningState
+from agenticresume.infra.extractions import get_extraction_store
+from agenticresume.infra.jobstore import get_jobpost_store
 from agenticresume.settings import Settings
 
 logger = logging.getLogger(__name__)
 
 
+async def load_extraction(settings: Settings, resume_text: str, source: bytes) -> ExtractionOutput:
+    """The stored extraction of this exact document, extracting only on a miss."""
+
+    store = get_extraction_store(settings)
+    if store is not None and (
+        stored := await asyncio.to_thread(store.get, source, EXTRACTOR_VERSION)
+    ):
+        logger.info("reused stored extraction for %r", stored.full_name or "unknown")
+        return stored
+
+    extraction = await extract_profile(settings, resume_text)
+    if store is not None:
+        await asyncio.to_thread(store.put, source, EXTRACTOR_VERSION, extraction)
+    return extraction
+
+
 async def extract_node(state: ScreeningState, *, settings: Settings) -> dict:
-    extraction = await extract_profile(settings, state["resume_text"])
-    profile = to_career_profile(extraction, source_document="resume")
+    source = state.get("resume_source") or state["resume_text"].encode()
+    extraction = await load_extraction(settings, state["resume_text"], source)
+    profile = to_career_profile(extraction, source_document="resume", trusted=True)
     return {"profile": profile}
 
 
+async def load_job_post(settings: Settings, jd_text: str) -> JobPost:
+    """The stored JobPost for this JD or a near-duplicate repost, parsing only on a miss."""
+
+    store = get_jobpost_store(settings)
+    if store is not None and (stored := await asyncio.to_thread(store.lookup, jd_text)):
+        logger.info("reused stored job post %r", stored.title)
+        return stored
+
+    parsed = await parse_job_post(settings, jd_text)
+    job_post = to_job_post(parsed, raw_text=jd_text, trusted=True)
+    if store is not None:
+        await asyncio.to_thread(store.put, jd_text, job_post)
+    return job_post
+
+
 async def parse_node(state: ScreeningState, *, settings: Settings) -> dict:
-    parsed = await parse_job_post(settings, state["jd_text"])
-    return {"job_post": to_job_post(parsed, raw_text=state["jd_text"])}
+    return {"job_post": await load_job_post(settings, state["jd_text"])}
 
 
 async def audit_node(state: ScreeningState, *, settings: Settings) -> dict:
@@ -51,12 +89,43 @@ async def pragmatist_node(state: ScreeningState, *, settings: Settings) -> dict:
     return {"assessments": [a]}
 
 
+async def panel_node(state: ScreeningState, *, settings: Settings) -> dict:
+    assessments = await run_panel(settings, state["job_post"], state["coverages"])
+    return {"assessments": assessments}  # all 3 at once, same reducer
+
+
+def routing_policy(settings: Settings) -> RoutingPolicy:
+    return RoutingPolicy(
+        reject_unmet_must_haves=settings.fast_reject_unmet_must_haves,
+        reject_below_score=settings.fast_reject_below_score,
+        skip_panel_unmet_must_haves=settings.skip_panel_unmet_must_haves,
+        skip_panel_below_score=settings.skip_panel_below_score,
+    )
+
+
+def triage(state: ScreeningState, *, settings: Settings) -> Triage:
+    """Where the screening goes after the audit, read off the deterministic signals."""
+    policy = routing_policy(settings)
+    return policy.triage(tuple(state["coverages"]), state["job_post"].requirements)
+
+
 async def recruiter_node(state: ScreeningState, *, settings: Settings) -> dict:
     result = await recommend(
         settings,
         state["profile"],
         state["job_post"],
         state["coverages"],
-        state["assessments"],# merged list of all 3, thanks to the reducer + fan-in
+        state.get("assessments", []),# merged list of all 3, thanks to the reducer + fan-in
     )
-    return {"result": result}
\ No newline at end of file
+    if not state.get("assessments"):
+        #routed past the panel, say so in the record
+        reason = triage(state, settings=settings).reason
+        result = result.model_copy(
+            update={"rationale": f"{result.rationale} (Fast path: panel skipped, {reason}.)"}
+        )
+    return {"result": result}
+
+
+async def fast_reject_node(state: ScreeningState, *, settings: Settings) -> dict:
+    reason = triage(state, settings=settings).reason
+    return {"result": fast_reject(state["profile"], state["job_post"], state["coverages"], reason)}
\ No newline at end of file
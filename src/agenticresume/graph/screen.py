@@ -0,0 +1,230 @@
+"""
+Screening graph, wires the nodes together
+
+extract and parse fan out from START, the audit joins them, the three judges fan out
+from the audit (or run as one panel call) and the recruiter joins them back into one
+AnalysisResult. The routing policy can send a settled screening past the panel, or
+straight to a deterministic reject.
+
+With checkpoints on, every screening is a graph thread keyed by its screening id:
+running a screening id that failed part way resumes it instead of starting over.
+"""
+
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+from agenticresume.agents.schemas import (
+    AssessmentOutput,
+    AuditorOutput,
+    ExtractionOutput,
+    JobPostOutput,
+    PanelOutput,
+    RecruiterOutput,
+)
+from agenticresume.domain.models import AnalysisResult, CareerProfile, JobPost
+from agenticresume.graph.node import (
+    audit_node,
+    enthusiast_node,
+    extract_node,
+    fast_reject_node,
+    panel_node,
+    parse_node,
+    pragmatist_node,
+    recruiter_node,
+    skeptic_node,
+    triage,
+)
+from agenticresume.graph.state import ScreeningState
+from agenticresume.infra.checkpoint import get_checkpointer
+from agenticresume.infra.llm import warm_clients
+from agenticresume.infra.telemetry import get_telemetry
+from agenticresume.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+JUDGES = ("skeptic", "enthusiast", "pragmatist")
+
+#every wire schema a screening asks the model for
+SCREENING_SCHEMAS = (
+    ExtractionOutput, JobPostOutput, AuditorOutput, AssessmentOutput, RecruiterOutput
+)
+
+
+def warm_up(settings: Settings) -> None:
+    """Build the shared clients for every screening call before the first request needs them."""
+    panel = (PanelOutput,) if settings.judge_mode == "panel" else ()
+    warm_clients(settings, (*SCREENING_SCHEMAS, *panel))
+
+
+def _route_inputs(state: ScreeningState) -> list[str]:
+    """Only run the front nodes whose output was not handed in prefilled."""
+    todo = [
+        node
+        for node, produced in (("extract", "profile"), ("parse", "job_post"))
+        if produced not in state
+    ]
+    return todo or ["audit"]
+
+
+def _route_after_audit(state: ScreeningState, *, settings: Settings) -> list[str]:
+    """Full panel, straight to the recruiter, or a deterministic reject."""
+    match triage(state, settings=settings).route:
+        case "reject":
+            return ["fast_reject"]
+        case "recruiter":
+            return ["recruiter"]
+        case "panel":
+            return ["panel"] if settings.judge_mode == "panel" else list(JUDGES)
+
+
+Node = Callable[..., Awaitable[dict]]
+
+
+def _timed(
+    name: str, node: Node, settings: Settings
+) -> Callable[[ScreeningState], Awaitable[dict]]:
+    """Bind `settings` into `node`, record its wall time under `timings` and as a telemetry span."""
+
+    async def run(state: ScreeningState) -> dict:
+        telemetry = get_telemetry(settings)
+        start = time.perf_counter()
+        if telemetry is None:
+            update = await node(state, settings=settings)
+        else:
+            with telemetry.node(name, state.get("screening_id")):
+                update = await node(state, settings=settings)
+        return {**update, "timings": {name: time.perf_counter() - start}}
+
+    return run
+
+
+def build_screening_graph(settings: Settings) -> CompiledStateGraph:
+    """Compile the screening graph with `settings` bound into every node"""
+
+    graph = StateGraph(ScreeningState)
+
+    def add(name: str, node: Node) -> None:
+        graph.add_node(name, _timed(name, node, settings))
+
+    add("extract", extract_node)
+    add("parse", parse_node)
+    add("audit", audit_node)
+    add("recruiter", recruiter_node)
+    add("fast_reject", fast_reject_node)
+
+    #a prefilled profile or job post skips its node, both run in the same superstep otherwise
+    graph.add_conditional_edges(START, _route_inputs, ["extract", "parse", "audit"])
+
+    #separate edges rather than a join, so audit still fires when only one side ran
+    graph.add_edge("extract", "audit")
+    graph.add_edge("parse", "audit")
+
+    #the routing policy may skip the panel, or the recruiter too, once coverage settles it
+    judges = ["panel"] if settings.judge_mode == "panel" else list(JUDGES)
+    graph.add_conditional_edges(
+        "audit",
+        partial(_route_after_audit, settings=settings),
+        [*judges, "recruiter", "fast_reject"],
+    )
+
+    if settings.judge_mode == "panel":
+        #one call returns all three assessments
+        add("panel", panel_node)
+        graph.add_edge("panel", "recruiter")
+    else:
+        add("skeptic", skeptic_node)
+        add("enthusiast", enthusiast_node)
+        add("pragmatist", pragmatist_node)
+        graph.add_edge(list(JUDGES), "recruiter")  # fan-in, waits for all three
+    graph.add_edge("recruiter", END)
+    graph.add_edge("fast_reject", END)
+
+    return graph.compile(checkpointer=get_checkpointer(settings))
+
+
+def initial_state(
+    *,
+    resume_text: str = "",
+    resume_source: bytes | None = None,
+    jd_text: str = "",
+    profile: CareerProfile | None = None,
+    job_post: JobPost | None = None,
+    screening_id: str | None = None,
+) -> ScreeningState:
+    """Graph input for one screening, a given profile or job post is prefilled."""
+
+    state: ScreeningState = {
+        "resume_text": resume_text,
+        "jd_text": jd_text,
+        "screening_id": screening_id or uuid.uuid4().hex,
+    }
+    if resume_source is not None:
+        state["resume_source"] = resume_source
+    if profile is not None:
+        state["profile"] = profile
+    if job_post is not None:
+        state["job_post"] = job_post
+    return state
+
+
+async def start_run(
+    graph: CompiledStateGraph, state: ScreeningState
+) -> tuple[ScreeningState | None, RunnableConfig]:
+    """Graph input and config for a screening. The input is None when the screening id has a
+    checkpoint that stopped part way, which resumes it from the last completed node."""
+
+    config: RunnableConfig = {"configurable": {"thread_id": state["screening_id"]}}
+    if graph.checkpointer is None:
+        return state, config
+    snapshot = await graph.aget_state(config)
+    if snapshot.next:
+        logger.info("resuming screening %s at %s", state["screening_id"], ", ".join(snapshot.next))
+        return None, config
+    if snapshot.values:
+        #a finished run that was never cleared, the reducers would add to its assessments
+        await graph.checkpointer.adelete_thread(state["screening_id"])
+    return state, config
+
+
+async def finish_run(graph: CompiledStateGraph, screening_id: str) -> None:
+    """Drop a finished screening's checkpoints, they are only kept to resume failures."""
+    if graph.checkpointer is not None:
+        await graph.checkpointer.adelete_thread(screening_id)
+
+
+async def screen(
+    settings: Settings,
+    *,
+    resume_text: str = "",
+    resume_source: bytes | None = None,
+    jd_text: str = "",
+    profile: CareerProfile | None = None,
+    job_post: JobPost | None = None,
+    graph: CompiledStateGraph | None = None,
+    screening_id: str | None = None,
+) -> AnalysisResult:
+    """Run one screening. A given profile or job post is reused instead of re-parsed.
+
+    Rerunning the `screening_id` of a screening that failed resumes it, the inputs given
+    again are ignored in favour of the checkpointed state."""
+
+    state = initial_state(
+        resume_text=resume_text,
+        resume_source=resume_source,
+        jd_text=jd_text,
+        profile=profile,
+        job_post=job_post,
+        screening_id=screening_id,
+    )
+    graph = graph or build_screening_graph(settings)
+    graph_input, config = await start_run(graph, state)
+    final = await graph.ainvoke(graph_input, config)
+    await finish_run(graph, state["screening_id"])
+    return final["result"]
@@ -20,10 +20,13 @@ class ScreeningState(TypedDict, total=False):
     #inputs
     resume_text: str
     jd_text: str
+    resume_source: bytes  # original document bytes, keys the extraction store; defaults to the text
+    screening_id: str     # keys telemetry spans, generated when not given
 
     #produced
     profile: CareerProfile                                    # extract node
     job_post: JobPost                                         # parse node
     coverages: list[Coverage]                                # audit node
     assessments: Annotated[list[Assessment], operator.add]   # 3 judges, pass to the add (concatenator) accumulator, side note: append wont work since the LangGraph Reducer sees it as null
-    result: AnalysisResult                                   # recruiter node
\ No newline at end of file
+    result: AnalysisResult                                   # recruiter node
+    timings: Annotated[dict[str, float], operator.or_]       # seconds per node, one entry per node
\ No newline at end of file
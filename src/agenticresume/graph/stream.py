@@ -0,0 +1,116 @@
+"""
+Streaming screenings, progressive results
+
+Runs the same screening graph as `screen`, but yields each piece as soon as its
+node finishes: the job post and profile, the coverages, every judge's assessment
+as it lands, and finally the AnalysisResult. Each event carries the wall time of
+the node that produced it and the time since the screening started.
+"""
+
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from langgraph.graph.state import CompiledStateGraph
+
+from agenticresume.domain.models import AnalysisResult, Assessment, CareerProfile, Coverage, JobPost
+from agenticresume.graph.screen import build_screening_graph, finish_run, initial_state, start_run
+from agenticresume.settings import Settings
+
+#prefilled inputs are reported as if produced by this pseudo-node, in no time
+INPUT = "input"
+
+
+@dataclass(frozen=True)
+class ScreeningEvent:
+    node: str  # graph node that produced the payload
+    duration: float  # that node's wall time, seconds
+    elapsed: float  # seconds since the screening started
+
+
+@dataclass(frozen=True)
+class JobPostReady(ScreeningEvent):
+    job_post: JobPost
+
+
+@dataclass(frozen=True)
+class ProfileReady(ScreeningEvent):
+    profile: CareerProfile
+
+
+@dataclass(frozen=True)
+class CoveragesReady(ScreeningEvent):
+    coverages: list[Coverage]
+
+
+@dataclass(frozen=True)
+class AssessmentReady(ScreeningEvent):
+    assessment: Assessment
+
+
+@dataclass(frozen=True)
+class ScreeningDone(ScreeningEvent):
+    result: AnalysisResult
+    timings: dict[str, float] = field(default_factory=dict)  # every node that ran, seconds
+
+
+def _events(node: str, update: dict, elapsed: float) -> list[ScreeningEvent]:
+    duration = update.get("timings", {}).get(node, 0.0)
+    events: list[ScreeningEvent] = []
+    if "job_post" in update:
+        events.append(JobPostReady(node, duration, elapsed, update["job_post"]))
+    if "profile" in update:
+        events.append(ProfileReady(node, duration, elapsed, update["profile"]))
+    if "coverages" in update:
+        events.append(CoveragesReady(node, duration, elapsed, update["coverages"]))
+    #a panel call returns all three at once, still one event per assessment
+    events.extend(
+        AssessmentReady(node, duration, elapsed, a) for a in update.get("assessments", ())
+    )
+    return events
+
+
+async def stream_screening(
+    settings: Settings,
+    *,
+    resume_text: str = "",
+    resume_source: bytes | None = None,
+    jd_text: str = "",
+    profile: CareerProfile | None = None,
+    job_post: JobPost | None = None,
+    graph: CompiledStateGraph | None = None,
+    screening_id: str | None = None,
+) -> AsyncIterator[ScreeningEvent]:
+    """Run one screening, yielding each result as its node finishes, ScreeningDone last."""
+
+    state = initial_state(
+        resume_text=resume_text,
+        resume_source=resume_source,
+        jd_text=jd_text,
+        profile=profile,
+        job_post=job_post,
+        screening_id=screening_id,
+    )
+    graph = graph or build_screening_graph(settings)
+    graph_input, config = await start_run(graph, state)
+    start = time.perf_counter()
+
+    #a resumed screening starts from its checkpoint, its earlier nodes are not replayed
+    if graph_input is not None:
+        for event in _events(INPUT, dict(graph_input), 0.0):
+            yield event
+
+    timings: dict[str, float] = {}
+    async for chunk in graph.astream(graph_input, config, stream_mode="updates"):
+        elapsed = time.perf_counter() - start
+        for node, update in chunk.items():
+            if not update:
+                continue
+            timings |= update.get("timings", {})
+            for event in _events(node, update, elapsed):
+                yield event
+            if "result" in update:
+                await finish_run(graph, state["screening_id"])
+                yield ScreeningDone(
+                    node, timings.get(node, 0.0), elapsed, update["result"], dict(timings)
+                )
@@ -0,0 +1,135 @@
+"""
+Screening worker, drains the durable job queue
+
+A long-running loop per process: claims as many jobs as it has free graph slots,
+screens them on one warm graph and one set of shared clients, renews each job's
+lease while it runs and writes the AnalysisResult back to the queue. Throughput is
+bounded by the slots and the provider scheduler; more capacity is more processes
+pointed at the same queue file.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from agenticresume.graph.screen import build_screening_graph, finish_run, screen, warm_up
+from agenticresume.infra.pdf import extraction_pool, get_pdf_text_cache, pdf_text
+from agenticresume.infra.queue import Job, JobQueue, get_job_queue, worker_name
+from agenticresume.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(
+    settings: Settings,
+    *,
+    queue: JobQueue | None = None,
+    concurrency: int | None = None,
+    name: str | None = None,
+    stop: asyncio.Event | None = None,
+    drain: bool = False,
+) -> int:
+    """Claim and screen jobs until `stop` is set, or with `drain` until the queue is empty.
+
+    Jobs in flight when `stop` is set are finished first. If the worker is cancelled they
+    are abandoned and picked up again once their lease lapses. Returns the jobs completed."""
+
+    queue = queue or get_job_queue(settings)
+    limit = settings.screening_concurrency if concurrency is None else concurrency
+    if limit < 1:
+        raise ValueError("concurrency must be at least 1")
+    name = name or worker_name()
+    stop = stop or asyncio.Event()
+    poll = settings.worker_poll_seconds
+
+    warm_up(settings)
+    graph = build_screening_graph(settings)
+    text_cache = get_pdf_text_cache(settings)
+    completed = 0
+
+    async def load_resume(ref: str, pool: ProcessPoolExecutor) -> tuple[str, bytes]:
+        path = Path(ref)
+        data = await asyncio.to_thread(path.read_bytes)
+        if path.suffix.lower() != ".pdf":
+            return data.decode(), data
+        text = await pdf_text(data, pool, text_cache)
+        if not text:
+            raise ValueError(f"{ref} has no text layer")
+        return text, data
+
+    async def keep_leased(job: Job) -> None:
+        while True:
+            await asyncio.sleep(queue.visibility_timeout / 3)
+            if not await asyncio.to_thread(queue.extend, job.id, name):
+                logger.warning("lost the lease on job %d", job.id)
+                return
+
+    async def run(job: Job, pool: ProcessPoolExecutor) -> None:
+        nonlocal completed
+        lease = asyncio.create_task(keep_leased(job))
+        try:
+            resume_text, source = await load_resume(job.resume_ref, pool)
+            jd_text = await asyncio.to_thread(Path(job.jd_ref).read_text)
+            result = await screen(
+                settings,
+                resume_text=resume_text,
+                resume_source=source,
+                jd_text=jd_text,
+                graph=graph,
+                screening_id=queue.thread_id(job.id),
+            )
+        except Exception as exc:
+            logger.exception("job %d failed on attempt %d", job.id, job.attempts)
+            error = f"{type(exc).__name__}: {exc}"
+            if await asyncio.to_thread(queue.fail, job.id, name, error):
+                #no attempt is left to resume it, a retry from the CLI starts over
+                await finish_run(graph, queue.thread_id(job.id))
+            return
+        finally:
+            lease.cancel()
+
+        if await asyncio.to_thread(queue.complete, job.id, name, result.model_dump_json()):
+            completed += 1
+            logger.info("job %d done: %s (%.2f)", job.id, result.decision, result.score)
+        else:
+            logger.warning(
+                "job %d finished after its lease passed to another worker, result dropped", job.id
+            )
+
+    in_flight: set[asyncio.Task[None]] = set()
+    pool = extraction_pool(settings)
+    try:
+        while not stop.is_set():
+            for job_id in await asyncio.to_thread(queue.expire):
+                logger.warning("job %d lost its lease on the last attempt, failed", job_id)
+                await finish_run(graph, queue.thread_id(job_id))
+            free = limit - len(in_flight)
+            jobs = await asyncio.to_thread(queue.claim, name, free) if free else []
+            in_flight |= {asyncio.create_task(run(job, pool)) for job in jobs}
+
+            if not in_flight:
+                if drain:
+                    break
+                #idle, poll again unless told to stop first
+                try:
+                    await asyncio.wait_for(stop.wait(), poll)
+                except TimeoutError:
+                    pass
+                continue
+            if jobs and len(in_flight) < limit:
+                continue  # the queue had work, claim the remaining slots straight away
+
+            _, in_flight = await asyncio.wait(
+                in_flight, timeout=poll, return_when=asyncio.FIRST_COMPLETED
+            )
+    except asyncio.CancelledError:
+        for task in in_flight:
+            task.cancel()
+        raise
+    finally:
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        #joining the worker processes blocks, keep it off the event loop
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    return completed
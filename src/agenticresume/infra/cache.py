@@ -0,0 +1,195 @@
+"""
+Content-addressed LLM response cache
+
+Keys hash everything that can change a structured answer (provider, model,
+temperature, schema, system prompt, user content), values are the validated
+schema instance as JSON. Backed by SQLite so separate processes share it.
+
+A lookup is a read only: hit and miss counts and the hits' last-used times are
+kept in memory and written in one transaction with the next put, stats call, or
+at most every few seconds, so concurrent screenings do not queue on the writer
+lock just to read.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from agenticresume.infra.sqlite import connect
+from agenticresume.settings import StoreSettings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_used_at ON entries (used_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0);
+"""
+
+#seconds between flushes of the in-memory counters from lookups alone
+_FLUSH_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@cache
+def _schema_fingerprint(schema: type[BaseModel]) -> str:
+    """JSON schema of the wire model, computed once per class."""
+    return json.dumps(schema.model_json_schema(), sort_keys=True)
+
+
+def cache_key(
+    *,
+    provider: str,
+    model: str,
+    temperature: float,
+    schema: type[BaseModel],
+    system_prompt: str,
+    user_content: str,
+) -> str:
+    """Stable digest of one structured LLM request."""
+
+    material = json.dumps(
+        [provider, model, temperature, _schema_fingerprint(schema), system_prompt, user_content]
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class LLMCache:
+    """Disk-backed response cache with LRU eviction under a size cap and an optional TTL."""
+
+    def __init__(self, path: Path, *, max_bytes: int, ttl_seconds: float | None = None) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        #lookups since the last flush, lookups run on worker threads
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+        self._used: dict[str, float] = {}
+        self._flushed = time.monotonic()
+        with connect(path) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _expired_before(self, now: float) -> float:
+        return now - self.ttl_seconds if self.ttl_seconds is not None else float("-inf")
+
+    def get(self, key: str) -> str | None:
+        """Cached payload for `key`, or None. Counts the hit or miss."""
+
+        now = time.time()
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT payload FROM entries WHERE key = ? AND created_at >= ?",
+                (key, self._expired_before(now)),
+            ).fetchone()
+
+        with self._lock:
+            if row:
+                self._hits += 1
+                self._used[key] = now
+            else:
+                self._misses += 1
+            due = time.monotonic() - self._flushed >= _FLUSH_SECONDS
+        if due:
+            with connect(self.path) as conn:
+                self._flush(conn)
+        return row[0] if row else None
+
+    def _flush(self, conn: sqlite3.Connection) -> None:
+        """Write the pending counts and last-used times in the caller's transaction."""
+
+        with self._lock:
+            hits, misses, used = self._hits, self._misses, self._used
+            self._hits = self._misses = 0
+            self._used = {}
+            self._flushed = time.monotonic()
+        if hits or misses:
+            conn.executemany(
+                "UPDATE counters SET value = value + ? WHERE name = ?",
+                [(hits, "hits"), (misses, "misses")],
+            )
+        if used:
+            conn.executemany(
+                "UPDATE entries SET used_at = MAX(used_at, ?) WHERE key = ?",
+                [(at, key) for key, at in used.items()],
+            )
+
+    def put(self, key: str, payload: str) -> None:
+        """Store `payload`, then evict expired and least recently used entries over the cap."""
+
+        now = time.time()
+        with connect(self.path) as conn:
+            self._flush(conn)  # eviction below should see recent hits
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now),
+            )
+            conn.execute("DELETE FROM entries WHERE created_at < ?", (self._expired_before(now),))
+
+            (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+            if total > self.max_bytes:
+                #walk oldest-used first, dropping until we are back under the cap
+                overflow = total - self.max_bytes
+                victims: list[str] = []
+                for victim, size in conn.execute("SELECT key, size FROM entries ORDER BY used_at"):
+                    if overflow <= 0:
+                        break
+                    victims.append(victim)
+                    overflow -= size
+                conn.executemany("DELETE FROM entries WHERE key = ?", [(v,) for v in victims])
+
+    def stats(self) -> CacheStats:
+        with connect(self.path) as conn:
+            self._flush(conn)
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return CacheStats(counters["hits"], counters["misses"], entries, size)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with connect(self.path) as conn:
+            self._flush(conn)
+            conn.execute("DELETE FROM entries")
+            conn.execute("UPDATE counters SET value = 0")
+
+
+@cache
+def _open_cache(path: Path, max_bytes: int, ttl_seconds: float | None) -> LLMCache:
+    return LLMCache(path, max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+
+
+def get_llm_cache(settings: StoreSettings) -> LLMCache | None:
+    """The response cache configured by `settings`, opened once per process; None if disabled."""
+
+    if not settings.llm_cache_enabled:
+        return None
+    ttl = settings.llm_cache_ttl_days * 86400 if settings.llm_cache_ttl_days is not None else None
+    return _open_cache(settings.llm_cache_path, settings.llm_cache_max_mb * 1024 * 1024, ttl)
@@ -0,0 +1,369 @@
+"""
+Durable screening checkpoints, so a failed screening resumes where it stopped
+
+A LangGraph checkpoint saver over one SQLite file. The screening graph saves its
+state after every superstep under the screening id as thread id; rerunning that
+screening id after a failure (a transient provider error in the recruiter, say)
+continues from the last completed node instead of paying for the extraction,
+parse, audit and judge calls again. Nodes that finished in a superstep whose
+sibling failed are kept as pending writes and are not rerun either.
+
+Channel values are stored once per channel version, so the profile and resume
+bytes are written when they change, not again on every later checkpoint.
+Domain objects round-trip through LangGraph's msgpack serializer, which rebuilds
+them with full validation; only the domain models are allowed back in.
+"""
+
+import asyncio
+import json
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_serializable_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from agenticresume.domain.models import AnalysisResult, Assessment, CareerProfile, Coverage, JobPost
+from agenticresume.infra.sqlite import connect
+from agenticresume.settings import StoreSettings
+
+#the only classes a checkpoint may rebuild, anything else comes back as a plain dict
+STATE_TYPES = (CareerProfile, JobPost, Coverage, Assessment, AnalysisResult)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    task_path TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS threads_updated ON threads (updated_at);
+"""
+
+
+@dataclass(frozen=True)
+class StoredThread:
+    thread_id: str
+    created_at: datetime
+    updated_at: datetime  # the latest checkpoint
+    checkpoints: int
+
+
+def _config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint_id,
+        }
+    }
+
+
+class SqliteCheckpointer(BaseCheckpointSaver[int]):
+    """Checkpoint saver over one SQLite file, safe to share between threads and processes."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(serde=JsonPlusSerializer(allowed_msgpack_modules=STATE_TYPES))
+        self.path = path
+        with connect(path) as conn:
+            conn.executescript(_SCHEMA)
+
+    def threads(self) -> list[StoredThread]:
+        """Threads with a checkpoint, that is screenings that have not finished, oldest first."""
+
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                "SELECT t.thread_id, t.created_at, t.updated_at, COUNT(c.checkpoint_id) "
+                "FROM threads t LEFT JOIN checkpoints c ON c.thread_id = t.thread_id "
+                "GROUP BY t.thread_id ORDER BY t.created_at"
+            ).fetchall()
+        return [
+            StoredThread(
+                thread_id,
+                datetime.fromtimestamp(created, UTC),
+                datetime.fromtimestamp(updated, UTC),
+                count,
+            )
+            for thread_id, created, updated, count in rows
+        ]
+
+    def purge(self, *, older_than: float) -> list[str]:
+        """Drop threads with no checkpoint in the last `older_than` seconds, returns their ids.
+
+        A failed screening nobody reran is only ever removed this way."""
+
+        with connect(self.path) as conn:
+            stale = [
+                thread_id
+                for (thread_id,) in conn.execute(
+                    "SELECT thread_id FROM threads WHERE updated_at < ? ORDER BY thread_id",
+                    (time.time() - older_than,),
+                )
+            ]
+        for thread_id in stale:
+            self.delete_thread(thread_id)
+        return stale
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """The checkpoint `config` names, or the thread's latest one."""
+        return next(self.list(config, limit=1), None)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """Matching checkpoints, newest first."""
+
+        where, params = [], []
+        if config is not None:
+            configurable = config["configurable"]
+            where.append("thread_id = ?")
+            params.append(configurable["thread_id"])
+            if (ns := configurable.get("checkpoint_ns")) is not None:
+                where.append("checkpoint_ns = ?")
+                params.append(ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                where.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            where.append("checkpoint_id < ?")
+            params.append(before_id)
+        for key, value in (filter or {}).items():
+            where.append("json_extract(metadata, ?) = json(?)")
+            params.extend((f"$.{key}", json.dumps(value)))
+
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_id, type, checkpoint, metadata "
+            "FROM checkpoints"
+        )
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY checkpoint_id DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        #read in full before returning, so no connection is held open by a paused iterator
+        found: list[CheckpointTuple] = []
+        with connect(self.path) as conn:
+            rows = conn.execute(query, params).fetchall()
+            for thread_id, ns, checkpoint_id, parent_id, type_, blob, metadata in rows:
+                checkpoint: Checkpoint = self.serde.loads_typed((type_, blob))
+                checkpoint["channel_values"] = self._channel_values(
+                    conn, thread_id, ns, checkpoint["channel_versions"]
+                )
+                writes = conn.execute(
+                    "SELECT task_id, channel, type, value FROM writes "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+                    "ORDER BY task_path, task_id, idx",
+                    (thread_id, ns, checkpoint_id),
+                ).fetchall()
+                found.append(
+                    CheckpointTuple(
+                        config=_config(thread_id, ns, checkpoint_id),
+                        checkpoint=checkpoint,
+                        metadata=json.loads(metadata),
+                        parent_config=_config(thread_id, ns, parent_id) if parent_id else None,
+                        pending_writes=[
+                            (task, ch, self.serde.loads_typed((t, v)))
+                            for task, ch, t, v in writes
+                        ],
+                    )
+                )
+        return iter(found)
+
+    def _channel_values(
+        self, conn: sqlite3.Connection, thread_id: str, ns: str, versions: ChannelVersions
+    ) -> dict[str, Any]:
+        values: dict[str, Any] = {}
+        for channel, version in versions.items():
+            row = conn.execute(
+                "SELECT type, value FROM blobs "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                (thread_id, ns, channel, str(version)),
+            ).fetchone()
+            if row and row[0] != "empty":
+                values[channel] = self.serde.loads_typed(row)
+        return values
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store the checkpoint, and the values of the channels that changed since the last one."""
+
+        configurable = config["configurable"]
+        thread_id, ns = configurable["thread_id"], configurable.get("checkpoint_ns", "")
+        values = checkpoint["channel_values"]
+        #values live in blobs keyed by version, the checkpoint row only points at them
+        type_, blob = self.serde.dumps_typed({**checkpoint, "channel_values": {}})
+        blobs = [
+            (thread_id, ns, channel, str(version), *(
+                self.serde.dumps_typed(values[channel]) if channel in values else ("empty", None)
+            ))
+            for channel, version in new_versions.items()
+        ]
+        now = time.time()
+        with connect(self.path) as conn:
+            conn.execute(
+                "INSERT INTO threads VALUES (?, ?, ?) "
+                "ON CONFLICT (thread_id) DO UPDATE SET updated_at = excluded.updated_at",
+                (thread_id, now, now),
+            )
+            conn.executemany("INSERT OR IGNORE INTO blobs VALUES (?, ?, ?, ?, ?, ?)", blobs)
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    ns,
+                    checkpoint["id"],
+                    configurable.get("checkpoint_id"),  # the checkpoint this one follows
+                    type_,
+                    blob,
+                    json.dumps(get_serializable_checkpoint_metadata(config, metadata)),
+                ),
+            )
+        return _config(thread_id, ns, checkpoint["id"])
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store one task's writes against the checkpoint it ran from."""
+
+        configurable = config["configurable"]
+        key = (
+            configurable["thread_id"],
+            configurable.get("checkpoint_ns", ""),
+            configurable["checkpoint_id"],
+        )
+        rows = [
+            (
+                *key,
+                task_id,
+                task_path,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *self.serde.dumps_typed(value),
+            )
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        #special writes (errors, interrupts) replace their previous value,
+        #regular ones are written once
+        special = all(channel in WRITES_IDX_MAP for channel, _ in writes)
+        verb = "INSERT OR REPLACE" if special else "INSERT OR IGNORE"
+        with connect(self.path) as conn:
+            conn.executemany(f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Drop every checkpoint, value and write of `thread_id`."""
+
+        with connect(self.path) as conn:
+            for table in ("checkpoints", "blobs", "writes", "threads"):
+                conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+
+    #the graph runs async, the SQLite calls go to a thread so they never block the loop
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        found = await asyncio.to_thread(
+            self.list, config, filter=filter, before=before, limit=limit
+        )
+        for item in found:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+@cache
+def _open_checkpointer(path: Path) -> SqliteCheckpointer:
+    return SqliteCheckpointer(path)
+
+
+def get_checkpointer(settings: StoreSettings) -> SqliteCheckpointer | None:
+    """The checkpoint store configured by `settings`, opened once per process; None if disabled."""
+
+    if not settings.checkpoint_enabled:
+        return None
+    return _open_checkpointer(settings.checkpoint_path)
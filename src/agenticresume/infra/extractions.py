@@ -0,0 +1,67 @@
+"""
+Resume extraction store
+
+Keeps each ExtractionOutput keyed by the hash of the source document bytes plus
+the extractor version, so a candidate applying to many roles is extracted once.
+A new prompt or schema changes the version and old entries simply stop matching.
+"""
+
+import hashlib
+import time
+from functools import cache
+from pathlib import Path
+
+from agenticresume.agents.schemas import ExtractionOutput
+from agenticresume.infra.sqlite import connect
+from agenticresume.settings import StoreSettings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    document_hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    extraction TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (document_hash, version)
+);
+"""
+
+
+def document_hash(document: bytes) -> str:
+    return hashlib.sha256(document).hexdigest()
+
+
+class ExtractionStore:
+    """SQLite-backed ExtractionOutput store keyed by document bytes and extractor version."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with connect(path) as conn:
+            conn.executescript(_SCHEMA)
+
+    def get(self, document: bytes, version: str) -> ExtractionOutput | None:
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT extraction FROM extractions WHERE document_hash = ? AND version = ?",
+                (document_hash(document), version),
+            ).fetchone()
+        return ExtractionOutput.model_validate_json(row[0]) if row else None
+
+    def put(self, document: bytes, version: str, extraction: ExtractionOutput) -> None:
+        with connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?)",
+                (document_hash(document), version, extraction.model_dump_json(), time.time()),
+            )
+
+
+@cache
+def _open_store(path: Path) -> ExtractionStore:
+    return ExtractionStore(path)
+
+
+def get_extraction_store(settings: StoreSettings) -> ExtractionStore | None:
+    """The extraction store configured by `settings`, opened once per process; None if disabled."""
+
+    if not settings.extraction_store_enabled:
+        return None
+    return _open_store(settings.extraction_store_path)
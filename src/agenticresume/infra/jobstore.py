@@ -0,0 +1,235 @@
+"""
+Parsed JobPost store
+
+Reposted requisitions reuse the JobPost parsed the first time, requirement IDs
+included. Exact reposts hit on a hash of the normalized text; lightly edited ones
+are found with MinHash signatures over word shingles, bucketed by LSH bands so a
+lookup only compares against likely candidates.
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import struct
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cache
+from pathlib import Path
+
+from agenticresume.domain.models import JobPost, Skill
+from agenticresume.infra.sqlite import connect
+from agenticresume.settings import StoreSettings
+
+_SHINGLE_WORDS = 5
+_BANDS, _ROWS = 32, 4  # 128 hashes, a pair at ~0.9 similarity shares a band almost surely
+_PERMUTATIONS = _BANDS * _ROWS
+_PRIME = (1 << 61) - 1
+
+#fixed seed, signatures must be comparable across processes and runs
+_rng = random.Random(0x5EED)
+_COEFFS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_PERMUTATIONS)]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    key TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    requirements INTEGER NOT NULL,
+    job_post TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS aliases (
+    text_hash TEXT PRIMARY KEY,
+    key TEXT NOT NULL REFERENCES posts (key) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL REFERENCES posts (key) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS bands_lookup ON bands (band, bucket);
+CREATE INDEX IF NOT EXISTS aliases_key ON aliases (key);
+CREATE INDEX IF NOT EXISTS bands_key ON bands (key);
+"""
+
+
+def normalize_jd(text: str) -> str:
+    """Case and whitespace folded JD text, the identity form for exact reuse."""
+    return re.sub(r"\s+", " ", text.strip().lower())
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_jd(text).encode()).hexdigest()
+
+
+def minhash(text: str) -> tuple[int, ...]:
+    """MinHash signature over word shingles of the normalized text."""
+
+    words = re.findall(r"[a-z0-9+#]+", normalize_jd(text))
+    width = min(_SHINGLE_WORDS, len(words)) or 1
+    shingles = {
+        int.from_bytes(
+            hashlib.blake2b(" ".join(words[i : i + width]).encode(), digest_size=8).digest()
+        )
+        for i in range(max(len(words) - width + 1, 1))
+    }
+    return tuple(min((a * s + b) % _PRIME for s in shingles) for a, b in _COEFFS)
+
+
+def similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of the two shingle sets."""
+    return sum(x == y for x, y in zip(left, right, strict=True)) / len(left)
+
+
+def _pack(signature: tuple[int, ...]) -> bytes:
+    return struct.pack(f"<{len(signature)}Q", *signature)
+
+
+def _unpack(blob: bytes) -> tuple[int, ...]:
+    return struct.unpack(f"<{len(blob) // 8}Q", blob)
+
+
+def _buckets(signature: tuple[int, ...]) -> list[tuple[int, str]]:
+    return [
+        (band, _pack(signature[band * _ROWS : (band + 1) * _ROWS]).hex())
+        for band in range(_BANDS)
+    ]
+
+
+def _recanonicalized(job_post: JobPost) -> JobPost:
+    """The job post with skill canonical names under the current alias table, a stored
+    post may predate a change to it."""
+
+    requirements = tuple(
+        r.model_copy(update={"skill": Skill.of(r.skill.display_name)}) if r.skill else r
+        for r in job_post.requirements
+    )
+    return job_post.model_copy(update={"requirements": requirements})
+
+
+@dataclass(frozen=True)
+class StoredJobPost:
+    key: str
+    title: str
+    company: str
+    requirements: int
+    created_at: datetime
+    hits: int
+
+
+class JobPostStore:
+    """SQLite-backed store of parsed job posts with exact and near-duplicate lookup."""
+
+    def __init__(self, path: Path, *, threshold: float) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.path = path
+        self.threshold = threshold
+        with connect(path) as conn:
+            conn.executescript(_SCHEMA)
+
+    def lookup(self, jd_text: str) -> JobPost | None:
+        """The stored JobPost for this text or a near duplicate of it, or None."""
+
+        exact = text_hash(jd_text)
+        with connect(self.path) as conn:
+            row = conn.execute("SELECT key FROM aliases WHERE text_hash = ?", (exact,)).fetchone()
+            key = row[0] if row else self._nearest(conn, minhash(jd_text))
+            if key is None:
+                return None
+
+            if not row:
+                #remember this wording, the next identical repost skips the minhash
+                conn.execute("INSERT OR IGNORE INTO aliases VALUES (?, ?)", (exact, key))
+            conn.execute("UPDATE posts SET hits = hits + 1 WHERE key = ?", (key,))
+            (payload,) = conn.execute("SELECT job_post FROM posts WHERE key = ?", (key,)).fetchone()
+
+        return _recanonicalized(JobPost.model_validate_json(payload))
+
+    def _nearest(self, conn: sqlite3.Connection, signature: tuple[int, ...]) -> str | None:
+        candidates: set[str] = set()
+        for band, bucket in _buckets(signature):
+            candidates.update(
+                k
+                for (k,) in conn.execute(
+                    "SELECT key FROM bands WHERE band = ? AND bucket = ?", (band, bucket)
+                )
+            )
+
+        best, best_score = None, self.threshold
+        for key in candidates:
+            (blob,) = conn.execute("SELECT signature FROM posts WHERE key = ?", (key,)).fetchone()
+            score = similarity(signature, _unpack(blob))
+            if score >= best_score:
+                best, best_score = key, score
+        return best
+
+    def put(self, jd_text: str, job_post: JobPost) -> str:
+        """Store a freshly parsed JobPost under its text, returns its key."""
+
+        key = text_hash(jd_text)
+        signature = minhash(jd_text)
+        with connect(self.path) as conn:
+            conn.execute("DELETE FROM posts WHERE key = ?", (key,))
+            conn.execute(
+                "INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (
+                    key,
+                    job_post.title,
+                    job_post.company,
+                    len(job_post.requirements),
+                    job_post.model_dump_json(),
+                    _pack(signature),
+                    time.time(),
+                ),
+            )
+            conn.execute("INSERT OR REPLACE INTO aliases VALUES (?, ?)", (key, key))
+            conn.executemany(
+                "INSERT INTO bands VALUES (?, ?, ?)",
+                [(band, bucket, key) for band, bucket in _buckets(signature)],
+            )
+        return key
+
+    def entries(self) -> list[StoredJobPost]:
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                "SELECT key, title, company, requirements, created_at, hits "
+                "FROM posts ORDER BY created_at DESC"
+            ).fetchall()
+        return [
+            StoredJobPost(key, title, company, reqs, datetime.fromtimestamp(created, UTC), hits)
+            for key, title, company, reqs, created, hits in rows
+        ]
+
+    def evict(self, key_prefix: str) -> list[str]:
+        """Remove the entries whose key starts with `key_prefix`, returns the removed keys."""
+
+        if not key_prefix:
+            raise ValueError("key prefix must not be empty")
+        with connect(self.path) as conn:
+            keys = [
+                k
+                for (k,) in conn.execute(
+                    "SELECT key FROM posts WHERE substr(key, 1, ?) = ?",
+                    (len(key_prefix), key_prefix),
+                )
+            ]
+            conn.executemany("DELETE FROM posts WHERE key = ?", [(k,) for k in keys])
+        return keys
+
+
+@cache
+def _open_store(path: Path, threshold: float) -> JobPostStore:
+    return JobPostStore(path, threshold=threshold)
+
+
+def get_jobpost_store(settings: StoreSettings) -> JobPostStore | None:
+    """The job post store configured by `settings`, opened once per process; None if disabled."""
+
+    if not settings.jobpost_store_enabled:
+        return None
+    return _open_store(settings.jobpost_store_path, settings.jobpost_similarity_threshold)
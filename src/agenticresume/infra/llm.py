@@ -5,15 +5,25 @@ Understands provider, able to access settins
 Use to create any agent to abstract away the provider in use
 """
 
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Sequence
+from contextlib import nullcontext
 from typing import Any, TypeVar
 
 from langchain_core.language_models import BaseChatModel, LanguageModelInput
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import Runnable
 from pydantic import BaseModel, SecretStr
 
+from agenticresume.infra.cache import cache_key, get_llm_cache
+from agenticresume.infra.ratelimit import LatencyTracker, estimate_tokens, get_scheduler
+from agenticresume.infra.telemetry import get_telemetry
 from agenticresume.settings import Settings
 
+logger = logging.getLogger(__name__)
+
 
 #cool typevar usage, since were removing the llm invoke from agents, we need to make it schema agnostic
 #serves as a "whatever fills me in" typevar, so we can use it to type the output of the llm invoke
@@ -43,6 +53,7 @@ def build_chat_model(settings: Settings) -> BaseChatModel:
             return ChatGoogleGenerativeAI(
                 model=model,
                 temperature=temperature,
+                max_retries=0,  # retries belong to the scheduler, it has to see the 429s
                 google_api_key=_require(settings.google_api_key, "google"),
             )
         
@@ -52,6 +63,7 @@ def build_chat_model(settings: Settings) -> BaseChatModel:
             return ChatOpenAI(
                 model=model,
                 temperature=temperature,
+                max_retries=0,
                 api_key=_require(settings.openai_api_key, "openai"),
             )
         
@@ -63,6 +75,7 @@ def build_chat_model(settings: Settings) -> BaseChatModel:
             return ChatAnthropic(  # pyright: ignore[reportCallIssue]
                 model=model,  # pyright: ignore[reportCallIssue]
                 temperature=temperature,
+                max_retries=0,
                 api_key=_require(settings.anthropic_api_key, "anthropic"),
                 max_tokens=4096,  # pyright: ignore[reportCallIssue]  # anthropic requires an explicit cap
             )
@@ -73,25 +86,203 @@ def build_chat_model(settings: Settings) -> BaseChatModel:
             return ChatGroq(
                 model=model,  # type: ignore[call-arg]  # groq aliases model->model_name; runtime is fine
                 temperature=temperature,
+                max_retries=0,
                 api_key=_require(settings.groq_api_key, "groq"),
             )
         case _:  # pragma: no cover - Literal makes this exhaustive
             raise ValueError(f"unsupported provider: {settings.llm_provider}")
 
-def build_extractor(settings: Settings, schema: type[BaseModel]) -> Runnable[LanguageModelInput, dict[str, Any] | BaseModel]:
-    """A chat model constrained to emit `schema`."""
+StructuredRunnable = Runnable[LanguageModelInput, dict[str, Any] | BaseModel]
+
+#process-wide client registry, building a client opens a fresh connection pool and the
+#structured output wrapper re-converts the schema, so both are built once and shared
+_chat_models: dict[tuple[str, str, float], BaseChatModel] = {}
+_extractors: dict[tuple[str, str, float, type[BaseModel]], StructuredRunnable] = {}
+
+
+def _client_key(settings: Settings) -> tuple[str, str, float]:
+    return (settings.llm_provider, settings.llm_model, settings.llm_temperature)
+
+
+def shared_chat_model(settings: Settings) -> BaseChatModel:
+    """The configured chat model, built on first use and reused by every caller after."""
+
+    key = _client_key(settings)
+    model = _chat_models.get(key)
+    if model is None:
+        model = _chat_models[key] = build_chat_model(settings)
+    return model
+
+
+def register_chat_model(settings: Settings, model: BaseChatModel) -> None:
+    """Use `model` as the client for `settings`' provider and model, e.g. a fake offline."""
+
+    key = _client_key(settings)
+    _chat_models[key] = model
+    for extractor_key in [k for k in _extractors if k[:3] == key]:
+        del _extractors[extractor_key]
 
-    #with_structured_output guarantees that the model explicitly reads the schema given and uses that for output
-    #handy since it also parses it back into the wire schema
-    return build_chat_model(settings).with_structured_output(schema)
+
+def build_extractor(settings: Settings, schema: type[BaseModel]) -> StructuredRunnable:
+    """A chat model constrained to emit `schema`, one per provider, model, temperature, schema."""
+
+    key = (*_client_key(settings), schema)
+    runnable = _extractors.get(key)
+    if runnable is None:
+        #with_structured_output guarantees that the model explicitly reads the schema given
+        #and uses that for output
+        #handy since it also parses it back into the wire schema. include_raw keeps the provider
+        #message alongside the parse, its usage metadata is where the token counts are
+        runnable = _extractors[key] = shared_chat_model(settings).with_structured_output(
+            schema, include_raw=True
+        )
+    return runnable
+
+
+def warm_clients(settings: Settings, schemas: Iterable[type[BaseModel]]) -> None:
+    """Build the client and every structured runnable up front, off the request path."""
+    for schema in schemas:
+        build_extractor(settings, schema)
+
+
+def clear_clients() -> None:
+    """Forget every registered client, the next call rebuilds from settings."""
+    _extractors.clear()
+    _chat_models.clear()
 
 #typevar allows us to use this function with any schema, and it will return the correct type
 async def invoke_structured(settings: Settings,schema: type[SchemaT],system_prompt: str,user_content: str,) -> SchemaT:
-    """Call the model with a system prompt and user content, return a `schema` instance."""
+    """Call the model with a system prompt and user content, return a `schema` instance.
+
+    Identical requests are answered from the response cache without a network round trip."""
+
+    llm_cache = get_llm_cache(settings)
+    key = ""
+    if llm_cache is not None:
+        key = cache_key(
+            provider=settings.llm_provider,
+            model=settings.llm_model,
+            temperature=settings.llm_temperature,
+            schema=schema,
+            system_prompt=system_prompt,
+            user_content=user_content,
+        )
+        #sqlite is blocking, keep it off the event loop
+        cached = await asyncio.to_thread(llm_cache.get, key)
+        if cached is not None:
+            return schema.model_validate_json(cached)
+
+    messages = [SystemMessage(content=system_prompt), HumanMessage(content=user_content)]
+    result = await _hedged(settings, schema, messages, estimate_tokens(system_prompt, user_content))
+
+    #cached under the primary's key whichever provider answered, the next caller wants it either way
+    if llm_cache is not None:
+        await asyncio.to_thread(llm_cache.put, key, result.model_dump_json())
+    return result
+
+
+#recent latencies per (provider, model, schema), extraction and judging differ by an order
+#of magnitude
+_latencies: dict[tuple[str, str, type[BaseModel]], LatencyTracker] = {}
+
+
+def _tracker(settings: Settings, schema: type[BaseModel]) -> LatencyTracker:
+    key = (settings.llm_provider, settings.llm_model, schema)
+    tracker = _latencies.get(key)
+    if tracker is None:
+        tracker = _latencies[key] = LatencyTracker()
+    return tracker
+
+
+async def _call_model[SchemaT: BaseModel](
+    settings: Settings, schema: type[SchemaT], messages: Sequence[BaseMessage], tokens: int
+) -> SchemaT:
     model = build_extractor(settings, schema)
-    result = await model.ainvoke(
-        [SystemMessage(content=system_prompt), HumanMessage(content=user_content)]
+    tracker = _tracker(settings, schema)
+    telemetry = get_telemetry(settings)
+    recording = (
+        telemetry.llm_call(schema.__name__, settings.llm_provider, settings.llm_model)
+        if telemetry is not None
+        else nullcontext()
     )
-    if not isinstance(result, schema):
-        raise TypeError(f"model returned {type(result).__name__}, expected {schema.__name__}")
-    return result
\ No newline at end of file
+    start = time.monotonic()
+    with recording as span:
+        try:
+            #admitted by the shared scheduler, which keeps the provider under quota and retries 429s
+            out = await get_scheduler(settings).run(
+                lambda: model.ainvoke(messages), tokens=tokens, kind=schema.__name__
+            )
+        except asyncio.CancelledError:
+            #a call that lost the hedge still took at least this long,
+            #dropping it would bias the window fast
+            tracker.record(time.monotonic() - start)
+            raise
+        if span is not None:
+            usage = getattr(out["raw"], "usage_metadata", None) or {}
+            span.input_tokens = usage.get("input_tokens", 0)
+            span.output_tokens = usage.get("output_tokens", 0)
+
+        if out["parsing_error"] is not None:
+            raise out["parsing_error"]
+        result = out["parsed"]
+        if not isinstance(result, schema):
+            raise TypeError(f"model returned {type(result).__name__}, expected {schema.__name__}")
+    tracker.record(time.monotonic() - start)
+    return result
+
+
+def _hedge_delay(settings: Settings, schema: type[BaseModel]) -> float | None:
+    """Seconds to wait on the primary before duplicating the call, None to never hedge."""
+
+    if settings.llm_hedge_percentile is None:
+        return None
+    tracker = _tracker(settings, schema)
+    if len(tracker) < settings.llm_hedge_min_samples:
+        return settings.llm_hedge_initial_delay
+    return tracker.percentile(settings.llm_hedge_percentile)
+
+
+async def _hedged[SchemaT: BaseModel](
+    settings: Settings, schema: type[SchemaT], messages: Sequence[BaseMessage], tokens: int
+) -> SchemaT:
+    """The primary's result, or the secondary's if it is slow past the hedge delay or fails."""
+
+    secondary = settings.secondary()
+    if secondary is None:
+        return await _call_model(settings, schema, messages, tokens)
+
+    primary = asyncio.create_task(_call_model(settings, schema, messages, tokens))
+    pending: set[asyncio.Task[SchemaT]] = {primary}
+    errors: list[BaseException] = []
+    try:
+        delay = _hedge_delay(settings, schema)
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if done:
+            if (exc := primary.exception()) is None:
+                return primary.result()
+            errors.append(exc)
+            logger.warning(
+                "%s call to %s/%s failed (%r), failing over to %s/%s", schema.__name__,
+                settings.llm_provider, settings.llm_model, exc,
+                secondary.llm_provider, secondary.llm_model,
+            )
+        else:
+            logger.info(
+                "%s call to %s/%s past %.1fs, hedging to %s/%s", schema.__name__,
+                settings.llm_provider, settings.llm_model, delay,
+                secondary.llm_provider, secondary.llm_model,
+            )
+        pending.add(asyncio.create_task(_call_model(secondary, schema, messages, tokens)))
+
+        #first valid result wins, an error only counts once both have failed
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if (exc := task.exception()) is None:
+                    return task.result()
+                errors.append(exc)
+        raise errors[0]
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
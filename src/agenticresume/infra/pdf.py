@@ -0,0 +1,180 @@
+"""
+PDF ingestion, turns resume files into resume text
+
+pypdf text extraction is CPU-bound, so pages are extracted in a process pool and
+never on the event loop the agents run on. Extracted text is cached by content
+hash, and documents are yielded as soon as each is ready with a bounded number
+in flight, so a large directory never sits in memory at once.
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import time
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from pypdf import PdfReader
+
+from agenticresume.infra.extractions import document_hash
+from agenticresume.infra.sqlite import connect
+from agenticresume.settings import Settings, StoreSettings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    document_hash TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class ResumeDocument:
+    """One ingested resume, the text plus the bytes it came from."""
+
+    path: Path
+    text: str
+    source: bytes
+
+
+def extract_pdf_text(data: bytes) -> str:
+    """Plain text of every page, in order. Runs inside the worker processes."""
+
+    reader = PdfReader(io.BytesIO(data))
+    pages = (page.extract_text() or "" for page in reader.pages)
+    return "\n\n".join(p.strip() for p in pages if p.strip())
+
+
+class PdfTextCache:
+    """Extracted text per document hash, shared by every process using the file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with connect(path) as conn:
+            conn.executescript(_SCHEMA)
+
+    def get(self, digest: str) -> str | None:
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT text FROM texts WHERE document_hash = ?", (digest,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, digest: str, text: str) -> None:
+        with connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO texts VALUES (?, ?, ?)", (digest, text, time.time())
+            )
+
+
+@cache
+def _open_cache(path: Path) -> PdfTextCache:
+    return PdfTextCache(path)
+
+
+def get_pdf_text_cache(settings: StoreSettings) -> PdfTextCache | None:
+    if not settings.pdf_text_cache_enabled:
+        return None
+    return _open_cache(settings.pdf_text_cache_path)
+
+
+def extraction_pool(settings: Settings) -> ProcessPoolExecutor:
+    """Process pool for extract_pdf_text, its workers are never forked.
+
+    The event loop's to_thread workers already run when the pool starts, and fork()
+    of a multi-threaded process can deadlock the child on a lock held by another thread.
+    """
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=settings.ingest_workers, mp_context=context)
+
+
+async def pdf_text(
+    data: bytes, pool: ProcessPoolExecutor, text_cache: PdfTextCache | None
+) -> str:
+    """Text of one PDF, from `text_cache` or extracted in `pool` and cached.
+
+    Extraction errors propagate, a PDF without a text layer gives an empty string."""
+
+    digest = document_hash(data)
+    text = await asyncio.to_thread(text_cache.get, digest) if text_cache else None
+    if text is None:
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(pool, extract_pdf_text, data)
+        if text_cache is not None:
+            await asyncio.to_thread(text_cache.put, digest, text)
+    return text
+
+
+async def ingest_pdfs(
+    paths: Iterable[Path],
+    *,
+    settings: Settings,
+    max_pending: int | None = None,
+) -> AsyncIterator[ResumeDocument]:
+    """Yield each PDF as a ResumeDocument as soon as its text is ready.
+
+    At most `max_pending` documents are read or extracted at any moment. Unreadable
+    PDFs and PDFs without a text layer are logged and skipped.
+    """
+
+    limit = max_pending or settings.ingest_max_pending
+    text_cache = get_pdf_text_cache(settings)
+
+    async def load(path: Path, pool: ProcessPoolExecutor) -> ResumeDocument | None:
+        try:
+            data = await asyncio.to_thread(path.read_bytes)
+        except OSError:
+            logger.exception("could not open %s, skipping", path)
+            return None
+        try:
+            text = await pdf_text(data, pool, text_cache)
+        except Exception:
+            logger.exception("could not read %s, skipping", path)
+            return None
+
+        if not text:
+            logger.warning("%s has no text layer, skipping", path)
+            return None
+        return ResumeDocument(path=path, text=text, source=data)
+
+    pending_paths = iter(paths)
+    in_flight: set[asyncio.Task[ResumeDocument | None]] = set()
+
+    pool = extraction_pool(settings)
+    try:
+        while True:
+            #top up to the limit, then hand back whatever finished first
+            for path in pending_paths:
+                in_flight.add(asyncio.create_task(load(path, pool)))
+                if len(in_flight) >= limit:
+                    break
+            if not in_flight:
+                break
+
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if (doc := task.result()) is not None:
+                    yield doc
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        #joining the worker processes blocks, keep it off the event loop
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+async def ingest_directory(
+    directory: Path, *, settings: Settings, pattern: str = "*.pdf"
+) -> AsyncIterator[ResumeDocument]:
+    """Every PDF under `directory` matching `pattern`, walked lazily."""
+
+    async for doc in ingest_pdfs(directory.rglob(pattern), settings=settings):
+        yield doc
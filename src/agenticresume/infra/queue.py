@@ -0,0 +1,238 @@
+"""
+Durable screening job queue, one SQLite file shared by every worker
+
+A job is a resume reference and a JD reference (file paths). Workers claim jobs
+under a lease; a worker that dies stops renewing it, and once the visibility
+timeout passes the job is claimable again. Claims are a single UPDATE, so any
+number of worker processes can share the file with no other coordination.
+"""
+
+import os
+import secrets
+import socket
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Literal
+
+from agenticresume.infra.sqlite import connect
+from agenticresume.settings import StoreSettings
+
+JobStatus = Literal["queued", "running", "done", "failed"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    resume_ref TEXT NOT NULL,
+    jd_ref TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_claimable ON jobs (status, lease_until);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_COLUMNS = (
+    "id, resume_ref, jd_ref, status, attempts, worker, enqueued_at, finished_at, result, error"
+)
+
+
+@dataclass(frozen=True)
+class Job:
+    id: int
+    resume_ref: str
+    jd_ref: str
+    status: JobStatus
+    attempts: int
+    worker: str | None
+    enqueued_at: float
+    finished_at: float | None
+    result: str | None  # AnalysisResult JSON once done
+    error: str | None
+
+
+def worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """Leased job queue over one SQLite file."""
+
+    def __init__(self, path: Path, *, visibility_timeout: float, max_attempts: int) -> None:
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        with connect(path) as conn:
+            conn.executescript(_SCHEMA)
+            #job ids restart at 1 in a recreated file, the nonce keeps their checkpoints apart
+            conn.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('nonce', ?)", (secrets.token_hex(8),)
+            )
+            (self.nonce,) = conn.execute("SELECT value FROM meta WHERE key = 'nonce'").fetchone()
+
+    def thread_id(self, job_id: int) -> str:
+        """Checkpoint thread id of a job, unique across queue files."""
+        return f"job-{self.nonce}-{job_id}"
+
+    def enqueue(self, jobs: Iterable[tuple[str, str]]) -> list[int]:
+        """Queue (resume_ref, jd_ref) pairs, returns their job ids in order."""
+
+        now = time.time()
+        with connect(self.path) as conn:
+            return [
+                conn.execute(
+                    "INSERT INTO jobs (resume_ref, jd_ref, enqueued_at) VALUES (?, ?, ?) "
+                    "RETURNING id",
+                    (resume_ref, jd_ref, now),
+                ).fetchone()[0]
+                for resume_ref, jd_ref in jobs
+            ]
+
+    def expire(self) -> list[int]:
+        """Fail the jobs whose lease lapsed on their last attempt, returns their ids.
+
+        Such a job keeps killing its workers; claim never hands it out again, this
+        settles it as failed so its checkpoint can be dropped."""
+
+        now = time.time()
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, lease_until = NULL, "
+                "error = 'lease expired on the last attempt' "
+                "WHERE status = 'running' AND lease_until < ? AND attempts >= ? RETURNING id",
+                (now, now, self.max_attempts),
+            ).fetchall()
+        return sorted(i for (i,) in rows)
+
+    def claim(self, worker: str, limit: int) -> list[Job]:
+        """Lease up to `limit` jobs, oldest first: queued ones, and running ones whose lease
+        lapsed with attempts left."""
+
+        now = time.time()
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                f"""
+                UPDATE jobs SET status = 'running', worker = ?, lease_until = ?,
+                    attempts = attempts + 1
+                WHERE id IN (
+                    SELECT id FROM jobs
+                    WHERE status = 'queued'
+                        OR (status = 'running' AND lease_until < ? AND attempts < ?)
+                    ORDER BY id LIMIT ?
+                )
+                RETURNING {_COLUMNS}
+                """,
+                (worker, now + self.visibility_timeout, now, self.max_attempts, limit),
+            ).fetchall()
+        return sorted((Job(*row) for row in rows), key=lambda j: j.id)
+
+    def extend(self, job_id: int, worker: str) -> bool:
+        """Renew the lease, False if the job is no longer this worker's."""
+
+        with connect(self.path) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_until = ? "
+                "WHERE id = ? AND worker = ? AND status = 'running'",
+                (time.time() + self.visibility_timeout, job_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker: str, result: str) -> bool:
+        """Store the result, False if the lease was lost and another worker owns the job."""
+
+        with connect(self.path) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'done', result = ?, error = NULL, finished_at = ?, "
+                "lease_until = NULL "
+                "WHERE id = ? AND worker = ? AND status = 'running'",
+                (result, time.time(), job_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker: str, error: str) -> bool:
+        """Requeue the job, or mark it failed once it has used every attempt.
+
+        Returns True if the job is now failed, False if it is queued again or not this
+        worker's any more."""
+
+        with connect(self.path) as conn:
+            row = conn.execute(
+                """
+                UPDATE jobs SET
+                    status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END,
+                    finished_at = CASE WHEN attempts >= ? THEN ? END,
+                    error = ?, lease_until = NULL
+                WHERE id = ? AND worker = ? AND status = 'running'
+                RETURNING status
+                """,
+                (self.max_attempts, self.max_attempts, time.time(), error, job_id, worker),
+            ).fetchone()
+        return row is not None and row[0] == "failed"
+
+    def get(self, job_id: int) -> Job | None:
+        with connect(self.path) as conn:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job(*row) if row else None
+
+    def jobs(self, status: JobStatus) -> list[Job]:
+        """Every job in `status`, oldest first."""
+
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE status = ? ORDER BY id", (status,)
+            ).fetchall()
+        return [Job(*row) for row in rows]
+
+    def counts(self) -> dict[JobStatus, int]:
+        with connect(self.path) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {"queued": 0, "running": 0, "done": 0, "failed": 0} | dict(rows)
+
+    def requeue(self, job_id: int | None = None) -> list[int]:
+        """Queue a failed job again with a fresh set of attempts, every failed job if no id.
+
+        Returns the requeued ids; the last error is kept until the job runs again."""
+
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                "UPDATE jobs SET status = 'queued', attempts = 0, worker = NULL, "
+                "finished_at = NULL "
+                "WHERE status = 'failed' AND (? IS NULL OR id = ?) RETURNING id",
+                (job_id, job_id),
+            ).fetchall()
+        return sorted(i for (i,) in rows)
+
+    def purge(self, *, older_than: float, failed: bool = False) -> int:
+        """Delete done jobs older than `older_than` seconds, and failed ones too if `failed`.
+
+        Failed jobs are kept by default, they are the ones someone still has to look at.
+        Returns how many were deleted."""
+
+        statuses = ("done", "failed") if failed else ("done",)
+        with connect(self.path) as conn:
+            cursor = conn.execute(
+                f"DELETE FROM jobs WHERE status IN ({', '.join('?' * len(statuses))}) "
+                "AND finished_at < ?",
+                (*statuses, time.time() - older_than),
+            )
+        return cursor.rowcount
+
+
+@cache
+def _open_queue(path: Path, visibility_timeout: float, max_attempts: int) -> JobQueue:
+    return JobQueue(path, visibility_timeout=visibility_timeout, max_attempts=max_attempts)
+
+
+def get_job_queue(settings: StoreSettings) -> JobQueue:
+    """The job queue configured by `settings`, opened once per process."""
+    return _open_queue(
+        settings.queue_path, settings.queue_visibility_timeout, settings.queue_max_attempts
+    )
@@ -0,0 +1,271 @@
+"""
+Provider-aware request scheduler
+
+One scheduler per (provider, model), shared by every call in the process:
+token buckets keep requests and tokens per minute under quota, an AIMD limiter
+grows concurrency while the provider keeps up and halves it on a 429, and a
+Retry-After pauses the whole key rather than just the call that saw it.
+"""
+
+import asyncio
+import email.utils
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from agenticresume.infra.telemetry import add_queue_wait
+from agenticresume.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#beyond this multiple of a call kind's recent median latency the provider is queueing us,
+#once it happens this many calls in a row (one slow call is just a long answer); back off
+_SLOW_FACTOR = 3.0
+_SLOW_STREAK = 3
+_BASELINE_WINDOW = 128
+_BASELINE_MIN_SAMPLES = 8
+
+#provider SDK errors without an HTTP status that are still worth another try
+_TRANSIENT = {
+    "APIConnectionError", "APITimeoutError", "ConnectError", "ReadTimeout", "ConnectTimeout"
+}
+
+
+class TokenBucket:
+    """Refills `per_minute` units per minute, holds at most one minute's worth."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = asyncio.Lock()  # waiters are served in arrival order
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    async def take(self, amount: float) -> None:
+        amount = min(amount, self.capacity)  # an oversized request waits for a full bucket
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies, for hedging thresholds."""
+
+    def __init__(self, window: int = 512) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile, `q` in (0, 100); the window must not be empty."""
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+class AdaptiveConcurrency:
+    """Concurrency limit under AIMD: +1 per window of healthy calls, x0.5 on a 429.
+
+    Latency is judged per call kind against that kind's recent median, extraction and
+    judging calls differ by an order of magnitude and the median moves with the provider.
+    A 429 from a call started before the last cut belongs to the overload that cut it,
+    so a burst of them halves the limit once."""
+
+    def __init__(self, *, ceiling: int, initial: int = 4) -> None:
+        self.ceiling = ceiling
+        self.limit = float(min(initial, ceiling))
+        self.in_flight = 0
+        self._baselines: dict[str, LatencyTracker] = {}
+        self._slow: dict[str, int] = {}
+        self._cut_at = float("-inf")  # monotonic time of the last 429 cut
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    def _sustained_slowdown(self, kind: str, latency: float) -> bool:
+        baseline = self._baselines.get(kind)
+        if baseline is None:
+            baseline = self._baselines[kind] = LatencyTracker(_BASELINE_WINDOW)
+        slow = (
+            len(baseline) >= _BASELINE_MIN_SAMPLES
+            and latency > baseline.percentile(50) * _SLOW_FACTOR
+        )
+        baseline.record(latency)
+        self._slow[kind] = self._slow.get(kind, 0) + 1 if slow else 0
+        if self._slow[kind] < _SLOW_STREAK:
+            return False
+        self._slow[kind] = 0
+        return True
+
+    async def release(
+        self,
+        *,
+        latency: float | None,
+        throttled: bool,
+        kind: str = "",
+        started: float | None = None,
+    ) -> None:
+        """Return a slot. `started` is when the call was sent, on the monotonic clock."""
+
+        async with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                if started is None or started >= self._cut_at:
+                    self.limit = max(1.0, self.limit / 2)
+                    self._cut_at = time.monotonic()
+            elif latency is not None:
+                if self._sustained_slowdown(kind, latency):
+                    self.limit = max(1.0, self.limit * 0.9)
+                elif not self._slow.get(kind):
+                    self.limit = min(float(self.ceiling), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+def _status(exc: BaseException) -> int | None:
+    """HTTP status behind a provider SDK error, whichever SDK raised it."""
+    for source in (exc, getattr(exc, "response", None)):
+        for attr in ("status_code", "code", "status"):
+            value = getattr(source, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def _transient(exc: BaseException, status: int | None) -> bool:
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(exc, (TimeoutError, ConnectionError)) or any(
+        cls.__name__ in _TRANSIENT for cls in type(exc).__mro__
+    )
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Seconds from the Retry-After header, as delta-seconds or an HTTP date."""
+
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, parsed.timestamp() - time.time())
+
+
+class Scheduler:
+    """Admission control for one provider and model."""
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int | None,
+        tokens_per_minute: int | None,
+        max_concurrency: int,
+        max_retries: int,
+    ) -> None:
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.concurrency = AdaptiveConcurrency(ceiling=max_concurrency)
+        self.max_retries = max_retries
+        self.loop = asyncio.get_running_loop()
+        self._paused_until = 0.0
+
+    async def _admit(self, tokens: int) -> None:
+        if (pause := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(pause)
+        if self.requests is not None:
+            await self.requests.take(1)
+        if self.tokens is not None:
+            await self.tokens.take(tokens)
+        await self.concurrency.acquire()
+
+    async def run(self, call: Callable[[], Awaitable[T]], *, tokens: int, kind: str = "") -> T:
+        """Run `call` once admitted, retrying 429s, 5xx and connection errors with backoff.
+
+        `kind` groups calls of similar latency (the output schema) for slowdown detection."""
+
+        for attempt in range(self.max_retries + 1):
+            queued = time.monotonic()
+            await self._admit(tokens)
+            add_queue_wait(time.monotonic() - queued)
+            start = time.monotonic()
+            try:
+                result = await call()
+            except Exception as exc:
+                status = _status(exc)
+                throttled = status == 429
+                await self.concurrency.release(latency=None, throttled=throttled, started=start)
+
+                if not _transient(exc, status) or attempt == self.max_retries:
+                    raise
+                delay = _retry_after(exc) if throttled else None
+                delay = delay if delay is not None else min(60.0, 2.0**attempt)
+                if throttled:
+                    #the quota is shared, everyone on this key waits it out
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                logger.warning(
+                    "provider returned %s, retry %d/%d in %.1fs (concurrency now %d)",
+                    status, attempt + 1, self.max_retries, delay, int(self.concurrency.limit),
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                await self.concurrency.release(latency=None, throttled=False)
+                raise
+
+            await self.concurrency.release(
+                latency=time.monotonic() - start, throttled=False, kind=kind
+            )
+            return result
+
+        raise AssertionError("unreachable")  # pragma: no cover - the loop returns or raises
+
+
+_schedulers: dict[tuple[str, str], Scheduler] = {}
+
+
+def get_scheduler(
+    settings: Settings, *, provider: str | None = None, model: str | None = None
+) -> Scheduler:
+    """The process-wide scheduler for a provider and model, the configured one by default.
+
+    Rebuilt if the event loop changed, asyncio primitives belong to the loop that made them."""
+
+    key = (provider or settings.llm_provider, model or settings.llm_model)
+    scheduler = _schedulers.get(key)
+    if scheduler is None or scheduler.loop is not asyncio.get_running_loop():
+        scheduler = _schedulers[key] = Scheduler(
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+            max_concurrency=settings.llm_max_concurrency,
+            max_retries=settings.llm_max_retries,
+        )
+    return scheduler
+
+
+def estimate_tokens(*texts: str, output_allowance: int = 512) -> int:
+    """Rough request size for the TPM bucket, ~4 characters per token plus room for the answer."""
+    return sum(len(t) for t in texts) // 4 + output_allowance
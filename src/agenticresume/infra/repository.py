@@ -0,0 +1,564 @@
+"""
+Persistence for profiles, job posts and screening results
+
+One interface, two backends: Neo4j for real use and an in-memory dict store for
+tests and offline benchmarks. The Neo4j backend flattens whole aggregates into
+row lists and writes each kind with a single UNWIND statement per chunk, so
+saving N profiles costs a handful of round trips rather than one per node.
+"""
+
+import json
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import date
+from itertools import batched
+from typing import Any, LiteralString, Protocol
+from uuid import UUID
+
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncManagedTransaction
+
+from agenticresume.domain.models import (
+    AnalysisResult,
+    CareerProfile,
+    Fact,
+    JobPost,
+    Project,
+    Requirement,
+    Role,
+    Skill,
+    canonicalize,
+)
+from agenticresume.settings import Settings
+
+Row = dict[str, Any]
+
+
+class Repository(Protocol):
+    """What the rest of the system needs from storage, whichever backend is behind it."""
+
+    async def save_profiles(self, profiles: Sequence[CareerProfile]) -> None: ...
+
+    async def save_job_posts(self, job_posts: Sequence[JobPost]) -> None: ...
+
+    async def save_results(self, results: Sequence[AnalysisResult]) -> None: ...
+
+    async def get_profile(self, profile_id: UUID) -> CareerProfile | None: ...
+
+    async def get_job_post(self, job_post_id: UUID) -> JobPost | None: ...
+
+    def iter_profiles(self) -> AsyncIterator[CareerProfile]: ...
+
+    async def close(self) -> None: ...
+
+
+# ------------ In-memory -----------------------
+
+class InMemoryRepository:
+    """Dict-backed repository, same interface and semantics, no server."""
+
+    def __init__(self) -> None:
+        self.profiles: dict[UUID, CareerProfile] = {}
+        self.job_posts: dict[UUID, JobPost] = {}
+        self.results: dict[UUID, AnalysisResult] = {}
+
+    async def save_profiles(self, profiles: Sequence[CareerProfile]) -> None:
+        self.profiles.update((p.id, p) for p in profiles)
+
+    async def save_job_posts(self, job_posts: Sequence[JobPost]) -> None:
+        self.job_posts.update((j.id, j) for j in job_posts)
+
+    async def save_results(self, results: Sequence[AnalysisResult]) -> None:
+        self.results.update((r.id, r) for r in results)
+
+    async def get_profile(self, profile_id: UUID) -> CareerProfile | None:
+        return self.profiles.get(profile_id)
+
+    async def get_job_post(self, job_post_id: UUID) -> JobPost | None:
+        return self.job_posts.get(job_post_id)
+
+    async def iter_profiles(self) -> AsyncIterator[CareerProfile]:
+        for profile in list(self.profiles.values()):
+            yield profile
+
+    async def close(self) -> None:
+        return None
+
+
+# ------------ Neo4j -----------------------
+
+_CONSTRAINTS: tuple[LiteralString, ...] = (
+    "CREATE CONSTRAINT profile_id IF NOT EXISTS FOR (n:Profile) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT role_id IF NOT EXISTS FOR (n:Role) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT project_id IF NOT EXISTS FOR (n:Project) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT fact_id IF NOT EXISTS FOR (n:Fact) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT skill_name IF NOT EXISTS FOR (n:Skill) REQUIRE n.canonical_name IS UNIQUE",
+    "CREATE CONSTRAINT job_post_id IF NOT EXISTS FOR (n:JobPost) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT requirement_id IF NOT EXISTS FOR (n:Requirement) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT result_id IF NOT EXISTS FOR (n:Result) REQUIRE n.id IS UNIQUE",
+)
+
+_SAVE_PROFILES: LiteralString = """
+UNWIND $rows AS row
+MERGE (p:Profile {id: row.id})
+SET p.full_name = row.full_name
+"""
+
+_SAVE_ROLES: LiteralString = """
+UNWIND $rows AS row
+MATCH (p:Profile {id: row.profile_id})
+MERGE (r:Role {id: row.id})
+SET r.title = row.title, r.company = row.company, r.started = row.started,
+    r.ended = row.ended, r.ord = row.ord
+MERGE (p)-[:HELD]->(r)
+"""
+
+_SAVE_PROJECTS: LiteralString = """
+UNWIND $rows AS row
+MATCH (p:Profile {id: row.profile_id})
+MERGE (j:Project {id: row.id})
+SET j.name = row.name, j.summary = row.summary, j.ord = row.ord
+MERGE (p)-[:BUILT]->(j)
+"""
+
+#the context is matched by label so the lookup hits the uniqueness index
+_FACT_BODY: LiteralString = """
+MERGE (f:Fact {id: row.id})
+SET f.text = row.text, f.context_kind = row.context_kind, f.status = row.status,
+    f.superseded_by = row.superseded_by, f.source_document = row.source_document,
+    f.source_excerpt = row.source_excerpt, f.ord = row.ord
+MERGE (p)-[:STATES]->(f)
+MERGE (f)-[:IN]->(c)
+WITH f, row
+UNWIND row.skills AS skill
+MERGE (s:Skill {canonical_name: skill.canonical_name})
+ON CREATE SET s.display_name = skill.display_name
+MERGE (f)-[u:USES]->(s)
+SET u.display_name = skill.display_name, u.ord = skill.ord
+"""
+
+_SAVE_ROLE_FACTS: LiteralString = """
+UNWIND $rows AS row
+MATCH (p:Profile {id: row.profile_id})
+MATCH (c:Role {id: row.context_id})
+""" + _FACT_BODY
+
+_SAVE_PROJECT_FACTS: LiteralString = """
+UNWIND $rows AS row
+MATCH (p:Profile {id: row.profile_id})
+MATCH (c:Project {id: row.context_id})
+""" + _FACT_BODY
+
+_SAVE_JOB_POSTS: LiteralString = """
+UNWIND $rows AS row
+MERGE (j:JobPost {id: row.id})
+SET j.company = row.company, j.title = row.title, j.raw_text = row.raw_text
+"""
+
+_SAVE_REQUIREMENTS: LiteralString = """
+UNWIND $rows AS row
+MATCH (j:JobPost {id: row.job_post_id})
+MERGE (r:Requirement {id: row.id})
+SET r.text = row.text, r.kind = row.kind, r.necessity = row.necessity,
+    r.year_required = row.year_required, r.ord = row.ord
+MERGE (j)-[:REQUIRES]->(r)
+WITH r, row
+WHERE row.skill IS NOT NULL
+MERGE (s:Skill {canonical_name: row.skill.canonical_name})
+ON CREATE SET s.display_name = row.skill.display_name
+MERGE (r)-[n:NAMES]->(s)
+SET n.display_name = row.skill.display_name
+"""
+
+_SAVE_RESULTS: LiteralString = """
+UNWIND $rows AS row
+MATCH (p:Profile {id: row.profile_id})
+MATCH (j:JobPost {id: row.job_post_id})
+MERGE (res:Result {id: row.id})
+SET res.created_at = row.created_at, res.decision = row.decision, res.score = row.score,
+    res.rationale = row.rationale, res.assessments = row.assessments
+MERGE (res)-[:FOR]->(p)
+MERGE (res)-[:AGAINST]->(j)
+WITH res, row
+CALL (res, row) {
+    UNWIND row.coverages AS cov
+    MATCH (r:Requirement {id: cov.requirement_id})
+    MERGE (res)-[c:COVERS]->(r)
+    SET c.status = cov.status, c.evidence = cov.evidence, c.reasoning = cov.reasoning
+}
+RETURN collect(res.id) AS written
+"""
+
+_LOAD_PROFILES: LiteralString = """
+UNWIND $ids AS pid
+MATCH (p:Profile {id: pid})
+CALL (p) {
+    OPTIONAL MATCH (p)-[:HELD]->(r:Role)
+    RETURN collect(r {.*}) AS roles
+}
+CALL (p) {
+    OPTIONAL MATCH (p)-[:BUILT]->(j:Project)
+    RETURN collect(j {.*}) AS projects
+}
+CALL (p) {
+    OPTIONAL MATCH (p)-[:STATES]->(f:Fact)-[:IN]->(c)
+    OPTIONAL MATCH (f)-[u:USES]->(s:Skill)
+    WITH f, c, u, s ORDER BY u.ord
+    WITH f, c, collect(CASE WHEN s IS NULL THEN NULL ELSE
+        {canonical_name: s.canonical_name, display_name: u.display_name} END) AS skills
+    RETURN collect(f {.*, context_id: c.id, skills: skills}) AS facts
+}
+RETURN p.id AS id, p.full_name AS full_name, roles, projects, facts
+"""
+
+_LOAD_JOB_POST: LiteralString = """
+MATCH (j:JobPost {id: $id})
+OPTIONAL MATCH (j)-[:REQUIRES]->(r:Requirement)
+OPTIONAL MATCH (r)-[n:NAMES]->(s:Skill)
+WITH j, r, CASE WHEN s IS NULL THEN NULL ELSE
+    {canonical_name: s.canonical_name, display_name: n.display_name} END AS skill
+ORDER BY r.ord
+RETURN j {.*} AS job_post, collect(r {.*, skill: skill}) AS requirements
+"""
+
+_PROFILE_IDS: LiteralString = "MATCH (p:Profile) RETURN p.id AS id ORDER BY p.id"
+
+_SKILL_NAMES: LiteralString = "MATCH (s:Skill) RETURN s.canonical_name AS name"
+
+#moves every USES and NAMES edge of a skill stored under an outdated canonical name onto
+#the current one, then drops the old node
+_MERGE_SKILLS: LiteralString = """
+UNWIND $renames AS rename
+MATCH (old:Skill {canonical_name: rename.old})
+MERGE (new:Skill {canonical_name: rename.new})
+ON CREATE SET new.display_name = old.display_name
+WITH old, new
+CALL (old, new) {
+    MATCH (f:Fact)-[u:USES]->(old)
+    MERGE (f)-[v:USES]->(new)
+    SET v.display_name = u.display_name, v.ord = u.ord
+}
+CALL (old, new) {
+    MATCH (r:Requirement)-[n:NAMES]->(old)
+    MERGE (r)-[m:NAMES]->(new)
+    SET m.display_name = n.display_name
+}
+DETACH DELETE old
+"""
+
+
+def _iso(d: date | None) -> str | None:
+    return d.isoformat() if d else None
+
+
+def _skill_row(skill: Skill) -> Row:
+    return {"canonical_name": skill.canonical_name, "display_name": skill.display_name}
+
+
+def profile_rows(profiles: Iterable[CareerProfile]) -> dict[str, list[Row]]:
+    """Flatten profiles into one row list per statement."""
+
+    rows: dict[str, list[Row]] = {"profiles": [], "roles": [], "projects": [], "facts": []}
+    for p in profiles:
+        pid = str(p.id)
+        rows["profiles"].append({"id": pid, "full_name": p.full_name})
+        rows["roles"] += [
+            {
+                "id": str(r.id),
+                "profile_id": pid,
+                "title": r.title,
+                "company": r.company,
+                "started": _iso(r.started),
+                "ended": _iso(r.ended),
+                "ord": i,
+            }
+            for i, r in enumerate(p.roles)
+        ]
+        rows["projects"] += [
+            {"id": str(j.id), "profile_id": pid, "name": j.name, "summary": j.summary, "ord": i}
+            for i, j in enumerate(p.projects)
+        ]
+        rows["facts"] += [
+            {
+                "id": str(f.id),
+                "profile_id": pid,
+                "context_id": str(f.context_id),
+                "context_kind": f.context_kind,
+                "text": f.text,
+                "status": f.status,
+                "superseded_by": str(f.superseded_by) if f.superseded_by else None,
+                "source_document": f.source_document,
+                "source_excerpt": f.source_excerpt,
+                "skills": [_skill_row(s) | {"ord": k} for k, s in enumerate(f.skills)],
+                "ord": i,
+            }
+            for i, f in enumerate(p.facts)
+        ]
+    return rows
+
+
+def job_post_rows(job_posts: Iterable[JobPost]) -> dict[str, list[Row]]:
+    rows: dict[str, list[Row]] = {"job_posts": [], "requirements": []}
+    for j in job_posts:
+        rows["job_posts"].append(
+            {"id": str(j.id), "company": j.company, "title": j.title, "raw_text": j.raw_text}
+        )
+        rows["requirements"] += [
+            {
+                "id": str(r.id),
+                "job_post_id": str(j.id),
+                "text": r.text,
+                "kind": r.kind,
+                "necessity": r.necessity,
+                "year_required": r.year_required,
+                "skill": _skill_row(r.skill) if r.skill else None,
+                "ord": i,
+            }
+            for i, r in enumerate(j.requirements)
+        ]
+    return rows
+
+
+def result_rows(results: Iterable[AnalysisResult]) -> list[Row]:
+    return [
+        {
+            "id": str(r.id),
+            "profile_id": str(r.profile_id),
+            "job_post_id": str(r.job_post_id),
+            "created_at": r.created_at.isoformat(),
+            "decision": r.decision,
+            "score": r.score,
+            "rationale": r.rationale,
+            #assessments are only ever read back whole, no need for nodes
+            "assessments": json.dumps([a.model_dump() for a in r.assessments]),
+            "coverages": [
+                {
+                    "requirement_id": str(c.requirement_id),
+                    "status": c.status,
+                    "evidence": [str(e) for e in c.evidence],
+                    "reasoning": c.reasoning,
+                }
+                for c in r.coverages
+            ],
+        }
+        for r in results
+    ]
+
+
+def _by_ord(rows: list[Row]) -> list[Row]:
+    return sorted(rows, key=lambda r: r["ord"])
+
+
+def _date(value: str | date | None) -> date | None:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _uuid(value: str | None) -> UUID | None:
+    return UUID(value) if value else None
+
+
+def _skill(row: Row) -> Skill:
+    #canonical names are recomputed (memoized) rather than read back, so profiles stored
+    #before an alias table change still match under the current one
+    return Skill.trusted(
+        display_name=row["display_name"], canonical_name=canonicalize(row["display_name"])
+    )
+
+
+#the store only ever holds what validated models wrote, so rows are rebuilt with Base.trusted
+#(types converted here) and each aggregate's invariants are checked once. Neo4j does not
+#store null properties, so the optional ones are read with .get
+def _profile_from_record(record: Row) -> CareerProfile:
+    roles = tuple(
+        Role.trusted(
+            id=UUID(r["id"]),
+            title=r["title"],
+            company=r["company"],
+            started=_date(r.get("started")),
+            ended=_date(r.get("ended")),
+        )
+        for r in _by_ord(record["roles"])
+    )
+    projects = tuple(
+        Project.trusted(id=UUID(j["id"]), name=j["name"], summary=j["summary"])
+        for j in _by_ord(record["projects"])
+    )
+
+    #facts of one role or project repeat the same context id and usually the same skill list,
+    #parse each once and share the instances, as the mapper does when it first builds them
+    contexts = {str(c.id): c.id for c in (*roles, *projects)}
+    skill_sets: dict[tuple[tuple[str, str], ...], tuple[Skill, ...]] = {}
+
+    def skills(rows: list[Row]) -> tuple[Skill, ...]:
+        key = tuple((s["display_name"], s["canonical_name"]) for s in rows)
+        found = skill_sets.get(key)
+        if found is None:
+            found = skill_sets[key] = tuple(_skill(s) for s in rows)
+        return found
+
+    return CareerProfile.trusted(
+        id=UUID(record["id"]),
+        full_name=record["full_name"],
+        roles=roles,
+        projects=projects,
+        facts=tuple(
+            Fact.trusted(
+                id=UUID(f["id"]),
+                text=f["text"],
+                context_kind=f["context_kind"],
+                context_id=contexts.get(f["context_id"]) or UUID(f["context_id"]),
+                skills=skills(f["skills"]),
+                source_document=f["source_document"],
+                source_excerpt=f["source_excerpt"],
+                status=f["status"],
+                superseded_by=_uuid(f.get("superseded_by")),
+            )
+            for f in _by_ord(record["facts"])
+        ),
+    ).check_invariants()
+
+
+def _job_post_from_record(record: Row) -> JobPost:
+    j = record["job_post"]
+    return JobPost.trusted(
+        id=UUID(j["id"]),
+        company=j["company"],
+        title=j["title"],
+        raw_text=j["raw_text"],
+        requirements=tuple(
+            Requirement.trusted(
+                id=UUID(r["id"]),
+                text=r["text"],
+                kind=r["kind"],
+                necessity=r["necessity"],
+                skill=_skill(r["skill"]) if r["skill"] else None,
+                year_required=r.get("year_required"),
+            )
+            for r in record["requirements"]
+        ),
+    ).check_invariants()
+
+
+class Neo4jRepository:
+    """Neo4j backend over one pooled async driver; writes go out in UNWIND batches."""
+
+    def __init__(
+        self, driver: AsyncDriver, *, batch_size: int, database: str | None = None
+    ) -> None:
+        self.driver = driver
+        self.batch_size = batch_size
+        self.database = database
+
+    async def ensure_schema(self) -> None:
+        """Uniqueness constraints, which also give MERGE an index to hit."""
+        for statement in _CONSTRAINTS:
+            await self.driver.execute_query(statement, database_=self.database)
+
+    async def _write(self, statements: list[tuple[LiteralString, list[Row]]]) -> None:
+        #one transaction per chunk, every statement in it a single UNWIND round trip
+        async def work(tx: AsyncManagedTransaction) -> None:
+            for query, rows in statements:
+                if rows:
+                    await (await tx.run(query, rows=rows)).consume()
+
+        async with self.driver.session(database=self.database) as session:
+            await session.execute_write(work)
+
+    async def recanonicalize_skills(self) -> int:
+        """Merge Skill nodes stored under a name the current alias table canonicalizes
+        differently into the current one, returns how many were merged.
+
+        Run it after changing skill_aliases.json, until then old and new spellings of a
+        skill are separate nodes for queries that traverse the graph."""
+
+        records, _, _ = await self.driver.execute_query(
+            _SKILL_NAMES, database_=self.database, routing_="r"
+        )
+        renames = [
+            {"old": r["name"], "new": new}
+            for r in records
+            if (new := canonicalize(r["name"])) != r["name"]
+        ]
+        for chunk in batched(renames, self.batch_size):
+            await self._write([(_MERGE_SKILLS, list(chunk))])
+        return len(renames)
+
+    async def save_profiles(self, profiles: Sequence[CareerProfile]) -> None:
+        for chunk in batched(profiles, self.batch_size):
+            rows = profile_rows(chunk)
+            await self._write(
+                [
+                    (_SAVE_PROFILES, rows["profiles"]),
+                    (_SAVE_ROLES, rows["roles"]),
+                    (_SAVE_PROJECTS, rows["projects"]),
+                    (_SAVE_ROLE_FACTS, [f for f in rows["facts"] if f["context_kind"] == "role"]),
+                    (
+                        _SAVE_PROJECT_FACTS,
+                        [f for f in rows["facts"] if f["context_kind"] == "project"],
+                    ),
+                ]
+            )
+
+    async def save_job_posts(self, job_posts: Sequence[JobPost]) -> None:
+        for chunk in batched(job_posts, self.batch_size):
+            rows = job_post_rows(chunk)
+            await self._write(
+                [(_SAVE_JOB_POSTS, rows["job_posts"]), (_SAVE_REQUIREMENTS, rows["requirements"])]
+            )
+
+    async def _write_results(self, rows: list[Row]) -> None:
+        #a result whose profile or job post is not stored matches nothing and would be
+        #dropped without a word, so the chunk is rolled back and the caller told instead
+        async def work(tx: AsyncManagedTransaction) -> None:
+            record = await (await tx.run(_SAVE_RESULTS, rows=rows)).single(strict=True)
+            missing = sorted({r["id"] for r in rows} - set(record["written"]))
+            if missing:
+                raise ValueError(
+                    f"results {missing} were not saved, their profile or job post is not stored"
+                )
+
+        async with self.driver.session(database=self.database) as session:
+            await session.execute_write(work)
+
+    async def save_results(self, results: Sequence[AnalysisResult]) -> None:
+        """Save results whose profile and job post are already stored, raises ValueError if not."""
+        for chunk in batched(results, self.batch_size):
+            await self._write_results(result_rows(chunk))
+
+    async def _load_profiles(self, ids: list[str]) -> list[CareerProfile]:
+        records, _, _ = await self.driver.execute_query(
+            _LOAD_PROFILES, ids=ids, database_=self.database, routing_="r"
+        )
+        return [_profile_from_record(r.data()) for r in records]
+
+    async def get_profile(self, profile_id: UUID) -> CareerProfile | None:
+        found = await self._load_profiles([str(profile_id)])
+        return found[0] if found else None
+
+    async def get_job_post(self, job_post_id: UUID) -> JobPost | None:
+        records, _, _ = await self.driver.execute_query(
+            _LOAD_JOB_POST, id=str(job_post_id), database_=self.database, routing_="r"
+        )
+        return _job_post_from_record(records[0].data()) if records else None
+
+    async def iter_profiles(self) -> AsyncIterator[CareerProfile]:
+        """Every stored profile, loaded `batch_size` at a time."""
+
+        records, _, _ = await self.driver.execute_query(
+            _PROFILE_IDS, database_=self.database, routing_="r"
+        )
+        for chunk in batched((r["id"] for r in records), self.batch_size):
+            for profile in await self._load_profiles(list(chunk)):
+                yield profile
+
+    async def close(self) -> None:
+        await self.driver.close()
+
+
+def neo4j_repository(settings: Settings) -> Neo4jRepository:
+    """A Neo4j repository over a pooled driver built from `settings`."""
+
+    driver = AsyncGraphDatabase.driver(
+        settings.neo4j_uri,
+        auth=(settings.neo4j_user, settings.neo4j_password.get_secret_value()),
+        max_connection_pool_size=settings.neo4j_pool_size,
+    )
+    return Neo4jRepository(driver, batch_size=settings.neo4j_batch_size)
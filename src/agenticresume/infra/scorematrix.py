@@ -0,0 +1,178 @@
+"""
+What-if rescoring over archived screenings
+
+One job post's screened pool as a candidate x requirement matrix of coverage
+statuses. Re-scoring and re-ranking the whole pool under different status or
+necessity weights is a single vectorized pass, no LLM call and no per-result
+Python loop. The matrix persists as a .npy file that is memory-mapped on load
+and is scored a block of rows at a time, so a pool larger than memory can still
+be ranked.
+
+Needs NumPy, installed with the `analytics` extra.
+"""
+
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from uuid import UUID
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "what-if rescoring needs numpy: pip install 'agenticresume[analytics]'"
+    ) from exc
+
+from agenticresume.domain.models import AnalysisResult, JobPost
+from agenticresume.domain.scoring import _NECESSITY_WEIGHT, _STATUS_WEIGHT
+
+#matrix cell codes, -1 is a requirement the screening has no coverage for (left out of the score)
+STATUSES = ("none", "partial", "covered")
+NECESSITIES = ("must_have", "nice_to_have")
+_MISSING = -1
+
+#rows scored per pass, bounds the float temporaries to a few MB per requirement column
+_ROW_CHUNK = 1 << 16
+
+
+class ScoreMatrix:
+    """Coverage statuses of every screened candidate against one job post's requirements."""
+
+    def __init__(
+        self,
+        *,
+        job_post_id: UUID,
+        requirement_ids: tuple[UUID, ...],
+        necessity: npt.NDArray[np.int8],
+        result_ids: tuple[UUID, ...],
+        profile_ids: tuple[UUID, ...],
+        status: npt.NDArray[np.int8],
+    ) -> None:
+        if status.shape != (len(result_ids), len(requirement_ids)):
+            expected = (len(result_ids), len(requirement_ids))
+            raise ValueError(f"status is {status.shape}, expected {expected}")
+        self.job_post_id = job_post_id
+        self.requirement_ids = requirement_ids
+        self.necessity = necessity
+        self.result_ids = result_ids
+        self.profile_ids = profile_ids
+        self.status = status
+
+    def __len__(self) -> int:
+        return len(self.result_ids)
+
+    @classmethod
+    def from_results(cls, job_post: JobPost, results: Iterable[AnalysisResult]) -> "ScoreMatrix":
+        """Build from the job post's screenings; results for other job posts are rejected."""
+
+        column = {r.id: j for j, r in enumerate(job_post.requirements)}
+        rows: list[npt.NDArray[np.int8]] = []
+        result_ids: list[UUID] = []
+        profile_ids: list[UUID] = []
+        code = {s: i for i, s in enumerate(STATUSES)}
+
+        for result in results:
+            if result.job_post_id != job_post.id:
+                raise ValueError(
+                    f"result {result.id} is for job post {result.job_post_id}, not {job_post.id}"
+                )
+            row = np.full(len(column), _MISSING, dtype=np.int8)
+            for c in result.coverages:
+                if (j := column.get(c.requirement_id)) is not None:
+                    row[j] = code[c.status]
+            rows.append(row)
+            result_ids.append(result.id)
+            profile_ids.append(result.profile_id)
+
+        status = np.vstack(rows) if rows else np.empty((0, len(column)), dtype=np.int8)
+        necessity = [NECESSITIES.index(r.necessity) for r in job_post.requirements]
+        return cls(
+            job_post_id=job_post.id,
+            requirement_ids=tuple(column),
+            necessity=np.array(necessity, dtype=np.int8),
+            result_ids=tuple(result_ids),
+            profile_ids=tuple(profile_ids),
+            status=status,
+        )
+
+    def scores(
+        self,
+        status_weight: Mapping[str, float] | None = None,
+        necessity_weight: Mapping[str, float] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """weighted_coverage of every candidate at once, under the given or the default weights."""
+
+        sw = {**_STATUS_WEIGHT, **(status_weight or {})}
+        nw = {**_NECESSITY_WEIGHT, **(necessity_weight or {})}
+        status_lut = np.array([sw[s] for s in STATUSES])
+        necessity_lut = np.array([nw[n] for n in NECESSITIES])
+
+        requirement_weight = necessity_lut[self.necessity]
+        out = np.zeros(len(self))
+        for start in range(0, len(self), _ROW_CHUNK):
+            #a memory-mapped status is only paged in one block at a time
+            block = np.asarray(self.status[start : start + _ROW_CHUNK])
+            present = block != _MISSING
+            weights = np.where(present, requirement_weight, 0.0)
+            earned = (status_lut[np.where(present, block, 0)] * weights).sum(axis=1)
+            total = weights.sum(axis=1)
+            np.divide(earned, total, out=out[start : start + len(block)], where=total > 0)
+        return out
+
+    def unmet_must_haves(self) -> npt.NDArray[np.int64]:
+        """Dealbreaker count per candidate, as unmet_must_haves would list them."""
+
+        must = self.necessity == NECESSITIES.index("must_have")
+        out = np.empty(len(self), dtype=np.int64)
+        for start in range(0, len(self), _ROW_CHUNK):
+            block = np.asarray(self.status[start : start + _ROW_CHUNK])
+            out[start : start + len(block)] = ((block == STATUSES.index("none")) & must).sum(axis=1)
+        return out
+
+    def rank(
+        self,
+        status_weight: Mapping[str, float] | None = None,
+        necessity_weight: Mapping[str, float] | None = None,
+        *,
+        limit: int | None = None,
+        max_unmet_must_haves: int | None = None,
+    ) -> list[tuple[UUID, float]]:
+        """(profile id, score) best first under the given weights, optionally dropping
+        candidates with more than `max_unmet_must_haves` dealbreakers."""
+
+        scores = self.scores(status_weight, necessity_weight)
+        order = np.argsort(-scores, kind="stable")
+        if max_unmet_must_haves is not None:
+            order = order[self.unmet_must_haves()[order] <= max_unmet_must_haves]
+        if limit is not None:
+            order = order[:limit]
+        return [(self.profile_ids[i], float(scores[i])) for i in order]
+
+    def save(self, directory: Path) -> None:
+        """Write status.npy and meta.json under `directory`."""
+
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "status.npy", np.ascontiguousarray(self.status))
+        meta = {
+            "job_post_id": str(self.job_post_id),
+            "requirement_ids": [str(i) for i in self.requirement_ids],
+            "necessity": [NECESSITIES[n] for n in self.necessity],
+            "result_ids": [str(i) for i in self.result_ids],
+            "profile_ids": [str(i) for i in self.profile_ids],
+        }
+        (directory / "meta.json").write_text(json.dumps(meta))
+
+    @classmethod
+    def load(cls, directory: Path, *, mmap: bool = True) -> "ScoreMatrix":
+        """Read a saved matrix, the status array memory-mapped read-only unless `mmap` is off."""
+
+        meta = json.loads((directory / "meta.json").read_text())
+        return cls(
+            job_post_id=UUID(meta["job_post_id"]),
+            requirement_ids=tuple(UUID(i) for i in meta["requirement_ids"]),
+            necessity=np.array([NECESSITIES.index(n) for n in meta["necessity"]], dtype=np.int8),
+            result_ids=tuple(UUID(i) for i in meta["result_ids"]),
+            profile_ids=tuple(UUID(i) for i in meta["profile_ids"]),
+            status=np.load(directory / "status.npy", mmap_mode="r" if mmap else None),
+        )
@@ -0,0 +1,193 @@
+"""
+Cross-candidate skill index, LLM-free shortlisting
+
+Inverted index from canonical skill name to the profiles (and facts) that show
+it, built from stored CareerProfiles by `agenticresume skills index`. A job
+post's skill requirements are scored against it with the same weights as a full
+screening, so the pool can be ranked in milliseconds and the graph only runs on
+the shortlist.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from uuid import UUID
+
+from agenticresume.domain.matching import skill_index
+from agenticresume.domain.models import CareerProfile, JobPost, skill_aliases_version
+from agenticresume.domain.scoring import skill_coverage
+from agenticresume.infra.sqlite import connect
+from agenticresume.settings import StoreSettings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_id TEXT PRIMARY KEY,
+    full_name TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    canonical_name TEXT NOT NULL,
+    profile_id TEXT NOT NULL REFERENCES profiles (profile_id) ON DELETE CASCADE,
+    fact_ids TEXT NOT NULL,
+    PRIMARY KEY (canonical_name, profile_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_profile ON postings (profile_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """One shortlisted profile, with the skills that put it there."""
+
+    profile_id: UUID
+    full_name: str
+    score: float
+    matched: tuple[str, ...]  # canonical names of the job post's skills the profile shows
+    evidence: tuple[UUID, ...]  # fact ids behind those skills
+
+
+class SkillIndex:
+    """SQLite-backed inverted index over the active facts of stored profiles."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        version = str(skill_aliases_version())
+        with connect(path) as conn:
+            conn.executescript(_SCHEMA)
+            #postings are keyed by canonical name, which the alias table decides, so
+            #postings from another table would miss renamed skills: drop them all
+            row = conn.execute("SELECT value FROM meta WHERE key = 'aliases_version'").fetchone()
+            built = row[0] if row else None
+            if built != version:
+                cleared = conn.execute("DELETE FROM profiles").rowcount
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('aliases_version', ?)", (version,)
+                )
+                if cleared:
+                    logger.warning(
+                        "skill index %s was built with skill alias table %s, current is %s; "
+                        "cleared %d profiles, run `agenticresume skills index` to rebuild it",
+                        path, built, version, cleared,
+                    )
+
+    def add(self, profiles: Iterable[CareerProfile]) -> int:
+        """Index (or re-index) `profiles`, returns how many."""
+
+        count = 0
+        with connect(self.path) as conn:
+            for profile in profiles:
+                pid = str(profile.id)
+                conn.execute("DELETE FROM profiles WHERE profile_id = ?", (pid,))
+                conn.execute(
+                    "INSERT INTO profiles VALUES (?, ?, ?)", (pid, profile.full_name, time.time())
+                )
+                conn.executemany(
+                    "INSERT INTO postings VALUES (?, ?, ?)",
+                    [
+                        (name, pid, json.dumps([str(i) for i in fact_ids]))
+                        for name, fact_ids in skill_index(profile.active_facts).items()
+                    ],
+                )
+                count += 1
+        return count
+
+    async def build(
+        self, profiles: AsyncIterable[CareerProfile], *, chunk: int = 500, prune: bool = False
+    ) -> int:
+        """Index every profile from an async source, e.g. `Repository.iter_profiles()`.
+
+        With `prune`, indexed profiles the source did not yield are dropped afterwards,
+        so the index mirrors the source. Returns how many profiles were indexed."""
+
+        started = time.time()
+        count = 0
+        pending: list[CareerProfile] = []
+        async for profile in profiles:
+            pending.append(profile)
+            if len(pending) >= chunk:
+                count += await asyncio.to_thread(self.add, pending)
+                pending = []
+        count += await asyncio.to_thread(self.add, pending)
+        if prune:
+            await asyncio.to_thread(self._prune, started)
+        return count
+
+    def _prune(self, before: float) -> None:
+        with connect(self.path) as conn:
+            conn.execute("DELETE FROM profiles WHERE indexed_at < ?", (before,))
+
+    def remove(self, profile_ids: Iterable[UUID]) -> None:
+        with connect(self.path) as conn:
+            conn.executemany(
+                "DELETE FROM profiles WHERE profile_id = ?", [(str(i),) for i in profile_ids]
+            )
+
+    def shortlist(self, job_post: JobPost, *, limit: int) -> list[Candidate]:
+        """Best `limit` indexed profiles for the job post's skill requirements, best first.
+
+        Profiles showing none of the required skills are not returned."""
+
+        wanted = {r.skill.canonical_name for r in job_post.requirements if r.skill is not None}
+        if not wanted:
+            return []
+
+        held: dict[str, dict[str, list[str]]] = {}
+        with connect(self.path) as conn:
+            marks = ", ".join("?" * len(wanted))
+            for name, pid, fact_ids in conn.execute(
+                f"SELECT canonical_name, profile_id, fact_ids FROM postings "
+                f"WHERE canonical_name IN ({marks})",
+                tuple(wanted),
+            ):
+                held.setdefault(pid, {})[name] = json.loads(fact_ids)
+
+            #same weights as a screening's score, restricted to what the index can see
+            scored = sorted(
+                (
+                    (skill_coverage(job_post.requirements, skills.keys()), pid)
+                    for pid, skills in held.items()
+                ),
+                reverse=True,
+            )[:limit]
+
+            names: dict[str, str] = {}
+            if scored:
+                marks = ", ".join("?" * len(scored))
+                names = dict(
+                    conn.execute(
+                        f"SELECT profile_id, full_name FROM profiles WHERE profile_id IN ({marks})",
+                        tuple(pid for _, pid in scored),
+                    ).fetchall()
+                )
+
+        return [
+            Candidate(
+                profile_id=UUID(pid),
+                full_name=names.get(pid, ""),
+                score=score,
+                matched=tuple(sorted(held[pid])),
+                evidence=tuple(UUID(f) for ids in held[pid].values() for f in ids),
+            )
+            for score, pid in scored
+        ]
+
+
+@cache
+def _open_index(path: Path) -> SkillIndex:
+    return SkillIndex(path)
+
+
+def get_skill_index(settings: StoreSettings) -> SkillIndex:
+    """The skill index configured by `settings`, opened once per process."""
+    return _open_index(settings.skill_index_path)
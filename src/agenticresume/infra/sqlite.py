@@ -0,0 +1,27 @@
+"""
+SQLite helpers shared by the local stores
+
+Every store opens short-lived connections, so the same file can be shared by
+threads and by separate worker processes; WAL keeps readers from blocking the writer.
+"""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def connect(path: Path) -> Iterator[sqlite3.Connection]:
+    """Open `path`, commit on success, roll back on error, always close."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30.0)  # wait on another process' write lock
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        with conn:  # transaction scope
+            yield conn
+    finally:
+        conn.close()
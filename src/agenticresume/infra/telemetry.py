@@ -0,0 +1,233 @@
+"""
+Telemetry, where screening time and money go
+
+Every graph node and every structured LLM call becomes a Span: wall time, time
+spent queued in the scheduler, input/output tokens from the provider's usage
+metadata and an estimated cost. Spans are keyed by screening id and exported as
+JSON; running totals are exported in the Prometheus text format. Disabled by
+default, and then nothing is recorded beyond a context variable lookup.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import cache
+from typing import Any, Literal
+
+from agenticresume.settings import Settings
+
+#USD per million (input, output) tokens, list prices; Settings.llm_prices overrides or extends
+PRICES: dict[str, tuple[float, float]] = {
+    "google/gemini-2.5-flash": (0.30, 2.50),
+    "google/gemini-2.5-pro": (1.25, 10.00),
+    "openai/gpt-4o-mini": (0.15, 0.60),
+    "openai/gpt-4o": (2.50, 10.00),
+    "anthropic/claude-3-5-haiku-latest": (0.80, 4.00),
+    "anthropic/claude-sonnet-4-0": (3.00, 15.00),
+    "groq/llama-3.1-8b-instant": (0.05, 0.08),
+    "groq/llama-3.3-70b-versatile": (0.59, 0.79),
+}
+
+#the screening a node (and every LLM call it makes) belongs to
+current_screening: ContextVar[str | None] = ContextVar("current_screening", default=None)
+#the LLM call in progress, the scheduler adds its queue wait to it
+_current_call: ContextVar["Span | None"] = ContextVar("_current_call", default=None)
+
+
+@dataclass
+class Span:
+    kind: Literal["node", "llm"]
+    name: str  # node name, or the schema an LLM call asked for
+    screening_id: str | None
+    started_at: float  # unix time
+    wall: float = 0.0  # seconds
+    queue_wait: float = 0.0  # seconds waiting on the scheduler, llm spans only
+    provider: str | None = None
+    model: str | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float | None = None  # USD, None when the model has no known price
+    error: str | None = None
+
+
+def add_queue_wait(seconds: float) -> None:
+    """Charge scheduler wait to the LLM call in progress, if it is being recorded."""
+    if (span := _current_call.get()) is not None:
+        span.queue_wait += seconds
+
+
+#name -> (type, help) of every exported series
+_METRICS = {
+    "agenticresume_node_seconds": ("summary", "Wall time of graph nodes"),
+    "agenticresume_llm_call_seconds": (
+        "summary",
+        "Wall time of structured LLM calls, queueing included",
+    ),
+    "agenticresume_llm_queue_wait_seconds": ("summary", "Time LLM calls waited on the scheduler"),
+    "agenticresume_llm_tokens_total": ("counter", "Tokens reported by the provider"),
+    "agenticresume_llm_cost_usd_total": (
+        "counter",
+        "Estimated spend from token usage and list prices",
+    ),
+    "agenticresume_errors_total": ("counter", "Nodes and LLM calls that raised"),
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Telemetry:
+    """Span recorder, newest `max_spans` kept, running totals over every span."""
+
+    def __init__(self, *, max_spans: int, prices: Mapping[str, tuple[float, float]]) -> None:
+        self.prices = {**PRICES, **prices}
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+        self._totals: dict[tuple[str, Labels], float] = {}
+        self._lock = threading.Lock()
+
+    def cost(
+        self, provider: str, model: str, input_tokens: int, output_tokens: int
+    ) -> float | None:
+        price = self.prices.get(f"{provider}/{model}")
+        if price is None:
+            return None
+        return (input_tokens * price[0] + output_tokens * price[1]) / 1e6
+
+    def _add(self, metric: str, labels: Labels, value: float) -> None:
+        key = (metric, labels)
+        self._totals[key] = self._totals.get(key, 0.0) + value
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+            if span.kind == "node":
+                labels: Labels = (("node", span.name),)
+                self._add("agenticresume_node_seconds_sum", labels, span.wall)
+                self._add("agenticresume_node_seconds_count", labels, 1)
+            else:
+                labels = (
+                    ("provider", span.provider or ""),
+                    ("model", span.model or ""),
+                    ("schema", span.name),
+                )
+                self._add("agenticresume_llm_call_seconds_sum", labels, span.wall)
+                self._add("agenticresume_llm_call_seconds_count", labels, 1)
+                self._add("agenticresume_llm_queue_wait_seconds_sum", labels, span.queue_wait)
+                self._add("agenticresume_llm_queue_wait_seconds_count", labels, 1)
+                for direction, tokens in (
+                    ("input", span.input_tokens),
+                    ("output", span.output_tokens),
+                ):
+                    by_direction = (*labels, ("direction", direction))
+                    self._add("agenticresume_llm_tokens_total", by_direction, tokens)
+                if span.cost is not None:
+                    self._add("agenticresume_llm_cost_usd_total", labels[:2], span.cost)
+            if span.error is not None:
+                self._add(
+                    "agenticresume_errors_total", (("kind", span.kind), ("name", span.name)), 1
+                )
+
+    @contextmanager
+    def node(self, name: str, screening_id: str | None) -> Iterator[Span]:
+        """Record a node span around the block, LLM calls inside belong to `screening_id`."""
+
+        span = Span(kind="node", name=name, screening_id=screening_id, started_at=time.time())
+        token = current_screening.set(screening_id)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = type(exc).__name__
+            raise
+        finally:
+            span.wall = time.perf_counter() - start
+            current_screening.reset(token)
+            self.record(span)
+
+    @contextmanager
+    def llm_call(self, schema: str, provider: str, model: str) -> Iterator[Span]:
+        """Record an LLM call span around the block, the caller fills in the token counts."""
+
+        span = Span(
+            kind="llm",
+            name=schema,
+            screening_id=current_screening.get(),
+            started_at=time.time(),
+            provider=provider,
+            model=model,
+        )
+        token = _current_call.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = type(exc).__name__
+            raise
+        finally:
+            span.wall = time.perf_counter() - start
+            span.cost = self.cost(provider, model, span.input_tokens, span.output_tokens)
+            _current_call.reset(token)
+            self.record(span)
+
+    def spans(self, screening_id: str | None = None) -> list[Span]:
+        with self._lock:
+            return [
+                s for s in self._spans if screening_id is None or s.screening_id == screening_id
+            ]
+
+    def by_screening(self) -> dict[str, list[dict[str, Any]]]:
+        """Every kept span as a JSON-ready record, grouped by screening id."""
+
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for span in self.spans():
+            grouped.setdefault(span.screening_id or "", []).append(asdict(span))
+        return grouped
+
+    def to_json(self) -> str:
+        return json.dumps(self.by_screening(), indent=2)
+
+    def prometheus(self) -> str:
+        """Running totals in the Prometheus text exposition format."""
+
+        with self._lock:
+            totals = sorted(self._totals.items())
+        lines: list[str] = []
+        for metric, (kind, help_text) in _METRICS.items():
+            names = (metric, f"{metric}_sum", f"{metric}_count")
+            series = [(name, labels, value) for (name, labels), value in totals if name in names]
+            if not series:
+                continue
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+            for name, labels, value in series:
+                rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                #repr keeps every digit, a counter past 1e6 must not scrape rounded
+                lines.append(f"{name}{{{rendered}}} {float(value)!r}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._totals.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@cache
+def _open_telemetry(
+    max_spans: int, prices: tuple[tuple[str, tuple[float, float]], ...]
+) -> Telemetry:
+    return Telemetry(max_spans=max_spans, prices=dict(prices))
+
+
+def get_telemetry(settings: Settings) -> Telemetry | None:
+    """The process-wide recorder configured by `settings`, None when telemetry is disabled."""
+
+    if not settings.telemetry_enabled:
+        return None
+    return _open_telemetry(settings.telemetry_max_spans, tuple(sorted(settings.llm_prices.items())))
@@ -20,9 +20,11 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
-class Settings(BaseSettings):
-    "Validated, Immutable Runtime Configs"
-    
+class StoreSettings(BaseSettings):
+    """The local stores: where they live and how they behave, no credentials.
+
+    Enough for commands that only inspect a store (cache, jobs, queue), which must work
+    without an API key or a Neo4j password configured."""
 
     #defines the how's of loading
     model_config = SettingsConfigDict(
@@ -33,6 +35,46 @@ class Settings(BaseSettings):
         frozen=True,
     )
 
+    #response cache, shared by every process pointed at the same file
+    llm_cache_enabled: bool = True
+    llm_cache_path: Path = _PROJECT_ROOT / ".cache" / "llm.sqlite3"
+    llm_cache_max_mb: int = Field(default=256, ge=1)
+    #None keeps entries until evicted
+    llm_cache_ttl_days: float | None = Field(default=30.0, gt=0.0)
+
+    #parsed job posts are reused for exact reposts and near duplicates above the threshold
+    jobpost_store_enabled: bool = True
+    jobpost_store_path: Path = _PROJECT_ROOT / ".cache" / "jobposts.sqlite3"
+    jobpost_similarity_threshold: float = Field(default=0.9, gt=0.0, le=1.0)
+
+    #extractions are reused per source document until the extractor prompt or schema changes
+    extraction_store_enabled: bool = True
+    extraction_store_path: Path = _PROJECT_ROOT / ".cache" / "extractions.sqlite3"
+
+    #graph state saved after every node, a failed screening rerun under its screening id
+    #resumes from the last completed node; finished screenings are dropped from the file
+    checkpoint_enabled: bool = True
+    checkpoint_path: Path = _PROJECT_ROOT / ".cache" / "checkpoints.sqlite3"
+
+    #text extracted from resume pdfs, keyed by file content
+    pdf_text_cache_enabled: bool = True
+    pdf_text_cache_path: Path = _PROJECT_ROOT / ".cache" / "pdf_text.sqlite3"
+
+    #cross-candidate skill index used to shortlist the pool before any LLM call
+    skill_index_path: Path = _PROJECT_ROOT / ".cache" / "skills.sqlite3"
+
+    #durable job queue for screening workers; a job whose lease is not renewed within the
+    #visibility timeout (a dead worker) is handed out again, up to max_attempts claims
+    queue_path: Path = _PROJECT_ROOT / ".cache" / "queue.sqlite3"
+    queue_visibility_timeout: float = Field(default=300.0, gt=0.0)
+    queue_max_attempts: int = Field(default=3, ge=1)
+    worker_poll_seconds: float = Field(default=1.0, gt=0.0)  # idle wait between empty claims
+
+
+class Settings(StoreSettings):
+    "Validated, Immutable Runtime Configs"
+    
+
     #app, the actual content of settings
 
     env: Literal["dev", "prod"] = "dev"
@@ -45,29 +87,115 @@ class Settings(BaseSettings):
     llm_model: str = "gemini-2.5-flash"
     llm_temperature: float = Field(default=0.0, ge=0.0, le=2.0)
 
+    #request scheduling per provider+model; None leaves a quota unenforced. Retries of 429s,
+    #5xx and connection errors happen here, the provider SDKs' own retries are turned off
+    llm_requests_per_minute: int | None = Field(default=None, ge=1)
+    llm_tokens_per_minute: int | None = Field(default=None, ge=1)
+    llm_max_concurrency: int = Field(default=16, ge=1)
+    llm_max_retries: int = Field(default=5, ge=0)
+
+    #request hedging: with a secondary provider/model configured, a call still running past this
+    #latency percentile is duplicated to it and the first valid result wins, and a failed primary
+    #call fails over to it. A None percentile keeps only the failover
+    llm_secondary_provider: Literal["google", "openai", "anthropic", "groq"] | None = None
+    llm_secondary_model: str | None = None
+    llm_hedge_percentile: float | None = Field(default=95.0, gt=0.0, lt=100.0)
+    #until this many latencies are recorded per schema, hedge after the fixed delay instead
+    llm_hedge_min_samples: int = Field(default=20, ge=1)
+    llm_hedge_initial_delay: float = Field(default=20.0, gt=0.0)
+
     #allow none, to enable providing only the used API key
     google_api_key: SecretStr | None = None
     openai_api_key: SecretStr | None = None
     anthropic_api_key: SecretStr | None = None
     groq_api_key: SecretStr | None = None
 
-    @model_validator(mode = "after")
-    def _active_provider_has_key(self) -> Self:
-        key = {
+    def api_key(self, provider: str) -> SecretStr | None:
+        return {
             "google": self.google_api_key,
             "openai": self.openai_api_key,
             "anthropic": self.anthropic_api_key,
             "groq": self.groq_api_key,
-        }[self.llm_provider]
+        }[provider]
 
-        if key is None:
+    @model_validator(mode = "after")
+    def _active_provider_has_key(self) -> Self:
+        if self.api_key(self.llm_provider) is None:
             raise ValueError(f"{self.llm_provider}_api_key is required when llm_provider={self.llm_provider!r}")
 
         return self
+
+    @model_validator(mode = "after")
+    def _secondary_provider_has_key(self) -> Self:
+        provider = self.llm_secondary_provider
+        if provider is None:
+            if self.llm_secondary_model is not None:
+                raise ValueError("llm_secondary_model is set but llm_secondary_provider is not")
+            return self
+
+        if self.api_key(provider) is None:
+            raise ValueError(
+                f"{provider}_api_key is required when llm_secondary_provider={provider!r}"
+            )
+        if provider != self.llm_provider and self.llm_secondary_model is None:
+            raise ValueError(
+                "llm_secondary_model is required when llm_secondary_provider differs from "
+                "llm_provider"
+            )
+
+        return self
+
+    def secondary(self) -> Self | None:
+        """These settings pointed at the secondary provider/model, None if none is configured."""
+
+        if self.llm_secondary_provider is None:
+            return None
+        #same provider without a model hedges against another replica of the primary model
+        model = self.llm_secondary_model or self.llm_model
+        return self.model_copy(
+            update={"llm_provider": self.llm_secondary_provider, "llm_model": model}
+        )
     
+    #pdf ingestion, worker processes (None = one per cpu) and documents in flight at once
+    ingest_workers: int | None = Field(default=None, ge=1)
+    ingest_max_pending: int = Field(default=32, ge=1)
+
+    #settle exact skill matches before the auditor call, only the rest is sent to the LLM
+    audit_prematch: bool = True
+    #requirements per auditor call, batches run concurrently; None audits all in one call
+    audit_batch_size: int | None = Field(default=None, ge=1)
+    #BM25 top-k facts shown per requirement, lower is a smaller prompt at some recall cost;
+    #None shows every active fact
+    audit_facts_per_requirement: int | None = Field(default=None, ge=1)
+
+    #candidates the skill index shortlists the pool to before any LLM call
+    shortlist_size: int = Field(default=100, ge=1)
+
+    #fast paths after the audit, None disables a rule. reject_* decides "reject" without any
+    #further LLM call, skip_panel_* goes straight to the recruiter
+    fast_reject_unmet_must_haves: int | None = Field(default=None, ge=1)
+    fast_reject_below_score: float | None = Field(default=None, ge=0.0, le=1.0)
+    skip_panel_unmet_must_haves: int | None = Field(default=None, ge=1)
+    skip_panel_below_score: float | None = Field(default=None, ge=0.0, le=1.0)
+
+    #"panel" asks for all three judge assessments in a single call instead of one call each
+    judge_mode: Literal["separate", "panel"] = "separate"
+
+    #how many screenings a batch keeps in flight at once
+    screening_concurrency: int = Field(default=8, ge=1)
+
+    #spans for every node and LLM call, exported as Prometheus text or JSON per screening
+    telemetry_enabled: bool = False
+    telemetry_max_spans: int = Field(default=10_000, ge=1)  # newest kept, aggregates cover all
+    #USD per million (input, output) tokens keyed "provider/model", over the built-in table
+    llm_prices: dict[str, tuple[float, float]] = Field(default_factory=dict)
+
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: SecretStr
+    neo4j_pool_size: int = Field(default=50, ge=1)
+    #aggregates per UNWIND write transaction
+    neo4j_batch_size: int = Field(default=500, ge=1)
     
 @cache
 def get_settings() -> Settings:
@@ -76,3 +204,10 @@ def get_settings() -> Settings:
     return Settings()  # pyright: ignore[reportCallIssue]  # fields come from env, not args
 
 
+@cache
+def get_store_settings() -> StoreSettings:
+    "The store settings alone, for commands that must not require credentials"
+
+    return StoreSettings()
+
+
@@ -0,0 +1,52 @@
+"""
+Shared fixtures: offline settings and a scripted chat model
+
+Settings never read the developer's .env, every store is off unless a test turns it
+on, and store paths live under the test's tmp_path.
+"""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fakes import ScriptedModel
+
+from agenticresume.infra.llm import clear_clients, register_chat_model
+from agenticresume.settings import Settings
+
+MakeSettings = Callable[..., Settings]
+
+
+@pytest.fixture
+def make_settings(tmp_path: Path) -> MakeSettings:
+    """Settings with every store off and every path under tmp_path, overridable by keyword."""
+
+    def make(**overrides: Any) -> Settings:
+        values: dict[str, Any] = {
+            name: False for name in Settings.model_fields if name.endswith("_enabled")
+        }
+        values |= {
+            name: tmp_path / f"{name.removesuffix('_path')}.sqlite3"
+            for name in Settings.model_fields
+            if name.endswith("_path")
+        }
+        values |= {"google_api_key": "test", "neo4j_password": "test"}
+        return Settings(_env_file=None, **values | overrides)  # type: ignore[call-arg]
+
+    return make
+
+
+@pytest.fixture
+def model() -> ScriptedModel:
+    return ScriptedModel()
+
+
+@pytest.fixture
+def settings(make_settings: MakeSettings, model: ScriptedModel) -> Iterator[Settings]:
+    """Offline settings whose provider is the scripted model."""
+
+    settings = make_settings()
+    register_chat_model(settings, model)
+    yield settings
+    clear_clients()
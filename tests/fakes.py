@@ -0,0 +1,93 @@
+"""
+Scripted chat model for offline tests
+
+Answers every screening schema with a fixed valid payload and can be told to fail a
+schema a given number of times, so the real graph, nodes and scheduler run without
+a provider.
+"""
+
+import re
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel, Field
+
+from agenticresume.agents import schemas as S
+
+
+class ScriptedModel(BaseChatModel):
+    """Structured-output chat model with fixed answers and scripted failures."""
+
+    calls: list[str] = Field(default_factory=list)  # schema names, in call order
+    failures: dict[str, int] = Field(default_factory=dict)  # schema name -> failures left
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kw: Any
+    ) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=""))])
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> Runnable:
+        async def answer(messages: list[BaseMessage]) -> dict[str, Any]:
+            name = schema.__name__
+            self.calls.append(name)
+            if self.failures.get(name, 0) > 0:
+                self.failures[name] -= 1
+                raise ValueError(f"scripted failure of {name}")
+            parsed = payload(schema, str(messages[-1].content))
+            raw = AIMessage(
+                content="",
+                usage_metadata={"input_tokens": 100, "output_tokens": 20, "total_tokens": 120},
+            )
+            return {"raw": raw, "parsed": parsed, "parsing_error": None}
+
+        return RunnableLambda(answer)
+
+
+def payload(schema: type[BaseModel], user_content: str) -> BaseModel:
+    if schema is S.ExtractionOutput:
+        role = S.ExtractedRole(
+            role="Developer",
+            company="Initech",
+            started="2020-01",
+            ended="",
+            bullets=["Built the billing API in Python", "Ran PostgreSQL in production"],
+            skills=["Python", "Postgres"],
+        )
+        return S.ExtractionOutput(full_name="Ann Example", roles=[role])
+    if schema is S.JobPostOutput:
+        return S.JobPostOutput(
+            company="Acme",
+            title="Backend Engineer",
+            requirements=[
+                S.ExtractedRequirement(
+                    text="Python", kind="skill", necessity="must_have", skill="Python"
+                ),
+                S.ExtractedRequirement(
+                    text="PostgreSQL", kind="skill", necessity="nice_to_have", skill="PostgreSQL"
+                ),
+                S.ExtractedRequirement(text="Team player", kind="soft", necessity="must_have"),
+            ],
+        )
+    if schema is S.AuditorOutput:
+        indices = [int(i) for i in re.findall(r"\[R(\d+)\]", user_content)]
+        return S.AuditorOutput(
+            coverage=[
+                S.CoverageItem(requirement_index=i, status="partial", evidence_indices=[1])
+                for i in indices
+            ]
+        )
+    if schema is S.AssessmentOutput:
+        return S.AssessmentOutput(summary="Solid backend profile.", points=["ships APIs"])
+    if schema is S.PanelOutput:
+        read = S.AssessmentOutput(summary="Solid backend profile.", points=["ships APIs"])
+        return S.PanelOutput(skeptic=read, enthusiast=read, pragmatist=read)
+    if schema is S.RecruiterOutput:
+        return S.RecruiterOutput(decision="hold", rationale="Worth a second look.")
+    raise TypeError(f"no scripted payload for {schema.__name__}")
@@ -0,0 +1,26 @@
+import pytest
+from fakes import ScriptedModel
+
+from agenticresume.domain.models import AnalysisResult
+from agenticresume.graph.batch import screen_batch
+from agenticresume.settings import Settings
+
+
+async def test_every_resume_gets_an_outcome_at_its_index(
+    settings: Settings, model: ScriptedModel
+) -> None:
+    model.failures["ExtractionOutput"] = 1  # the first extraction raises, the rest succeed
+    resumes = [f"resume {i}" for i in range(4)]
+
+    outcomes = [s async for s in screen_batch(settings, "job post", resumes, concurrency=1)]
+
+    assert sorted(s.index for s in outcomes) == [0, 1, 2, 3]
+    by_index = {s.index: s for s in outcomes}
+    assert not by_index[0].ok and isinstance(by_index[0].outcome, ValueError)
+    assert all(isinstance(by_index[i].outcome, AnalysisResult) for i in (1, 2, 3))
+    assert len({s.screening_id for s in outcomes}) == 4
+
+
+async def test_a_zero_concurrency_is_rejected_not_defaulted(settings: Settings) -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        [s async for s in screen_batch(settings, "job post", ["resume"], concurrency=0)]
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from agenticresume.infra.cache import LLMCache
+from agenticresume.infra.sqlite import connect
+
+
+def _stored_counters(path: Path) -> dict[str, int]:
+    with connect(path) as conn:
+        return dict(conn.execute("SELECT name, value FROM counters").fetchall())
+
+
+def test_lookups_do_not_write_until_flushed(tmp_path: Path) -> None:
+    cache = LLMCache(tmp_path / "llm.sqlite3", max_bytes=1 << 20)
+    cache.put("a", "payload")
+
+    assert cache.get("a") == "payload"
+    assert cache.get("missing") is None
+    assert _stored_counters(cache.path) == {"hits": 0, "misses": 0}
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert _stored_counters(cache.path) == {"hits": 1, "misses": 1}
+
+
+def test_eviction_sees_hits_not_yet_flushed(tmp_path: Path) -> None:
+    cache = LLMCache(tmp_path / "llm.sqlite3", max_bytes=20)
+    cache.put("old", "x" * 8)
+    cache.put("new", "y" * 8)
+    cache.get("old")  # now the most recently used
+
+    cache.put("third", "z" * 8)  # over the cap, the least recently used goes
+
+    assert cache.get("old") is not None
+    assert cache.get("new") is None
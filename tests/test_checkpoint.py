@@ -0,0 +1,71 @@
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from conftest import MakeSettings
+from fakes import ScriptedModel
+
+from agenticresume.graph.screen import screen
+from agenticresume.graph.worker import run_worker
+from agenticresume.infra.checkpoint import _open_checkpointer, get_checkpointer
+from agenticresume.infra.llm import clear_clients, register_chat_model
+from agenticresume.infra.queue import JobQueue
+from agenticresume.settings import Settings
+
+
+@pytest.fixture
+def settings(make_settings: MakeSettings, model: ScriptedModel) -> Iterator[Settings]:
+    settings = make_settings(checkpoint_enabled=True)
+    register_chat_model(settings, model)
+    yield settings
+    clear_clients()
+    _open_checkpointer.cache_clear()
+
+
+async def test_a_failed_screening_resumes_after_its_last_completed_node(
+    settings: Settings, model: ScriptedModel
+) -> None:
+    model.failures["RecruiterOutput"] = 1
+    checkpointer = get_checkpointer(settings)
+
+    with pytest.raises(ValueError):
+        await screen(settings, resume_text="resume", jd_text="job post", screening_id="s1")
+    assert [t.thread_id for t in checkpointer.threads()] == ["s1"]
+    calls_before = len(model.calls)
+
+    result = await screen(settings, screening_id="s1")  # the inputs come from the checkpoint
+
+    assert result.decision == "hold"
+    assert model.calls[calls_before:] == ["RecruiterOutput"]
+    assert checkpointer.threads() == []
+
+
+async def test_purge_drops_only_abandoned_screenings(
+    settings: Settings, model: ScriptedModel
+) -> None:
+    model.failures["RecruiterOutput"] = 2
+    checkpointer = get_checkpointer(settings)
+    with pytest.raises(ValueError):
+        await screen(settings, resume_text="resume", jd_text="job post", screening_id="old")
+    time.sleep(0.05)
+    with pytest.raises(ValueError):
+        await screen(settings, resume_text="resume", jd_text="job post", screening_id="new")
+
+    assert checkpointer.purge(older_than=0.025) == ["old"]
+    assert [t.thread_id for t in checkpointer.threads()] == ["new"]
+
+
+async def test_a_dead_lettered_job_drops_its_checkpoint(
+    settings: Settings, model: ScriptedModel, tmp_path: Path
+) -> None:
+    model.failures["RecruiterOutput"] = 1
+    (tmp_path / "resume.txt").write_text("resume")
+    (tmp_path / "jd.txt").write_text("job post")
+    queue = JobQueue(tmp_path / "jobs.sqlite3", visibility_timeout=60, max_attempts=1)
+    (job_id,) = queue.enqueue([(str(tmp_path / "resume.txt"), str(tmp_path / "jd.txt"))])
+
+    await run_worker(settings, queue=queue, drain=True)
+
+    assert queue.get(job_id).status == "failed"
+    assert get_checkpointer(settings).threads() == []
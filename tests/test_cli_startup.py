@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import agenticresume
+
+#what the CLI may only import inside a command, never to build itself
+DEFERRED = (
+    "agenticresume.settings",
+    "agenticresume.domain.models",
+    "agenticresume.graph.screen",
+    "langchain_core",
+    "langgraph",
+    "pydantic_settings",
+)
+
+_SRC = str(Path(agenticresume.__file__).resolve().parents[1])
+
+
+def _python(code: str, *args: str, env: dict[str, str] | None = None) -> str:
+    env = (env if env is not None else dict(os.environ)) | {"PYTHONPATH": _SRC}
+    return subprocess.run(
+        [sys.executable, "-c", code, *args], check=True, capture_output=True, text=True, env=env
+    ).stdout
+
+
+def test_importing_the_cli_loads_no_heavy_module() -> None:
+    out = _python(
+        "import sys, agenticresume.cli\n"
+        f"print(' '.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+
+    assert out.split() == []
+
+
+def test_store_commands_need_no_credentials(tmp_path: Path) -> None:
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if not k.upper().endswith("_API_KEY") and k.upper() != "NEO4J_PASSWORD"
+    }
+    env |= {
+        "LLM_CACHE_PATH": str(tmp_path / "llm.sqlite3"),
+        "JOBPOST_STORE_PATH": str(tmp_path / "jobposts.sqlite3"),
+        "QUEUE_PATH": str(tmp_path / "queue.sqlite3"),
+    }
+    cli = "import sys; from agenticresume.cli import app; app(sys.argv[1:])"
+
+    assert "0 entries" in _python(cli, "cache", "stats", env=env)
+    assert "no stored job posts" in _python(cli, "jobs", "list", env=env)
+    assert "queued" in _python(cli, "queue", "stats", env=env)
@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+from agenticresume.domain.models import JobPost, Requirement, Skill
+from agenticresume.infra.jobstore import JobPostStore
+
+JD = " ".join(
+    [
+        "Acme is hiring a backend engineer to build and run our billing platform.",
+        "You will design APIs in Python, own PostgreSQL schemas and on-call rotations,",
+        "work with product on pricing experiments, mentor two junior engineers,",
+        "and improve observability across twelve services running on Kubernetes.",
+        "We value clear writing, careful code review and shipping small changes often.",
+        "Five years of backend experience and some exposure to payments are expected.",
+    ]
+)
+
+
+def _job_post() -> JobPost:
+    return JobPost(
+        company="Acme",
+        title="Backend Engineer",
+        requirements=(
+            Requirement(
+                text="Python",
+                kind="skill",
+                necessity="must_have",
+                skill=Skill.of("Python"),
+            ),
+        ),
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> JobPostStore:
+    return JobPostStore(tmp_path / "jobposts.sqlite3", threshold=0.9)
+
+
+def test_exact_repost_reuses_the_parsed_post(store: JobPostStore) -> None:
+    stored = _job_post()
+    store.put(JD, stored)
+
+    #case and whitespace do not make a different posting
+    found = store.lookup("  " + JD.upper().replace(" ", "   ") + "\n")
+
+    assert found == stored
+    assert found is not None and found.requirements[0].id == stored.requirements[0].id
+
+
+def test_lightly_edited_repost_reuses_the_parsed_post(store: JobPostStore) -> None:
+    stored = _job_post()
+    store.put(JD, stored)
+
+    repost = JD + " Applications close at the end of the month."
+
+    found = store.lookup(repost)
+    again = store.lookup(repost)  # served from the remembered wording
+
+    assert found == stored and again == stored
+    assert store.entries()[0].hits == 2
+
+
+def test_unrelated_posting_is_a_miss(store: JobPostStore) -> None:
+    store.put(JD, _job_post())
+
+    other = "Night shift nurse wanted at a rural clinic, a current licence is required."
+
+    assert store.lookup(other) is None
+
+
+def test_evicted_post_is_parsed_again(store: JobPostStore) -> None:
+    key = store.put(JD, _job_post())
+
+    assert store.evict(key[:8]) == [key]
+    assert store.lookup(JD) is None
+
+
+def test_skills_are_recanonicalized_on_load(store: JobPostStore) -> None:
+    #stored before k8s became an alias of Kubernetes
+    stale = Requirement(
+        text="k8s",
+        kind="skill",
+        necessity="must_have",
+        skill=Skill(display_name="k8s", canonical_name="k8s"),
+    )
+    store.put(JD, JobPost(company="Acme", title="Backend Engineer", requirements=(stale,)))
+
+    found = store.lookup(JD)
+
+    assert found is not None
+    assert found.requirements[0].skill.canonical_name == "kubernetes"
+    assert found.requirements[0].id == stale.id
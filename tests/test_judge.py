@@ -0,0 +1,9 @@
+from agenticresume.agents import enthusiast, pragmatist, skeptic
+from agenticresume.agents.judge import panel_system_prompt
+
+
+def test_the_panel_reads_the_persona_prompts_verbatim() -> None:
+    prompt = panel_system_prompt()
+
+    for persona in (skeptic, enthusiast, pragmatist):
+        assert persona.SYSTEM_PROMPT in prompt
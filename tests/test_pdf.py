@@ -0,0 +1,80 @@
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from conftest import MakeSettings
+from fakes import ScriptedModel
+
+from agenticresume.graph.worker import run_worker
+from agenticresume.infra.extractions import document_hash
+from agenticresume.infra.llm import clear_clients, register_chat_model
+from agenticresume.infra.pdf import _open_cache, get_pdf_text_cache, ingest_pdfs
+from agenticresume.infra.queue import JobQueue
+from agenticresume.settings import Settings
+
+SAMPLE = Path(__file__).resolve().parents[1] / "data" / "sample_resume.pdf"
+
+
+@pytest.fixture
+def settings(make_settings: MakeSettings) -> Iterator[Settings]:
+    yield make_settings(pdf_text_cache_enabled=True, ingest_workers=1)
+    _open_cache.cache_clear()
+
+
+@contextmanager
+def _no_fork() -> Iterator[None]:
+    #forking the loop's worker threads into the pool warns, and may deadlock the child
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        yield
+    assert not [w for w in caught if "fork()" in str(w.message)]
+
+
+async def _ingest(settings: Settings, *paths: Path) -> list[str]:
+    with _no_fork():
+        return [doc.text async for doc in ingest_pdfs(paths, settings=settings)]
+
+
+async def test_ingestion_extracts_the_text_then_reuses_the_cached_copy(
+    settings: Settings,
+) -> None:
+    (text,) = await _ingest(settings, SAMPLE)
+    assert text.strip()
+
+    text_cache = get_pdf_text_cache(settings)
+    assert text_cache is not None
+    digest = document_hash(SAMPLE.read_bytes())
+    assert text_cache.get(digest) == text
+
+    text_cache.put(digest, "cached text")  # a second pass must not extract again
+    assert await _ingest(settings, SAMPLE) == ["cached text"]
+
+
+async def test_unreadable_files_are_skipped(settings: Settings, tmp_path: Path) -> None:
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+
+    texts = await _ingest(settings, tmp_path / "missing.pdf", broken, SAMPLE)
+
+    assert len(texts) == 1
+
+
+async def test_the_worker_reads_queued_pdfs_through_the_same_cache(
+    settings: Settings, model: ScriptedModel, tmp_path: Path
+) -> None:
+    register_chat_model(settings, model)
+    (tmp_path / "jd.txt").write_text("job post")
+    queue = JobQueue(tmp_path / "jobs.sqlite3", visibility_timeout=60, max_attempts=1)
+    (job_id,) = queue.enqueue([(str(SAMPLE), str(tmp_path / "jd.txt"))])
+
+    try:
+        with _no_fork():
+            assert await run_worker(settings, queue=queue, drain=True) == 1
+    finally:
+        clear_clients()
+
+    assert queue.get(job_id).status == "done"
+    text_cache = get_pdf_text_cache(settings)
+    assert text_cache is not None and text_cache.get(document_hash(SAMPLE.read_bytes()))
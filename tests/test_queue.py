@@ -0,0 +1,98 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from agenticresume.infra.queue import JobQueue
+
+LEASE = 0.05
+
+
+@pytest.fixture
+def queue(tmp_path: Path) -> JobQueue:
+    return JobQueue(tmp_path / "queue.sqlite3", visibility_timeout=LEASE, max_attempts=2)
+
+
+def test_a_leased_job_is_not_handed_out_twice(queue: JobQueue) -> None:
+    (job_id,) = queue.enqueue([("resume.pdf", "jd.txt")])
+
+    (job,) = queue.claim("a", 10)
+
+    assert job.id == job_id and job.status == "running" and job.attempts == 1
+    assert queue.claim("b", 10) == []
+
+
+def test_a_lapsed_lease_passes_the_job_to_another_worker(queue: JobQueue) -> None:
+    queue.enqueue([("resume.pdf", "jd.txt")])
+    (job,) = queue.claim("a", 10)
+    time.sleep(LEASE * 2)
+
+    (again,) = queue.claim("b", 10)
+
+    assert again.id == job.id and again.worker == "b" and again.attempts == 2
+    #the first worker lost the job, its renewal and its result are refused
+    assert not queue.extend(job.id, "a")
+    assert not queue.complete(job.id, "a", "{}")
+    assert queue.complete(job.id, "b", "{}")
+    assert queue.get(job.id).status == "done"
+
+
+def test_a_renewed_lease_keeps_the_job(queue: JobQueue) -> None:
+    queue.enqueue([("resume.pdf", "jd.txt")])
+    (job,) = queue.claim("a", 10)
+
+    for _ in range(4):
+        time.sleep(LEASE / 2)
+        assert queue.extend(job.id, "a")
+
+    assert queue.claim("b", 10) == []
+
+
+def test_a_lapsed_lease_on_the_last_attempt_fails_the_job(queue: JobQueue) -> None:
+    (job_id,) = queue.enqueue([("resume.pdf", "jd.txt")])
+    queue.claim("a", 10)
+    time.sleep(LEASE * 2)
+    queue.claim("b", 10)  # the second and last attempt
+    time.sleep(LEASE * 2)
+
+    assert queue.claim("c", 10) == []
+    assert queue.expire() == [job_id]
+    assert queue.get(job_id).status == "failed"
+
+
+def test_failures_requeue_until_attempts_run_out_then_retry_resets_them(queue: JobQueue) -> None:
+    (job_id,) = queue.enqueue([("resume.pdf", "jd.txt")])
+    queue.claim("a", 10)
+    assert not queue.fail(job_id, "a", "ValueError: boom")  # queued again
+    queue.claim("b", 10)
+    assert queue.fail(job_id, "b", "ValueError: boom")  # out of attempts
+
+    (failed,) = queue.jobs("failed")
+    assert failed.id == job_id and failed.error == "ValueError: boom"
+
+    assert queue.requeue() == [job_id]
+    (job,) = queue.claim("c", 10)
+    assert job.attempts == 1
+
+
+def test_purge_keeps_failed_jobs_unless_asked(queue: JobQueue) -> None:
+    done_id, failed_id = queue.enqueue([("a.pdf", "jd.txt"), ("b.pdf", "jd.txt")])
+    queue.claim("a", 10)
+    queue.complete(done_id, "a", "{}")
+    queue.fail(failed_id, "a", "boom")
+    queue.claim("a", 10)
+    queue.fail(failed_id, "a", "boom")
+
+    assert queue.purge(older_than=0) == 1
+    assert queue.get(failed_id) is not None
+    assert queue.purge(older_than=0, failed=True) == 1
+    assert queue.get(failed_id) is None
+
+
+def test_thread_ids_differ_between_queue_files(tmp_path: Path) -> None:
+    first = JobQueue(tmp_path / "a.sqlite3", visibility_timeout=LEASE, max_attempts=2)
+    reopened = JobQueue(tmp_path / "a.sqlite3", visibility_timeout=LEASE, max_attempts=2)
+    other = JobQueue(tmp_path / "b.sqlite3", visibility_timeout=LEASE, max_attempts=2)
+
+    assert first.thread_id(1) == reopened.thread_id(1)
+    assert first.thread_id(1) != other.thread_id(1)
@@ -0,0 +1,112 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from agenticresume.infra.ratelimit import AdaptiveConcurrency, Scheduler, TokenBucket
+
+
+async def _calls(limiter: AdaptiveConcurrency, kind: str, latency: float, n: int) -> None:
+    for _ in range(n):
+        await limiter.acquire()
+        await limiter.release(latency=latency, throttled=False, kind=kind)
+
+
+async def test_healthy_calls_grow_the_limit_to_the_ceiling() -> None:
+    limiter = AdaptiveConcurrency(ceiling=6, initial=2)
+
+    await _calls(limiter, "Extraction", 1.0, 50)
+
+    assert limiter.limit == 6
+
+
+async def test_a_slow_kind_is_judged_against_its_own_baseline() -> None:
+    limiter = AdaptiveConcurrency(ceiling=8, initial=8)
+    await _calls(limiter, "Fast", 0.5, 20)
+
+    #ten times the other kind's latency, but normal for this one
+    await _calls(limiter, "Slow", 5.0, 20)
+
+    assert limiter.limit == 8
+
+
+async def test_only_a_sustained_slowdown_cuts_the_limit() -> None:
+    limiter = AdaptiveConcurrency(ceiling=8, initial=8)
+    await _calls(limiter, "Judge", 1.0, 20)
+
+    await _calls(limiter, "Judge", 10.0, 1)
+    await _calls(limiter, "Judge", 1.0, 1)
+    await _calls(limiter, "Judge", 10.0, 1)
+    assert limiter.limit == 8
+
+    await _calls(limiter, "Judge", 10.0, 3)
+    assert limiter.limit == pytest.approx(8 * 0.9)
+
+
+async def test_a_429_halves_the_limit() -> None:
+    limiter = AdaptiveConcurrency(ceiling=8, initial=8)
+    await limiter.acquire()
+
+    await limiter.release(latency=None, throttled=True)
+
+    assert limiter.limit == 4 and limiter.in_flight == 0
+
+
+async def test_a_burst_of_429s_from_one_overload_halves_the_limit_once() -> None:
+    limiter = AdaptiveConcurrency(ceiling=8, initial=8)
+    for _ in range(8):
+        await limiter.acquire()
+    sent = time.monotonic()
+
+    for _ in range(8):
+        await limiter.release(latency=None, throttled=True, started=sent)
+    assert limiter.limit == 4
+
+    #a call sent after the cut that is throttled again is a new overload
+    await limiter.acquire()
+    await limiter.release(latency=None, throttled=True, started=time.monotonic())
+    assert limiter.limit == 2
+
+
+class _RateLimited(Exception):
+    status_code = 429
+    response = SimpleNamespace(headers={"retry-after": "0"})
+
+
+async def test_scheduler_retries_a_429_and_backs_off() -> None:
+    scheduler = Scheduler(
+        requests_per_minute=None, tokens_per_minute=None, max_concurrency=8, max_retries=2
+    )
+    attempts = 0
+
+    async def call() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise _RateLimited()
+        return "ok"
+
+    assert await scheduler.run(call, tokens=10, kind="Extraction") == "ok"
+    assert attempts == 2
+    assert scheduler.concurrency.limit < 4 and scheduler.concurrency.in_flight == 0  # halved from 4
+
+
+async def test_scheduler_does_not_retry_a_client_error() -> None:
+    scheduler = Scheduler(
+        requests_per_minute=None, tokens_per_minute=None, max_concurrency=8, max_retries=2
+    )
+
+    async def call() -> str:
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await scheduler.run(call, tokens=10)
+    assert scheduler.concurrency.in_flight == 0
+
+
+async def test_token_bucket_caps_an_oversized_request_at_its_capacity() -> None:
+    bucket = TokenBucket(per_minute=60)
+
+    await bucket.take(1000)  # a full bucket admits it rather than waiting forever
+
+    assert bucket.tokens == pytest.approx(0, abs=0.1)
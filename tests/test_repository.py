@@ -0,0 +1,177 @@
+import os
+from collections.abc import AsyncIterator
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from conftest import MakeSettings
+from neo4j.exceptions import Neo4jError, ServiceUnavailable
+
+from agenticresume.domain.models import (
+    AnalysisResult,
+    CareerProfile,
+    Coverage,
+    Fact,
+    JobPost,
+    Requirement,
+    Role,
+    Skill,
+)
+from agenticresume.infra.repository import (
+    Neo4jRepository,
+    _job_post_from_record,
+    _profile_from_record,
+    neo4j_repository,
+)
+
+
+def _profile() -> CareerProfile:
+    current = Role(title="Developer", company="Initech", started=date(2020, 1, 1))
+    return CareerProfile(
+        full_name="Ann Example",
+        roles=(current,),
+        facts=(
+            Fact(
+                text="Built the billing API in Python",
+                context_kind="role",
+                context_id=current.id,
+                skills=(Skill.of("Python"),),
+            ),
+        ),
+    )
+
+
+def _job_post() -> JobPost:
+    return JobPost(
+        company="Acme",
+        title="Backend Engineer",
+        requirements=(
+            Requirement(
+                text="Python", kind="skill", necessity="must_have", skill=Skill.of("Python")
+            ),
+            Requirement(text="Team player", kind="soft", necessity="must_have"),
+        ),
+    )
+
+
+def test_profile_record_without_null_properties() -> None:
+    role_id, fact_id = uuid4(), uuid4()
+    #what Neo4j hands back for a current role with no start date and an active fact
+    record = {
+        "id": str(uuid4()),
+        "full_name": "Ann Example",
+        "roles": [{"id": str(role_id), "title": "Developer", "company": "Initech", "ord": 0}],
+        "projects": [],
+        "facts": [
+            {
+                "id": str(fact_id),
+                "text": "Built the billing API",
+                "context_kind": "role",
+                "context_id": str(role_id),
+                "status": "active",
+                "source_document": "",
+                "source_excerpt": "",
+                "skills": [{"display_name": "Python", "canonical_name": "python"}],
+                "ord": 0,
+            }
+        ],
+    }
+
+    profile = _profile_from_record(record)
+
+    assert profile.roles[0].started is None and profile.roles[0].ended is None
+    assert profile.facts[0].superseded_by is None
+    assert profile.facts[0].skills == (Skill.of("Python"),)
+
+
+def test_job_post_record_without_null_properties() -> None:
+    record = {
+        "job_post": {"id": str(uuid4()), "company": "Acme", "title": "Engineer", "raw_text": ""},
+        "requirements": [
+            {
+                "id": str(uuid4()),
+                "text": "Team player",
+                "kind": "soft",
+                "necessity": "must_have",
+                "skill": None,
+                "ord": 0,
+            },
+        ],
+    }
+
+    job_post = _job_post_from_record(record)
+
+    assert job_post.requirements[0].year_required is None
+    assert job_post.requirements[0].skill is None
+
+
+@pytest.fixture
+async def neo4j(make_settings: MakeSettings) -> AsyncIterator[Neo4jRepository]:
+    """A repository on the server named by NEO4J_URI/NEO4J_PASSWORD, skipped if none answers."""
+
+    if "NEO4J_PASSWORD" not in os.environ:
+        pytest.skip("NEO4J_PASSWORD not set")
+    repo = neo4j_repository(
+        make_settings(
+            neo4j_uri=os.environ.get("NEO4J_URI", "bolt://localhost:7687"),
+            neo4j_user=os.environ.get("NEO4J_USER", "neo4j"),
+            neo4j_password=os.environ["NEO4J_PASSWORD"],
+        )
+    )
+    try:
+        await repo.driver.verify_connectivity()
+    except (ServiceUnavailable, Neo4jError, OSError) as exc:
+        await repo.close()
+        pytest.skip(f"no Neo4j server reachable: {exc}")
+    await repo.ensure_schema()
+    yield repo
+    await repo.close()
+
+
+async def test_neo4j_round_trip(neo4j: Neo4jRepository) -> None:
+    profile, job_post = _profile(), _job_post()
+
+    await neo4j.save_profiles([profile])
+    await neo4j.save_job_posts([job_post])
+
+    assert await neo4j.get_profile(profile.id) == profile
+    assert await neo4j.get_job_post(job_post.id) == job_post
+
+
+async def test_neo4j_result_without_its_profile_is_refused(neo4j: Neo4jRepository) -> None:
+    job_post = _job_post()
+    await neo4j.save_job_posts([job_post])
+    result = AnalysisResult(
+        profile_id=uuid4(),
+        job_post_id=job_post.id,
+        coverages=(Coverage(requirement_id=job_post.requirements[0].id, status="none"),),
+        decision="hold",
+        score=0.5,
+    )
+
+    with pytest.raises(ValueError, match="not saved"):
+        await neo4j.save_results([result])
+
+
+async def test_neo4j_skills_stored_under_old_names_are_merged(neo4j: Neo4jRepository) -> None:
+    job_post = JobPost(
+        company="Acme",
+        title="Platform Engineer",
+        requirements=(
+            Requirement(
+                text="k8s",
+                kind="skill",
+                necessity="must_have",
+                skill=Skill(display_name="k8s", canonical_name="k8s"),  # the pre-alias fold
+            ),
+        ),
+    )
+    await neo4j.save_job_posts([job_post])
+
+    assert await neo4j.recanonicalize_skills() >= 1
+
+    records, _, _ = await neo4j.driver.execute_query(
+        "MATCH (:Requirement {id: $id})-[:NAMES]->(s:Skill) RETURN s.canonical_name AS name",
+        id=str(job_post.requirements[0].id),
+    )
+    assert [r["name"] for r in records] == ["kubernetes"]
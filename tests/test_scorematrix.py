@@ -0,0 +1,119 @@
+import random
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from agenticresume.domain import scoring
+from agenticresume.domain.models import AnalysisResult, Coverage, JobPost, Requirement
+
+np = pytest.importorskip("numpy")
+
+from agenticresume.infra import scorematrix  # noqa: E402  # needs numpy
+from agenticresume.infra.scorematrix import ScoreMatrix  # noqa: E402
+
+JOB_POST = JobPost(
+    company="Acme",
+    title="Backend Engineer",
+    requirements=tuple(
+        Requirement(text=f"requirement {i}", kind="soft", necessity=necessity)
+        for i, necessity in enumerate(["must_have", "must_have", "nice_to_have", "nice_to_have"])
+    ),
+)
+
+
+def _pool(n: int, seed: int = 0) -> list[AnalysisResult]:
+    """Random screenings, some with requirements left without coverage."""
+
+    rng = random.Random(seed)
+    results = []
+    for _ in range(n):
+        coverages = []
+        for req in JOB_POST.requirements:
+            status = rng.choice(["none", "partial", "covered", "missing"])
+            if status != "missing":
+                evidence = () if status == "none" else (uuid4(),)
+                coverages.append(Coverage(requirement_id=req.id, status=status, evidence=evidence))
+        results.append(
+            AnalysisResult(
+                profile_id=uuid4(),
+                job_post_id=JOB_POST.id,
+                coverages=tuple(coverages),
+                decision="hold",
+                score=0.5,
+            )
+        )
+    return results
+
+
+def _expected(results: list[AnalysisResult]) -> tuple[list[float], list[int]]:
+    return (
+        [scoring.weighted_coverage(r.coverages, JOB_POST.requirements) for r in results],
+        [len(scoring.unmet_must_haves(r.coverages, JOB_POST.requirements)) for r in results],
+    )
+
+
+def test_scores_match_the_scalar_functions() -> None:
+    results = _pool(200)
+    matrix = ScoreMatrix.from_results(JOB_POST, results)
+
+    scores, unmet = _expected(results)
+    np.testing.assert_allclose(matrix.scores(), scores)
+    assert matrix.unmet_must_haves().tolist() == unmet
+
+
+def test_custom_weights_match_the_scalar_functions(monkeypatch: pytest.MonkeyPatch) -> None:
+    results = _pool(100)
+    status_weight = {"partial": 0.8}
+    necessity_weight = {"nice_to_have": 0.5}
+    for key, value in status_weight.items():
+        monkeypatch.setitem(scoring._STATUS_WEIGHT, key, value)
+    for key, value in necessity_weight.items():
+        monkeypatch.setitem(scoring._NECESSITY_WEIGHT, key, value)
+
+    scores, _ = _expected(results)
+    monkeypatch.undo()  # the matrix must apply the maps itself, over the defaults
+
+    matrix = ScoreMatrix.from_results(JOB_POST, results)
+    np.testing.assert_allclose(matrix.scores(status_weight, necessity_weight), scores)
+
+
+def test_an_empty_pool_scores_nothing() -> None:
+    matrix = ScoreMatrix.from_results(JOB_POST, [])
+
+    assert len(matrix) == 0
+    assert matrix.scores().shape == (0,)
+    assert matrix.unmet_must_haves().shape == (0,)
+    assert matrix.rank() == []
+
+
+def test_results_for_another_job_post_are_rejected() -> None:
+    (result,) = _pool(1)
+
+    with pytest.raises(ValueError, match="is for job post"):
+        ScoreMatrix.from_results(JOB_POST, [result.model_copy(update={"job_post_id": uuid4()})])
+
+
+def test_a_saved_matrix_scores_the_same_memory_mapped(tmp_path: Path) -> None:
+    results = _pool(50)
+    matrix = ScoreMatrix.from_results(JOB_POST, results)
+
+    matrix.save(tmp_path)
+    loaded = ScoreMatrix.load(tmp_path)
+
+    assert isinstance(loaded.status, np.memmap)
+    assert loaded.profile_ids == matrix.profile_ids
+    assert loaded.requirement_ids == matrix.requirement_ids
+    np.testing.assert_allclose(loaded.scores(), _expected(results)[0])
+    assert loaded.rank(max_unmet_must_haves=0) == matrix.rank(max_unmet_must_haves=0)
+
+
+def test_scoring_in_row_chunks_matches_one_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    results = _pool(23)
+    matrix = ScoreMatrix.from_results(JOB_POST, results)
+
+    monkeypatch.setattr(scorematrix, "_ROW_CHUNK", 5)  # 23 rows, a short last chunk
+
+    scores, unmet = _expected(results)
+    np.testing.assert_allclose(matrix.scores(), scores)
+    assert matrix.unmet_must_haves().tolist() == unmet
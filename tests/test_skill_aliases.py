@@ -0,0 +1,102 @@
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from agenticresume.domain import models
+from agenticresume.domain.models import (
+    CareerProfile,
+    Fact,
+    JobPost,
+    Requirement,
+    Role,
+    Skill,
+    _alias_table,
+    canonicalize,
+)
+from agenticresume.infra.skillindex import SkillIndex
+
+
+@pytest.fixture
+def alias_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """A scratch alias table in place of the shipped one, both caches reset around it."""
+
+    path = tmp_path / "skill_aliases.json"
+    monkeypatch.setattr(models, "_SKILL_ALIASES", path)
+    _alias_table.cache_clear()
+    canonicalize.cache_clear()
+    yield path
+    _alias_table.cache_clear()
+    canonicalize.cache_clear()
+
+
+def _write(path: Path, skills: dict[str, list[str]], version: int = 7) -> None:
+    path.write_text(json.dumps({"version": version, "skills": skills}))
+    _alias_table.cache_clear()
+    canonicalize.cache_clear()
+
+
+def test_aliases_canonicalize_to_their_skill() -> None:
+    assert canonicalize("k8s") == canonicalize("Kubernetes") == "kubernetes"
+    assert canonicalize(" Postgres ") == canonicalize("PostgreSQL")
+    assert Skill.of("psql") == Skill.of("PostgreSQL")
+    assert canonicalize("Some Unlisted Tool!") == "some unlisted tool"
+
+
+def test_canonicalize_is_idempotent_over_the_table() -> None:
+    _, table = _alias_table()
+
+    for name in (*table, *table.values()):
+        once = canonicalize(name)
+        assert canonicalize(once) == once
+
+
+def test_table_is_read_from_the_file(alias_file: Path) -> None:
+    _write(alias_file, {"Go": ["Golang"]})
+
+    assert models.skill_aliases_version() == 7
+    assert canonicalize("golang") == "go"
+
+
+def test_an_alias_of_two_skills_is_rejected(alias_file: Path) -> None:
+    _write(alias_file, {"Go": ["GL"], "GitLab": ["GL"]})
+
+    with pytest.raises(ValueError, match="maps to both"):
+        _alias_table()
+
+
+def test_a_canonical_name_listed_as_another_alias_is_rejected(alias_file: Path) -> None:
+    _write(alias_file, {"JavaScript": ["ECMAScript"], "ECMAScript": ["ES"]})
+
+    with pytest.raises(ValueError):
+        _alias_table()
+
+
+def test_a_new_alias_table_clears_the_skill_index_once(
+    alias_file: Path, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    _write(alias_file, {"Go": ["Golang"]})
+    role = Role(title="Developer", company="Initech")
+    fact = Fact(text="Wrote Go", context_kind="role", context_id=role.id, skills=(Skill.of("Go"),))
+    profile = CareerProfile(full_name="Ann Example", roles=(role,), facts=(fact,))
+    path = tmp_path / "skills.sqlite3"
+    SkillIndex(path).add([profile])
+
+    _write(alias_file, {"Go": ["Golang"], "Rust": []}, version=8)
+    with caplog.at_level(logging.WARNING):
+        index = SkillIndex(path)
+        SkillIndex(path)  # the new version is recorded, no second warning
+
+    job_post = JobPost(
+        company="Acme",
+        title="Engineer",
+        requirements=(
+            Requirement(text="Go", kind="skill", necessity="must_have", skill=Skill.of("Go")),
+        ),
+    )
+    assert index.shortlist(job_post, limit=10) == []
+    assert len([r for r in caplog.records if "skills index" in r.getMessage()]) == 1
+    index.add([profile])
+    assert len(index.shortlist(job_post, limit=10)) == 1
@@ -0,0 +1,117 @@
+from collections.abc import AsyncIterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from agenticresume.domain.models import CareerProfile, Fact, JobPost, Requirement, Role, Skill
+from agenticresume.domain.scoring import skill_coverage
+from agenticresume.infra.skillindex import SkillIndex
+
+
+def _profile(name: str, *skills: str, retired: tuple[str, ...] = ()) -> CareerProfile:
+    role = Role(title="Developer", company="Initech", started=date(2020, 1, 1))
+    facts = [
+        Fact(text=f"Used {s}", context_kind="role", context_id=role.id, skills=(Skill.of(s),))
+        for s in skills
+    ]
+    facts += [
+        Fact(
+            text=f"Once used {s}",
+            context_kind="role",
+            context_id=role.id,
+            skills=(Skill.of(s),),
+            status="superseded",
+            superseded_by=facts[0].id,
+        )
+        for s in retired
+    ]
+    return CareerProfile(full_name=name, roles=(role,), facts=tuple(facts))
+
+
+def _requirement(skill: str, necessity: str) -> Requirement:
+    return Requirement(text=skill, kind="skill", necessity=necessity, skill=Skill.of(skill))
+
+
+JOB_POST = JobPost(
+    company="Acme",
+    title="Backend Engineer",
+    requirements=(
+        _requirement("Python", "must_have"),
+        _requirement("Kubernetes", "must_have"),
+        _requirement("PostgreSQL", "nice_to_have"),
+        Requirement(text="Team player", kind="soft", necessity="must_have"),
+    ),
+)
+
+
+def _held(profile: CareerProfile) -> set[str]:
+    return {s.canonical_name for f in profile.active_facts for s in f.skills}
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> SkillIndex:
+    return SkillIndex(tmp_path / "skills.sqlite3")
+
+
+@pytest.fixture
+def pool() -> list[CareerProfile]:
+    return [
+        _profile("All", "Python", "k8s", "Postgres"),
+        _profile("Python only", "Python", "Go"),
+        _profile("Postgres only", "PostgreSQL"),
+        _profile("Retired", "Go", retired=("Python",)),
+        _profile("Unrelated", "Cobol"),
+    ]
+
+
+def test_shortlist_scores_like_skill_coverage(index: SkillIndex, pool: list[CareerProfile]) -> None:
+    assert index.add(pool) == len(pool)
+
+    shortlist = index.shortlist(JOB_POST, limit=10)
+
+    by_id = {p.id: p for p in pool}
+    assert [c.full_name for c in shortlist] == ["All", "Python only", "Postgres only"]
+    for candidate in shortlist:
+        profile = by_id[candidate.profile_id]
+        assert candidate.score == skill_coverage(JOB_POST.requirements, _held(profile))
+        assert set(candidate.matched) == _held(profile) & {"python", "kubernetes", "postgresql"}
+        assert set(candidate.evidence) <= {f.id for f in profile.active_facts}
+    assert index.shortlist(JOB_POST, limit=1)[0].full_name == "All"
+
+
+def test_re_adding_and_removing_update_the_scores(
+    index: SkillIndex, pool: list[CareerProfile]
+) -> None:
+    index.add(pool)
+    learned = Fact(
+        text="Ran Kubernetes",
+        context_kind="role",
+        context_id=pool[1].roles[0].id,
+        skills=(Skill.of("Kubernetes"),),
+    )
+    grown = pool[1].model_copy(update={"facts": (*pool[1].facts, learned)})
+
+    index.add([grown])
+    index.remove([pool[0].id])
+
+    (best, *_) = index.shortlist(JOB_POST, limit=10)
+    assert best.profile_id == grown.id
+    assert best.score == skill_coverage(JOB_POST.requirements, _held(grown))
+    assert pool[0].id not in {c.profile_id for c in index.shortlist(JOB_POST, limit=10)}
+
+
+async def test_build_with_prune_mirrors_the_source(
+    index: SkillIndex, pool: list[CareerProfile]
+) -> None:
+    index.add(pool)
+
+    async def stored() -> AsyncIterator[CareerProfile]:
+        for profile in pool[1:]:
+            yield profile
+
+    assert await index.build(stored(), chunk=2, prune=True) == len(pool) - 1
+    assert [c.full_name for c in index.shortlist(JOB_POST, limit=10)] == [
+        "Python only",
+        "Postgres only",
+    ]
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from agenticresume.infra.telemetry import Telemetry
+
+
+@pytest.fixture
+def telemetry() -> Telemetry:
+    return Telemetry(max_spans=10, prices={"acme/big": (1.0, 2.0)})
+
+
+def test_prometheus_exposition_keeps_large_counters_exact(telemetry: Telemetry) -> None:
+    with telemetry.node("auditor", "s1"):
+        with telemetry.llm_call("AuditorOutput", "acme", "big") as span:
+            span.input_tokens, span.output_tokens = 12_345_678, 1_000
+    with pytest.raises(ValueError), telemetry.node("judge", "s1"):
+        raise ValueError("boom")
+
+    lines = telemetry.prometheus().splitlines()
+
+    llm = 'provider="acme",model="big",schema="AuditorOutput"'
+    assert "# TYPE agenticresume_llm_tokens_total counter" in lines
+    assert f'agenticresume_llm_tokens_total{{{llm},direction="input"}} 12345678.0' in lines
+    assert f'agenticresume_llm_tokens_total{{{llm},direction="output"}} 1000.0' in lines
+    assert 'agenticresume_llm_cost_usd_total{provider="acme",model="big"} 12.347678' in lines
+    assert f"agenticresume_llm_call_seconds_count{{{llm}}} 1.0" in lines
+    assert 'agenticresume_node_seconds_count{node="auditor"} 1.0' in lines
+    assert 'agenticresume_errors_total{kind="node",name="judge"} 1.0' in lines
+
+
+def test_json_export_groups_spans_by_screening(telemetry: Telemetry) -> None:
+    with telemetry.node("extractor", "s1"):
+        with telemetry.llm_call("ExtractionOutput", "acme", "big") as span:
+            span.input_tokens = 10
+    with telemetry.node("extractor", "s2"):
+        pass
+
+    exported = json.loads(telemetry.to_json())
+
+    assert sorted(exported) == ["s1", "s2"]
+    assert [(s["kind"], s["name"]) for s in exported["s1"]] == [
+        ("llm", "ExtractionOutput"),
+        ("node", "extractor"),
+    ]
+    assert exported["s1"][0]["screening_id"] == "s1"  # the call inherits the node's screening
+    assert exported["s1"][0]["cost"] == pytest.approx(10 / 1e6)